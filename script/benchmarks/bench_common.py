@@ -0,0 +1,154 @@
+"""Shared helpers for the Octane Edge Tools benchmarks.
+
+Everything here runs inside Blender (``blender -b --python ...``). Scenes are
+built through the data API and the edge assets are replaced by minimal
+stand-ins, so no asset library is needed.
+"""
+
+import json
+import os
+import sys
+import time
+
+import bmesh
+import bpy
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+
+def script_args():
+    """Arguments after the ``--`` separator of the Blender command line."""
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+
+def clear_scene():
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.materials,
+                       bpy.data.node_groups, bpy.data.collections, bpy.data.lights,
+                       bpy.data.texts):
+        bpy.data.batch_remove(list(collection))
+
+
+def make_sphere_mesh(name, segments=16, rings=8):
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def sphere_resolution(vertices):
+    """(segments, rings) of a UV sphere with roughly this many vertices."""
+    rings = max(3, round((vertices / 2) ** 0.5))
+    return rings * 2, rings
+
+
+def make_materials(prefix, count):
+    materials = []
+    for i in range(count):
+        mat = bpy.data.materials.new(f"{prefix}_{i:02d}")
+        mat.use_nodes = True
+        materials.append(mat)
+    return materials
+
+
+def make_collection_chain(scene, depth):
+    """Nested collections Bench > Bench_L1 > ... with depth levels."""
+    root = bpy.data.collections.new("Bench")
+    scene.collection.children.link(root)
+    chain = [root]
+    for level in range(1, depth):
+        child = bpy.data.collections.new(f"Bench_L{level}")
+        chain[-1].children.link(child)
+        chain.append(child)
+    return chain
+
+
+def generate_scene(count, segments=16, rings=8, shared_mesh=False, vertex_groups=0,
+                   material_slots=0, shared_materials=True, collection_depth=1):
+    """Create count mesh objects under a 'Bench' collection and return them.
+
+    Objects are spread round-robin over collection_depth nested collections.
+    With shared_materials every object uses the same material_slots
+    materials, otherwise each object gets its own.
+    """
+    scene = bpy.context.scene
+    collections = make_collection_chain(scene, max(1, collection_depth))
+    base_mesh = make_sphere_mesh("BenchMesh", segments, rings)
+    shared = make_materials("BenchMat", material_slots) if shared_materials else None
+    for mat in shared or ():
+        base_mesh.materials.append(mat)
+
+    objects = []
+    for i in range(count):
+        if shared_mesh:
+            mesh = base_mesh
+        else:
+            mesh = base_mesh.copy()
+            if not shared_materials and material_slots:
+                mesh.materials.clear()
+                for mat in make_materials(f"BenchMat_{i:05d}", material_slots):
+                    mesh.materials.append(mat)
+        obj = bpy.data.objects.new(f"Bench_{i:05d}", mesh)
+        obj.location = (i % 100 * 3.0, i // 100 * 3.0, 0.0)
+        collections[i % len(collections)].objects.link(obj)
+        for g in range(vertex_groups):
+            obj.vertex_groups.new(name=f"Group_{g}").add(range(len(mesh.vertices)), 0.25, 'REPLACE')
+        objects.append(obj)
+    return objects
+
+
+def create_standin_edge_assets():
+    """Minimal GeoNodeTemplate/GeoEdgesTemplate/GeoEdges/Edge Material stand-ins."""
+    group = bpy.data.node_groups.new("GeoEdgesTemplate", 'GeometryNodeTree')
+    group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    group.nodes.new('NodeGroupInput')
+    group_output = group.nodes.new('NodeGroupOutput')
+    object_info = group.nodes.new('GeometryNodeObjectInfo')
+    group.links.new(object_info.outputs['Geometry'], group_output.inputs[0])
+
+    template = bpy.data.objects.new("GeoNodeTemplate", bpy.data.meshes.new("GeoNodeTemplate"))
+    template.modifiers.new("GeometryNodes", 'NODES').node_group = group
+
+    collection = bpy.data.collections.new("GeoEdges")
+    bpy.context.scene.collection.children.link(collection)
+    collection.objects.link(template)
+
+    bpy.data.materials.new("Edge Material")
+
+
+def select_only(objects):
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    if objects:
+        view_layer.objects.active = objects[-1]
+
+
+def peak_memory_mb():
+    """Peak resident set size of this process so far (Linux reports KiB)."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / 1048576
+    return peak / 1024
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def write_report(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    print(f"Report written to {path}")
@@ -0,0 +1,309 @@
+"""Time every operator of the Octane Edge Tools add-ons on generated scenes.
+
+    blender -b --factory-startup --python script/benchmarks/bench_operators.py -- \
+        --objects 100 1000 --vertices 500 --slots 3 --materials UNIQUE --depth 3 \
+        --output ops_bench.json --baseline ops_baseline.json
+
+Each case runs in its own background Blender, so its peak memory is its own
+and not the largest case so far. Preparation (e.g. running the setup before
+timing Remove Toon Edges) is not timed. Octane operators run against
+octane_stub when the real add-on is not loaded. With --baseline, cases more
+than --tolerance slower than the baseline are listed and the exit code is 1.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bpy
+
+import bench_common
+import octane_stub
+
+import copy_material_to_all_slots
+import octane_edge_groups
+import octane_edge_shader_kit
+import octane_toon_edge_suffix_manager
+import octane_toon_tolerance
+
+ADDONS = (
+    copy_material_to_all_slots,
+    octane_edge_groups,
+    octane_edge_shader_kit,
+    octane_toon_edge_suffix_manager,
+    octane_toon_tolerance,
+)
+
+
+def add_tolerance_nodes(materials):
+    """Give each material the two group nodes the tolerance operators look for."""
+    source_group = bpy.data.node_groups.new("ToleranceStub", 'ShaderNodeTree')
+    source_group.interface.new_socket(octane_toon_tolerance.SOURCE_SOCKET_NAME, in_out='OUTPUT',
+                                      socket_type='NodeSocketFloat')
+    target_group = bpy.data.node_groups.new("EdgeTracerStub", 'ShaderNodeTree')
+    target_group.interface.new_socket(octane_toon_tolerance.TARGET_SOCKET_NAME, in_out='INPUT',
+                                      socket_type='NodeSocketFloat')
+
+    for mat in materials:
+        mat.use_nodes = True
+        for group, name in ((source_group, octane_toon_tolerance.SOURCE_NODE_NAME),
+                            (target_group, octane_toon_tolerance.TARGET_NODE_NAME)):
+            node = mat.node_tree.nodes.new('ShaderNodeGroup')
+            node.node_tree = group
+            node.name = name
+
+
+def build_scene(args, count):
+    bench_common.clear_scene()
+    segments, rings = bench_common.sphere_resolution(args.vertices)
+    objects = bench_common.generate_scene(
+        count, segments, rings,
+        vertex_groups=args.vertex_groups,
+        material_slots=args.slots,
+        shared_materials=args.materials == "SHARED",
+        collection_depth=args.depth,
+    )
+    bench_common.create_standin_edge_assets()
+    octane_stub.create_standin_octane_assets()
+    bench_common.select_only(objects)
+    return objects
+
+
+# === CASES ===
+# Each case gets the generated objects and returns the callable to time.
+
+def case_setup_toon_edges(objects):
+    return bpy.ops.object.setup_toon_edges
+
+
+def case_set_thickness_on_selected(objects):
+    bpy.ops.object.setup_toon_edges()
+    bpy.context.scene.toon_edge_settings.outline_thickness_value += 0.25
+    bench_common.select_only(objects)
+    return bpy.ops.object.set_thickness_on_selected
+
+
+def case_remove_toon_edges(objects):
+    bpy.ops.object.setup_toon_edges()
+    bench_common.select_only(objects)
+    return bpy.ops.object.remove_toon_edges
+
+
+def case_collapse_edge_node_groups(objects):
+    bpy.context.scene.toon_edge_settings.share_edge_node_group = False
+    bpy.ops.object.setup_toon_edges()
+    return lambda: bpy.ops.object.collapse_edge_node_groups(measure_file_size=False)
+
+
+def case_apply_suffix_to_collection(objects):
+    props = bpy.context.scene.suffix_manager_props
+    props.target_collection = bpy.data.collections["Bench"]
+    props.suffix = "_Bench"
+    props.remove_suffix = False
+    return bpy.ops.object.apply_suffix_to_collection
+
+
+def case_revert_last_suffix(objects):
+    case_apply_suffix_to_collection(objects)()
+    return bpy.ops.object.revert_last_suffix
+
+
+def case_copy_active_to_all_slots_toon(objects):
+    objects[-1].active_material_index = 0
+    return bpy.ops.material.copy_active_to_all_slots_toon
+
+
+def case_add_all_edge_groups(objects):
+    return bpy.ops.object.add_all_edge_groups
+
+
+def _tolerance_materials():
+    return [mat for mat in bpy.data.materials if mat.name.startswith("BenchMat")]
+
+
+def case_connect_edge_nodes(objects):
+    add_tolerance_nodes(_tolerance_materials())
+    return bpy.ops.material.connect_edge_nodes
+
+
+def case_disconnect_edge_nodes(objects):
+    add_tolerance_nodes(_tolerance_materials())
+    bpy.ops.material.connect_edge_nodes()
+    return bpy.ops.material.disconnect_edge_nodes
+
+
+def case_assign_octane_nodes(objects):
+    return bpy.ops.object.assign_octane_nodes
+
+
+def case_add_toon_light(objects):
+    return bpy.ops.object.add_toon_light
+
+
+CASES = {
+    "setup_toon_edges": case_setup_toon_edges,
+    "set_thickness_on_selected": case_set_thickness_on_selected,
+    "remove_toon_edges": case_remove_toon_edges,
+    "collapse_edge_node_groups": case_collapse_edge_node_groups,
+    "apply_suffix_to_collection": case_apply_suffix_to_collection,
+    "revert_last_suffix": case_revert_last_suffix,
+    "copy_active_to_all_slots_toon": case_copy_active_to_all_slots_toon,
+    "add_all_edge_groups": case_add_all_edge_groups,
+    "connect_edge_nodes": case_connect_edge_nodes,
+    "disconnect_edge_nodes": case_disconnect_edge_nodes,
+    "assign_octane_nodes": case_assign_octane_nodes,
+    "add_toon_light": case_add_toon_light,
+}
+
+
+def run_case(args, name, count):
+    best = None
+    for _ in range(args.repeat):
+        objects = build_scene(args, count)
+        operator = CASES[name](objects)
+        bench_common.select_only(objects)
+        seconds, result = bench_common.timed(operator)
+        if 'FINISHED' not in result:
+            raise RuntimeError(f"{name} returned {result}")
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def run_child_case(args):
+    """--case mode: time one operator in this process and write its result."""
+    stubbed = octane_stub.register()
+    for addon in ADDONS:
+        addon.register()
+    seconds = run_case(args, args.case, args.case_objects)
+    with open(args.case_result, "w") as f:
+        json.dump({
+            "seconds": seconds,
+            "peak_rss_mb": bench_common.peak_memory_mb(),
+            "octane_stub": stubbed,
+        }, f)
+
+
+def run_case_in_subprocess(args, name, count):
+    command = [bpy.app.binary_path, "-b"]
+    if not args.user_prefs:
+        command.append("--factory-startup")
+    command += [
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__),
+        "--",
+        "--vertices", str(args.vertices),
+        "--slots", str(args.slots),
+        "--materials", args.materials,
+        "--depth", str(args.depth),
+        "--vertex-groups", str(args.vertex_groups),
+        "--repeat", str(args.repeat),
+        "--case", name,
+        "--case-objects", str(count),
+    ]
+    fd, result_path = tempfile.mkstemp(prefix="ops_bench_", suffix=".json")
+    os.close(fd)
+    try:
+        proc = subprocess.run(command + ["--case-result", result_path],
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+        if proc.returncode != 0:
+            print(proc.stdout)
+            raise RuntimeError(f"{name} with {count} objects failed (exit code {proc.returncode})")
+        with open(result_path) as f:
+            return json.load(f)
+    finally:
+        os.remove(result_path)
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """Return the cases slower than baseline * (1 + tolerance)."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    reference = {(r["operator"], r["objects"]): r["seconds"] for r in baseline.get("results", [])}
+
+    regressions = []
+    for result in results:
+        before = reference.get((result["operator"], result["objects"]))
+        if not before:
+            continue
+        result["baseline_seconds"] = before
+        result["ratio"] = round(result["seconds"] / before, 3)
+        if result["ratio"] > 1.0 + tolerance:
+            regressions.append(result)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--objects", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--vertices", type=int, default=500, help="Approximate vertices per object")
+    parser.add_argument("--slots", type=int, default=3, help="Material slots per object")
+    parser.add_argument("--materials", choices=["SHARED", "UNIQUE"], default="SHARED")
+    parser.add_argument("--depth", type=int, default=3, help="Nested collection levels")
+    parser.add_argument("--vertex-groups", type=int, default=0)
+    parser.add_argument("--operators", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case; the fastest is kept")
+    parser.add_argument("--baseline", default="", help="Earlier --output report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown, 0.2 = 20%%")
+    parser.add_argument("--output", default="")
+    parser.add_argument("--user-prefs", action="store_true",
+                        help="Start the case processes with user preferences (e.g. the real Octane add-on)")
+    parser.add_argument("--case", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--case-objects", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--case-result", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args(bench_common.script_args())
+
+    if args.case:
+        run_child_case(args)
+        return
+
+    results = []
+    stubbed = None
+    for count in args.objects:
+        for name in args.operators:
+            case = run_case_in_subprocess(args, name, count)
+            seconds, peak = case["seconds"], case["peak_rss_mb"]
+            stubbed = case["octane_stub"] if stubbed is None else stubbed
+            results.append({
+                "operator": name,
+                "objects": count,
+                "seconds": round(seconds, 4),
+                "peak_rss_mb": round(peak, 1),
+            })
+            print(f"{name:<32} {count:>6} objects: {seconds:8.3f} s  peak {peak:8.1f} MB")
+
+    report = {
+        "benchmark": "operators",
+        "blender": bpy.app.version_string,
+        "octane_stub": stubbed,
+        "scene": {
+            "vertices": args.vertices,
+            "slots": args.slots,
+            "materials": args.materials,
+            "depth": args.depth,
+            "vertex_groups": args.vertex_groups,
+        },
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        report["regressions"] = [f"{r['operator']}@{r['objects']}" for r in regressions]
+        for r in regressions:
+            print(f"🐢 {r['operator']} ({r['objects']} objects): {r['baseline_seconds']:.3f} s → "
+                  f"{r['seconds']:.3f} s ({r['ratio']:.2f}x)")
+        if not regressions:
+            print("✅ No regressions against the baseline.")
+
+    if args.output:
+        bench_common.write_report(args.output, report)
+    if regressions:
+        sys.exit(1)
+
+
+main()
@@ -0,0 +1,59 @@
+"""Throughput of Set Up Toon Edges: per-object operators vs bulk mode.
+
+    blender -b --factory-startup --python script/benchmarks/bench_setup_toon_edges.py -- \
+        --counts 1000 5000 10000 --modes OPERATOR BULK --output setup_bench.json
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bpy
+
+import bench_common
+import octane_edge_shader_kit
+
+
+def run(count, bulk, vertex_groups):
+    bench_common.clear_scene()
+    bench_common.create_standin_edge_assets()
+    objects = bench_common.generate_scene(count, vertex_groups=vertex_groups)
+    bench_common.select_only(objects)
+
+    props = bpy.context.scene.toon_edge_settings
+    props.bulk_mode = bulk
+    seconds, result = bench_common.timed(bpy.ops.object.setup_toon_edges)
+    if result != {'FINISHED'}:
+        raise RuntimeError(f"setup_toon_edges returned {result}")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--modes", nargs="+", choices=["OPERATOR", "BULK"], default=["OPERATOR", "BULK"])
+    parser.add_argument("--vertex-groups", type=int, default=2,
+                        help="Existing vertex groups per object, so EdgeThickness has to be moved to the top")
+    parser.add_argument("--output", default="")
+    args = parser.parse_args(bench_common.script_args())
+
+    octane_edge_shader_kit.register()
+    results = []
+    for count in args.counts:
+        for mode in args.modes:
+            seconds = run(count, mode == "BULK", args.vertex_groups)
+            results.append({
+                "objects": count,
+                "mode": mode,
+                "seconds": round(seconds, 3),
+                "objects_per_second": round(count / seconds, 1) if seconds else None,
+            })
+            print(f"{mode:>8} {count:>6} objects: {seconds:8.2f} s ({count / seconds:8.1f} obj/s)")
+
+    if args.output:
+        bench_common.write_report(args.output, {"benchmark": "setup_toon_edges", "results": results})
+
+
+main()
@@ -0,0 +1,90 @@
+"""Vertex group fill: index-list path vs the NumPy weight layer.
+
+    blender -b --factory-startup --python script/benchmarks/bench_vertex_group_fill.py -- \
+        --vertices 100000 1000000 --output vg_bench.json
+"""
+
+import argparse
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bmesh
+import bpy
+import numpy as np
+
+import bench_common
+from octane_edge_groups import EDGE_GROUPS, WEIGHT_LEVELS, write_vertex_group_weights
+
+
+def make_grid_object(vertex_count):
+    side = max(2, int(math.sqrt(vertex_count)))
+    mesh = bpy.data.meshes.new("GridMesh")
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=side, y_segments=side, size=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new("Grid", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def legacy_constant(obj):
+    for group_name, weight in EDGE_GROUPS.items():
+        vg = obj.vertex_groups.new(name=group_name)
+        all_verts = [v.index for v in obj.data.vertices]
+        vg.add(all_verts, weight, 'REPLACE')
+
+
+def layer_constant(obj):
+    for group_name, weight in EDGE_GROUPS.items():
+        write_vertex_group_weights(obj, group_name, weight)
+
+
+def legacy_per_vertex(obj, weights):
+    vg = obj.vertex_groups.new(name="EdgeThickness")
+    for index, weight in enumerate(weights.tolist()):
+        vg.add([index], weight, 'REPLACE')
+
+
+def layer_per_vertex(obj, weights):
+    write_vertex_group_weights(obj, "EdgeThickness", weights)
+
+
+def layer_per_vertex_quantised(obj, weights):
+    write_vertex_group_weights(obj, "EdgeThickness", weights, levels=WEIGHT_LEVELS)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--output", default="")
+    args = parser.parse_args(bench_common.script_args())
+
+    results = []
+    for vertex_count in args.vertices:
+        bench_common.clear_scene()
+        obj = make_grid_object(vertex_count)
+        count = len(obj.data.vertices)
+        weights = np.random.default_rng(0).random(count, dtype=np.float32)
+
+        cases = [
+            ("constant/index-list", legacy_constant, ()),
+            ("constant/layer", layer_constant, ()),
+            ("per-vertex/loop", legacy_per_vertex, (weights,)),
+            ("per-vertex/layer", layer_per_vertex, (weights,)),
+            ("per-vertex/quantised", layer_per_vertex_quantised, (weights,)),
+        ]
+        for name, func, extra in cases:
+            obj.vertex_groups.clear()
+            seconds, _ = bench_common.timed(func, obj, *extra)
+            results.append({"vertices": count, "case": name, "seconds": round(seconds, 4)})
+            print(f"{count:>9} verts  {name:<20} {seconds:8.3f} s")
+
+    if args.output:
+        bench_common.write_report(args.output, {"benchmark": "vertex_group_fill", "results": results})
+
+
+main()
@@ -0,0 +1,106 @@
+"""Edge group transfer: the transfer operator vs a Data Transfer modifier.
+
+    blender -b --factory-startup --python script/benchmarks/bench_weight_transfer.py -- \
+        --vertices 10000 100000 --targets 4 --output transfer_bench.json
+
+The reference is a UV sphere carrying every edge group with smooth per-vertex
+weights; the targets are displaced copies of it, so neither side can take the
+exact-copy shortcut.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bpy
+import numpy as np
+
+import bench_common
+import octane_edge_groups
+from octane_edge_groups import EDGE_GROUPS, read_vertex_positions, write_vertex_group_weights
+
+MODIFIER_MAPPING = {'NEAREST': 'NEAREST', 'BARYCENTRIC': 'POLYINTERP_NEAREST'}
+
+
+def make_reference(vertex_count):
+    segments, rings = bench_common.sphere_resolution(vertex_count)
+    reference = bpy.data.objects.new("Reference", bench_common.make_sphere_mesh("Reference", segments, rings))
+    bpy.context.scene.collection.objects.link(reference)
+    positions = read_vertex_positions(reference)
+    for offset, group_name in enumerate(EDGE_GROUPS):
+        weights = 0.5 + 0.5 * np.sin(positions[:, 0] * 3.0 + positions[:, 2] * 2.0 + offset)
+        write_vertex_group_weights(reference, group_name, weights.astype(np.float32))
+    return reference
+
+
+def make_targets(reference, count):
+    rng = np.random.default_rng(0)
+    targets = []
+    for i in range(count):
+        mesh = reference.data.copy()
+        mesh.name = f"Target_{i:02d}"
+        positions = read_vertex_positions(reference)
+        positions += rng.normal(scale=0.005, size=positions.shape).astype(np.float32)
+        mesh.vertices.foreach_set("co", positions.ravel())
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        targets.append(obj)
+    return targets
+
+
+def reset_targets(targets):
+    for obj in targets:
+        obj.vertex_groups.clear()
+
+
+def run_operator(reference, targets, method):
+    bench_common.select_only(targets + [reference])
+    bpy.ops.object.transfer_edge_groups(method=method, space='LOCAL')
+
+
+def run_modifier(reference, targets, method):
+    for obj in targets:
+        for group_name in EDGE_GROUPS:
+            obj.vertex_groups.new(name=group_name)
+        mod = obj.modifiers.new("EdgeTransfer", 'DATA_TRANSFER')
+        mod.object = reference
+        mod.use_vert_data = True
+        mod.data_types_verts = {'VGROUP_WEIGHTS'}
+        mod.vert_mapping = MODIFIER_MAPPING[method]
+        mod.layers_vgroup_select_src = 'ALL'
+        mod.layers_vgroup_select_dst = 'NAME'
+        with bpy.context.temp_override(object=obj, active_object=obj):
+            bpy.ops.object.modifier_apply(modifier=mod.name)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--targets", type=int, default=4)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args(bench_common.script_args())
+
+    octane_edge_groups.register()
+    results = []
+    for vertex_count in args.vertices:
+        bench_common.clear_scene()
+        reference = make_reference(vertex_count)
+        targets = make_targets(reference, args.targets)
+        count = len(reference.data.vertices)
+
+        for method in MODIFIER_MAPPING:
+            for name, func in (("operator", run_operator), ("modifier", run_modifier)):
+                reset_targets(targets)
+                seconds, _ = bench_common.timed(func, reference, targets, method)
+                case = f"{method.lower()}/{name}"
+                results.append({"vertices": count, "targets": len(targets), "case": case,
+                                "seconds": round(seconds, 4)})
+                print(f"{count:>9} verts  {case:<22} {seconds:8.3f} s")
+
+    if args.output:
+        bench_common.write_report(args.output, {"benchmark": "weight_transfer", "results": results})
+
+
+main()
@@ -0,0 +1,72 @@
+"""Stand-in for the parts of the Octane add-on the kit's operators touch.
+
+Registers scene.octane / view_layer.octane with the node graph pointers used
+by Assign AOV/Compositing, and the quick toon light operator. Only used when
+the real Octane add-on is not loaded, so the benchmarks run on a stock
+Blender build.
+"""
+
+import bpy
+
+KERNEL_NODE_NAME = "Path tracing kernel"
+KERNEL_INPUT_COUNT = 25
+
+
+class OctaneStubNodeGraph(bpy.types.PropertyGroup):
+    node_tree: bpy.props.PointerProperty(type=bpy.types.NodeTree)
+
+
+class OctaneStubViewLayer(bpy.types.PropertyGroup):
+    render_pass_style: bpy.props.StringProperty(default="RENDER_PASSES")
+    render_aov_node_graph_property: bpy.props.PointerProperty(type=OctaneStubNodeGraph)
+    composite_node_graph_property: bpy.props.PointerProperty(type=OctaneStubNodeGraph)
+
+
+class OctaneStubScene(bpy.types.PropertyGroup):
+    kernel_node_graph_property: bpy.props.PointerProperty(type=OctaneStubNodeGraph)
+
+
+class OCTANE_OT_quick_add_octane_toon_directional_light(bpy.types.Operator):
+    bl_idname = "octane.quick_add_octane_toon_directional_light"
+    bl_label = "Toon Directional Light (stub)"
+
+    def execute(self, context):
+        light = bpy.data.lights.new("ToonLight", 'SUN')
+        context.scene.collection.objects.link(bpy.data.objects.new("ToonLight", light))
+        return {'FINISHED'}
+
+
+classes = (
+    OctaneStubNodeGraph,
+    OctaneStubViewLayer,
+    OctaneStubScene,
+    OCTANE_OT_quick_add_octane_toon_directional_light,
+)
+
+
+def register():
+    """Register the stub unless the real Octane add-on is loaded. Returns True if registered."""
+    if hasattr(bpy.types.Scene, "octane"):
+        return False
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.octane = bpy.props.PointerProperty(type=OctaneStubScene)
+    bpy.types.ViewLayer.octane = bpy.props.PointerProperty(type=OctaneStubViewLayer)
+    return True
+
+
+def create_standin_octane_assets():
+    """AOV and compositor node groups plus a kernel tree whose kernel node has an alpha input."""
+    for name in ("Octane_Toon_AOVs", "Octane Toon Compositor"):
+        if name not in bpy.data.node_groups:
+            bpy.data.node_groups.new(name, 'ShaderNodeTree')
+
+    kernel_inputs = bpy.data.node_groups.new("KernelStub", 'ShaderNodeTree')
+    for i in range(KERNEL_INPUT_COUNT):
+        kernel_inputs.interface.new_socket(f"Input {i}", in_out='INPUT', socket_type='NodeSocketBool')
+
+    kernel_tree = bpy.data.node_groups.new("Octane Kernel", 'ShaderNodeTree')
+    node = kernel_tree.nodes.new('ShaderNodeGroup')
+    node.node_tree = kernel_inputs
+    node.name = KERNEL_NODE_NAME
+    bpy.context.scene.octane.kernel_node_graph_property.node_tree = kernel_tree
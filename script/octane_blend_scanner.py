@@ -0,0 +1,262 @@
+"""Read datablock names from a .blend file without Blender.
+
+Walks the file block headers (BHead) and the embedded SDNA to pull the ID
+names of collections, objects, materials and node groups. Plain, gzip and
+zstd compressed files are supported; zstd needs either Python 3.14's
+``compression.zstd`` or the ``zstandard`` package.
+
+No bpy import, so it is safe to call from a background thread and can be
+run against files outside Blender.
+"""
+
+import gzip
+import struct
+
+# ID block codes as written in the BHead, mapped to bpy.data category names.
+ID_CODES = {
+    b"GR\x00\x00": "collections",
+    b"OB\x00\x00": "objects",
+    b"MA\x00\x00": "materials",
+    b"NT\x00\x00": "node_groups",
+}
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# ID.flag bit for IDs owned by another ID (e.g. a material's node tree).
+LIB_EMBEDDED_DATA = 1 << 10
+
+# Enough of an ID block to reach ID.name on every supported version.
+ID_PREFIX_SIZE = 1024
+
+
+class BlendScanError(Exception):
+    pass
+
+
+def _open_blend(path):
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic[:2] == GZIP_MAGIC:
+        return gzip.open(path, "rb")
+    if magic == ZSTD_MAGIC:
+        try:
+            from compression import zstd
+            return zstd.open(path, "rb")
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise BlendScanError("zstd compressed .blend needs the 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+    return open(path, "rb")
+
+
+def _read(f, size):
+    try:
+        return f.read(size)
+    except (EOFError, OSError) as err:
+        # Truncated or damaged gzip/zstd stream
+        raise BlendScanError(f"Corrupt compressed data: {err}") from err
+
+
+def _read_exact(f, size):
+    data = _read(f, size)
+    if len(data) != size:
+        raise BlendScanError("Unexpected end of file")
+    return data
+
+
+def _skip(f, size):
+    while size > 0:
+        chunk = _read(f, min(size, 1 << 20))
+        if not chunk:
+            raise BlendScanError("Unexpected end of file")
+        size -= len(chunk)
+
+
+def _read_header(f):
+    head = _read_exact(f, 12)
+    if head[:7] != b"BLENDER":
+        raise BlendScanError("Not a .blend file")
+
+    if head[7:9].isdigit():
+        # Blender 5.0+ header: BLENDER17-01v0500
+        header_size = int(head[7:9])
+        head += _read_exact(f, header_size - 12)
+        if head[9:10] != b"-" or head[12:13] not in (b"v", b"V"):
+            raise BlendScanError("Unsupported .blend header")
+        endian = "<" if head[12:13] == b"v" else ">"
+        return {"pointer_size": 8, "endian": endian, "large_bhead": True}
+
+    pointer_size = {b"_": 4, b"-": 8}.get(head[7:8])
+    if pointer_size is None or head[8:9] not in (b"v", b"V"):
+        raise BlendScanError("Unsupported .blend header")
+    endian = "<" if head[8:9] == b"v" else ">"
+    return {"pointer_size": pointer_size, "endian": endian, "large_bhead": False}
+
+
+def _bhead_reader(header):
+    """Return (size, unpack) for the block headers of this file."""
+    e = header["endian"]
+    if header["large_bhead"]:
+        fmt = struct.Struct(e + "4siQqq")
+
+        def unpack(data):
+            code, sdna, _old, length, _nr = fmt.unpack(data)
+            return code, length, sdna
+    elif header["pointer_size"] == 8:
+        fmt = struct.Struct(e + "4siQii")
+
+        def unpack(data):
+            code, length, _old, sdna, _nr = fmt.unpack(data)
+            return code, length, sdna
+    else:
+        fmt = struct.Struct(e + "4siIii")
+
+        def unpack(data):
+            code, length, _old, sdna, _nr = fmt.unpack(data)
+            return code, length, sdna
+    return fmt.size, unpack
+
+
+def _parse_sdna(data, endian):
+    """Return (names, types, type_lengths, structs) from a DNA1 block."""
+    pos = 0
+
+    def expect(tag):
+        nonlocal pos
+        if data[pos:pos + 4] != tag:
+            raise BlendScanError(f"Malformed SDNA, expected {tag!r}")
+        pos += 4
+
+    def read_int():
+        nonlocal pos
+        value = struct.unpack_from(endian + "i", data, pos)[0]
+        pos += 4
+        return value
+
+    def read_strings(count):
+        nonlocal pos
+        items = []
+        for _ in range(count):
+            end = data.index(b"\x00", pos)
+            items.append(data[pos:end].decode("latin-1"))
+            pos = end + 1
+        return items
+
+    def align():
+        nonlocal pos
+        pos = (pos + 3) & ~3
+
+    expect(b"SDNA")
+    expect(b"NAME")
+    names = read_strings(read_int())
+    align()
+    expect(b"TYPE")
+    types = read_strings(read_int())
+    align()
+    expect(b"TLEN")
+    type_lengths = struct.unpack_from(endian + f"{len(types)}h", data, pos)
+    pos += 2 * len(types)
+    align()
+    expect(b"STRC")
+    structs = []
+    for _ in range(read_int()):
+        type_index, field_count = struct.unpack_from(endian + "hh", data, pos)
+        pos += 4
+        fields = struct.unpack_from(endian + f"{2 * field_count}h", data, pos)
+        pos += 4 * field_count
+        structs.append((type_index, list(zip(fields[0::2], fields[1::2]))))
+    return names, types, type_lengths, structs
+
+
+def _field_size(name, type_length, pointer_size):
+    count = 1
+    rest = name
+    while "[" in rest:
+        start = rest.index("[")
+        end = rest.index("]", start)
+        count *= int(rest[start + 1:end])
+        rest = rest[end + 1:]
+    if name.startswith("*") or name.startswith("(*"):
+        return pointer_size * count
+    return type_length * count
+
+
+def _id_layout(sdna, pointer_size):
+    """Return {"name": (offset, size), "flag": (offset, size)} for struct ID."""
+    names, types, type_lengths, structs = sdna
+    for type_index, fields in structs:
+        if types[type_index] != "ID":
+            continue
+        layout = {}
+        offset = 0
+        for field_type, field_name in fields:
+            name = names[field_name]
+            size = _field_size(name, type_lengths[field_type], pointer_size)
+            base = name.split("[", 1)[0]
+            if base in ("name", "flag"):
+                layout[base] = (offset, size)
+            offset += size
+        if "name" not in layout:
+            break
+        return layout
+    raise BlendScanError("SDNA has no usable ID struct")
+
+
+def read_blend_id_names(path):
+    """Return {category: sorted names} for the ID blocks in a .blend file.
+
+    Categories follow bpy.data naming: collections, objects, materials and
+    node_groups. Raises BlendScanError for unreadable or unsupported files.
+    """
+    blocks = []
+    sdna = None
+    with _open_blend(path) as f:
+        header = _read_header(f)
+        bhead_size, unpack = _bhead_reader(header)
+        while True:
+            code, length, _sdna_index = unpack(_read_exact(f, bhead_size))
+            if code == b"ENDB":
+                break
+            if length < 0:
+                raise BlendScanError("Corrupt block header")
+            if code == b"DNA1":
+                sdna = _parse_sdna(_read_exact(f, length), header["endian"])
+            elif code in ID_CODES:
+                prefix = _read_exact(f, min(length, ID_PREFIX_SIZE))
+                _skip(f, length - len(prefix))
+                blocks.append((ID_CODES[code], prefix))
+            else:
+                _skip(f, length)
+
+    if sdna is None:
+        raise BlendScanError("No SDNA block found")
+
+    layout = _id_layout(sdna, header["pointer_size"])
+    name_offset, name_size = layout["name"]
+    flag_format = None
+    if "flag" in layout and layout["flag"][1] in (2, 4):
+        flag_offset, flag_size = layout["flag"]
+        flag_format = header["endian"] + ("h" if flag_size == 2 else "i")
+
+    result = {category: [] for category in ID_CODES.values()}
+    for category, prefix in blocks:
+        if flag_format and len(prefix) >= flag_offset + flag_size:
+            flag = struct.unpack_from(flag_format, prefix, flag_offset)[0]
+            if flag & LIB_EMBEDDED_DATA:
+                continue
+        raw = prefix[name_offset:name_offset + name_size].split(b"\x00", 1)[0]
+        # ID names carry their two letter type code, e.g. "OBCube".
+        result[category].append(raw[2:].decode("utf-8", "replace"))
+    return {category: sorted(names) for category, names in result.items()}
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    for blend in sys.argv[1:]:
+        print(json.dumps({blend: read_blend_id_names(blend)}, indent=2))
@@ -17,6 +17,424 @@ EDGE_GROUPS = {
     "Traced_Edges_03": 0.0,
 }
 
+# Optional quantisation for computed weights: snapping to this many levels
+# lets a whole array be written with one vertex_group.add() call per distinct
+# value. Only applied when a caller asks for it.
+WEIGHT_LEVELS = 256
+
+
+def write_vertex_group_weights(obj, group_name, weights, levels=None, assigned=None):
+    """Fill a vertex group on every vertex from a constant or a per-vertex array.
+
+    Creates the group if needed and returns it. Arrays are read as one
+    contiguous float32 buffer and written with one add() call per distinct
+    value. With levels (e.g. WEIGHT_LEVELS) they are first clipped to [0, 1]
+    and rounded to that many steps, which is lossy but much faster for
+    continuous data. With an assigned boolean mask, only those vertices are
+    written and the others are removed from the group.
+    """
+    import numpy as np
+
+    vg = obj.vertex_groups.get(group_name)
+    if vg is None:
+        vg = obj.vertex_groups.new(name=group_name)
+
+    count = len(obj.data.vertices)
+    if np.ndim(weights) == 0:
+        vg.add(range(count), float(weights), 'REPLACE')
+        return vg
+
+    weights = np.ascontiguousarray(weights, dtype=np.float32)
+    if weights.shape != (count,):
+        raise ValueError(f"Expected {count} weights for '{obj.name}', got {weights.shape}")
+    if levels:
+        weights = np.round(np.clip(weights, 0.0, 1.0) * (levels - 1)) / (levels - 1)
+
+    vertices = np.arange(count)
+    if assigned is not None:
+        assigned = np.asarray(assigned, dtype=bool)
+        vg.remove(np.flatnonzero(~assigned).tolist())
+        vertices = np.flatnonzero(assigned)
+        weights = weights[vertices]
+
+    values, inverse = np.unique(weights, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    splits = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+    for value, indices in zip(values, np.split(order, splits)):
+        vg.add(vertices[indices].tolist(), float(value), 'REPLACE')
+    return vg
+
+
+def fill_vertex_groups(objects, group_weights, skip_existing=False, assigned=None, levels=None):
+    """Write {group name: weights} on each mesh object, once per mesh datablock.
+
+    Weights live on the mesh, so linked duplicates only need the group to
+    exist; the fill is skipped when the group sits at the same index as on
+    the object that already wrote it. With skip_existing, groups the object
+    already has are left untouched. assigned and levels optionally map group
+    names to the mask of vertices in the group and to the quantisation
+    passed to write_vertex_group_weights.
+    """
+    written = {}
+    for obj in objects:
+        for group_name, weights in group_weights.items():
+            vg = obj.vertex_groups.get(group_name)
+            if vg is None:
+                vg = obj.vertex_groups.new(name=group_name)
+            elif skip_existing:
+                continue
+            key = (obj.data, group_name)
+            if written.get(key) == vg.index:
+                continue
+            write_vertex_group_weights(obj, group_name, weights,
+                                       levels=levels.get(group_name) if levels else None,
+                                       assigned=assigned.get(group_name) if assigned else None)
+            written[key] = vg.index
+
+
+# === FEATURE CLASSIFICATION ===
+# Traced_Edges_01: edges sharper than the angle, and creased edges (by crease)
+# Traced_Edges_02: boundary and non-manifold edges
+# Traced_Edges_03: UV seams
+# Buffers are read on the main thread; the NumPy math runs in a thread pool,
+# since it releases the GIL, and the weights are written back on the main thread.
+
+def read_feature_buffers(mesh):
+    """Copy what classify_features() needs out of a mesh. Main thread only."""
+    import numpy as np
+
+    edge_count = len(mesh.edges)
+    face_count = len(mesh.polygons)
+    buffers = {"vertex_count": len(mesh.vertices)}
+
+    edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    buffers["edge_verts"] = edge_verts.reshape(edge_count, 2)
+
+    normals = np.empty(face_count * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    buffers["normals"] = normals.reshape(face_count, 3)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    buffers["loop_totals"] = loop_totals
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    buffers["loop_edges"] = loop_edges
+
+    crease = np.zeros(edge_count, dtype=np.float32)
+    attribute = mesh.attributes.get("crease_edge")
+    if attribute is not None:
+        attribute.data.foreach_get("value", crease)
+    elif edge_count and hasattr(mesh.edges[0], "crease"):
+        # Blender < 4.0
+        mesh.edges.foreach_get("crease", crease)
+    buffers["crease"] = crease
+
+    seams = np.zeros(edge_count, dtype=bool)
+    mesh.edges.foreach_get("use_seam", seams)
+    buffers["seams"] = seams
+    return buffers
+
+
+def classify_features(buffers, angle, use_crease=True, use_seams=True):
+    """Return {group name: per-vertex weights} from read_feature_buffers() output.
+
+    Pure NumPy, safe to run off the main thread.
+    """
+    import numpy as np
+
+    vertex_count = buffers["vertex_count"]
+    edge_verts = buffers["edge_verts"]
+    edge_count = len(edge_verts)
+    normals = buffers["normals"]
+    loop_edges = buffers["loop_edges"]
+
+    # Faces per edge, and for manifold edges the two faces that share it
+    face_counts = np.bincount(loop_edges, minlength=edge_count)
+    loop_faces = np.repeat(np.arange(len(normals), dtype=np.int32), buffers["loop_totals"])
+    order = np.argsort(loop_edges, kind='stable')
+    manifold = np.flatnonzero(face_counts == 2)
+    first = (np.cumsum(face_counts) - face_counts)[manifold]
+    face_a = loop_faces[order[first]]
+    face_b = loop_faces[order[first + 1]]
+
+    sharp = np.zeros(edge_count, dtype=bool)
+    dots = np.einsum('ij,ij->i', normals[face_a], normals[face_b])
+    sharp[manifold] = dots < np.cos(angle)
+
+    feature = sharp.astype(np.float32)
+    if use_crease:
+        feature = np.maximum(feature, buffers["crease"])
+
+    def vertex_weights(edge_weights):
+        weights = np.zeros(vertex_count, dtype=np.float32)
+        edges = np.flatnonzero(edge_weights)
+        np.maximum.at(weights, edge_verts[edges, 0], edge_weights[edges])
+        np.maximum.at(weights, edge_verts[edges, 1], edge_weights[edges])
+        return weights
+
+    seams = buffers["seams"] if use_seams else np.zeros(edge_count, dtype=bool)
+    return {
+        "Traced_Edges_01": vertex_weights(feature),
+        "Traced_Edges_02": vertex_weights((face_counts != 2).astype(np.float32)),
+        "Traced_Edges_03": vertex_weights(seams.astype(np.float32)),
+    }
+
+
+# === WEIGHT TRANSFER ===
+# The active object is the reference. Its weights and spatial index are built
+# once and reused for every target; targets with identical vertex positions
+# take the weights as they are. Lookups are batched: a uniform grid over the
+# reference vertices answers every nearest-vertex query with NumPy, and only
+# points with no reference vertex within one cell go through a KD-tree.
+# Interpolated transfers project each point onto the triangles around its
+# nearest reference vertex. Weights are only written on vertices the
+# reference has in the group. Copies and nearest-vertex transfers of groups
+# with few distinct weights are written exactly; interpolated ones, and
+# groups with more than WEIGHT_LEVELS distinct weights, are quantised so the
+# write stays at most WEIGHT_LEVELS add() calls per group.
+
+# Target points handled per block when projecting onto candidate triangles
+TRANSFER_CHUNK = 16384
+
+
+def read_vertex_positions(obj):
+    import numpy as np
+
+    positions = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", positions)
+    return positions.reshape(-1, 3)
+
+
+def transform_positions(positions, matrix):
+    import numpy as np
+
+    rotation = np.array(matrix.to_3x3(), dtype=np.float32)
+    return positions @ rotation.T + np.array(matrix.translation, dtype=np.float32)
+
+
+def read_vertex_group_weights(obj, group_names):
+    """Return ({name: per-vertex weights}, {name: assigned mask}) for the groups obj has.
+
+    Unassigned vertices read as 0.0.
+    """
+    import numpy as np
+
+    columns = {obj.vertex_groups[name].index: name for name in group_names if name in obj.vertex_groups}
+    count = len(obj.data.vertices)
+    weights = {name: np.zeros(count, dtype=np.float32) for name in columns.values()}
+    assigned = {name: np.zeros(count, dtype=bool) for name in columns.values()}
+    if not columns:
+        return weights, assigned
+    # Vertex group weights have no foreach access; one pass over the vertices
+    for vert in obj.data.vertices:
+        for element in vert.groups:
+            name = columns.get(element.group)
+            if name is not None:
+                weights[name][vert.index] = element.weight
+                assigned[name][vert.index] = True
+    return weights, assigned
+
+
+class VertexGrid:
+    """Uniform grid over a point set for batched nearest-point queries.
+
+    Any point within one cell of a query lies in the 27 surrounding cells, so
+    a hit closer than the cell size is the exact nearest point. Queries with
+    nothing that close are returned as -1.
+    """
+
+    def __init__(self, positions, cell_size):
+        import numpy as np
+
+        self.positions = positions
+        extent = float(np.ptp(positions, axis=0).max()) if len(positions) else 0.0
+        # Keep the packed cell keys well inside int64
+        self.cell = max(float(cell_size), extent / 1e5, 1e-6)
+        self.origin = positions.min(axis=0) - self.cell
+        cells = np.floor((positions - self.origin) / self.cell).astype(np.int64)
+        self.shape = cells.max(axis=0) + 2
+        keys = self._keys(cells)
+        self.order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.order]
+
+    def _keys(self, cells):
+        return (cells[:, 0] * self.shape[1] + cells[:, 1]) * self.shape[2] + cells[:, 2]
+
+    def nearest(self, points):
+        import itertools
+        import numpy as np
+
+        best = np.full(len(points), np.inf)
+        best_index = np.full(len(points), -1, dtype=np.int64)
+        cells = np.floor((points - self.origin) / self.cell).astype(np.int64)
+        for offset in itertools.product((-1, 0, 1), repeat=3):
+            neighbour = cells + np.array(offset)
+            query = np.flatnonzero(np.all((neighbour >= 0) & (neighbour < self.shape), axis=1))
+            keys = self._keys(neighbour[query])
+            start = np.searchsorted(self.sorted_keys, keys, 'left')
+            count = np.searchsorted(self.sorted_keys, keys, 'right') - start
+            # One vectorised pass per occupancy level of the visited cells
+            for j in range(int(count.max(initial=0))):
+                hit = count > j
+                q = query[hit]
+                candidate = self.order[start[hit] + j]
+                delta = self.positions[candidate] - points[q]
+                dist = np.einsum('ij,ij->i', delta, delta)
+                better = dist < best[q]
+                best[q[better]] = dist[better]
+                best_index[q[better]] = candidate[better]
+        best_index[best > self.cell ** 2] = -1
+        return best_index
+
+
+class TransferReference:
+    """Weights and lazily built spatial indexes of the reference mesh."""
+
+    def __init__(self, obj, group_names):
+        import numpy as np
+
+        self.obj = obj
+        self.positions = read_vertex_positions(obj)
+        self.weights, self.assigned = read_vertex_group_weights(obj, group_names)
+        self.distinct = {name: len(np.unique(values[self.assigned[name]])) for name, values in self.weights.items()}
+        self._grid = None
+        self._kdtree = None
+        self._triangles = None
+        self._incident = None
+
+    def grid(self):
+        if self._grid is None:
+            import numpy as np
+
+            mesh = self.obj.data
+            edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+            mesh.edges.foreach_get("vertices", edges)
+            edges = edges.reshape(-1, 2)
+            if len(edges):
+                lengths = np.linalg.norm(self.positions[edges[:, 0]] - self.positions[edges[:, 1]], axis=1)
+                cell = 2.0 * float(lengths.mean())
+            else:
+                cell = float(np.ptp(self.positions, axis=0).max()) / max(1.0, len(self.positions) ** (1 / 3))
+            self._grid = VertexGrid(self.positions, cell)
+        return self._grid
+
+    def kdtree(self):
+        if self._kdtree is None:
+            from mathutils.kdtree import KDTree
+
+            tree = KDTree(len(self.positions))
+            for index, co in enumerate(self.positions.tolist()):
+                tree.insert(co, index)
+            tree.balance()
+            self._kdtree = tree
+        return self._kdtree
+
+    def nearest_vertices(self, positions):
+        import numpy as np
+
+        nearest = self.grid().nearest(positions)
+        misses = np.flatnonzero(nearest < 0)
+        if len(misses):
+            tree = self.kdtree()
+            nearest[misses] = [tree.find(co)[1] for co in positions[misses].tolist()]
+        return nearest
+
+    def triangles(self):
+        """(triangles, incident): loop triangles and, per vertex, its triangles padded with -1."""
+        if self._triangles is None:
+            import numpy as np
+
+            mesh = self.obj.data
+            mesh.calc_loop_triangles()
+            triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", triangles)
+            triangles = triangles.reshape(-1, 3)
+
+            corner_vertices = triangles.ravel()
+            order = np.argsort(corner_vertices, kind='stable')
+            counts = np.bincount(corner_vertices, minlength=len(self.positions))
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            slot = np.arange(len(order)) - starts[corner_vertices[order]]
+            incident = np.full((len(self.positions), max(1, int(counts.max(initial=0)))), -1, dtype=np.int32)
+            incident[corner_vertices[order], slot] = order // 3
+            self._triangles, self._incident = triangles, incident
+        return self._triangles, self._incident
+
+    def interpolation(self, positions, nearest):
+        """(corners, barycentric weights) on the closest triangle around each nearest vertex."""
+        import numpy as np
+
+        triangles, incident = self.triangles()
+        corners = np.repeat(nearest[:, None], 3, axis=1)
+        bary = np.zeros((len(positions), 3), dtype=np.float32)
+        bary[:, 0] = 1.0
+        for start in range(0, len(positions), TRANSFER_CHUNK):
+            block = slice(start, start + TRANSFER_CHUNK)
+            candidates = incident[nearest[block]]
+            valid = candidates >= 0
+            tri = triangles[np.maximum(candidates, 0)]
+            points = np.repeat(positions[block], candidates.shape[1], axis=0)
+            weights = barycentric_weights(points, self.positions[tri.reshape(-1, 3)])
+            projected = np.einsum('ij,ijk->ik', weights, self.positions[tri.reshape(-1, 3)])
+            dist = np.einsum('ij,ij->i', points - projected, points - projected).reshape(candidates.shape)
+            dist[~valid] = np.inf
+            pick = np.argmin(dist, axis=1)
+            has_triangle = valid.any(axis=1)
+            rows = np.flatnonzero(has_triangle)
+            chosen = pick[rows] + rows * candidates.shape[1]
+            corners[block][rows] = tri.reshape(-1, 3)[chosen]
+            bary[block][rows] = weights[chosen]
+        return corners, bary
+
+    def transfer(self, positions, method):
+        """(weights, assigned masks, levels) per group for target positions in the reference's space."""
+        import numpy as np
+
+        if len(positions) == len(self.positions) and np.allclose(positions, self.positions, atol=1e-5):
+            return dict(self.weights), dict(self.assigned), {}
+
+        nearest = self.nearest_vertices(positions)
+        if method == 'BARYCENTRIC' and len(self.obj.data.polygons):
+            corners, bary = self.interpolation(positions, nearest)
+            # Unassigned corners count as 0.0; a vertex joins the group when any
+            # corner that contributes to it is assigned
+            weights = {name: np.einsum('ij,ij->i', values[corners], bary) for name, values in self.weights.items()}
+            assigned = {name: np.any(mask[corners] & (bary > 0.0), axis=1) for name, mask in self.assigned.items()}
+            return weights, assigned, {name: WEIGHT_LEVELS for name in weights}
+
+        weights = {name: values[nearest] for name, values in self.weights.items()}
+        assigned = {name: mask[nearest] for name, mask in self.assigned.items()}
+        levels = {name: WEIGHT_LEVELS for name, count in self.distinct.items() if count > WEIGHT_LEVELS}
+        return weights, assigned, levels
+
+
+def barycentric_weights(points, triangles):
+    """Barycentric coordinates of points (n, 3) in triangles (n, 3, 3).
+
+    Points outside a triangle are clamped to it: negative coordinates are
+    zeroed and the rest renormalised.
+    """
+    import numpy as np
+
+    a = triangles[:, 0]
+    v0 = triangles[:, 1] - a
+    v1 = triangles[:, 2] - a
+    v2 = points - a
+    d00 = np.einsum('ij,ij->i', v0, v0)
+    d01 = np.einsum('ij,ij->i', v0, v1)
+    d11 = np.einsum('ij,ij->i', v1, v1)
+    d20 = np.einsum('ij,ij->i', v2, v0)
+    d21 = np.einsum('ij,ij->i', v2, v1)
+    denom = d00 * d11 - d01 * d01
+    # Degenerate triangles fall back to their first corner
+    safe = np.where(np.abs(denom) > 1e-12, denom, 1.0)
+    v = np.where(np.abs(denom) > 1e-12, (d11 * d20 - d01 * d21) / safe, 0.0)
+    w = np.where(np.abs(denom) > 1e-12, (d00 * d21 - d01 * d20) / safe, 0.0)
+    bary = np.maximum(np.stack([1.0 - v - w, v, w], axis=1), 0.0)
+    total = bary.sum(axis=1, keepdims=True)
+    return np.where(total > 0.0, bary / np.where(total > 0.0, total, 1.0), np.array([1.0, 0.0, 0.0]))
+
 
 class AddVertexGroupOperator(bpy.types.Operator):
     """Add a Vertex Group with a specific name and weight"""
@@ -30,17 +448,14 @@ class AddVertexGroupOperator(bpy.types.Operator):
     def execute(self, context):
         initial_mode = context.object.mode
 
+        meshes = []
         for obj in context.selected_objects:
             if obj.type == 'MESH':
                 if obj.mode == 'EDIT':
                     bpy.ops.object.mode_set(mode='OBJECT')
+                meshes.append(obj)
 
-                vg = obj.vertex_groups.get(self.vertex_group_name)
-                if vg is None:
-                    vg = obj.vertex_groups.new(name=self.vertex_group_name)
-
-                all_verts = [v.index for v in obj.data.vertices]
-                vg.add(all_verts, self.default_weight, 'REPLACE')
+        fill_vertex_groups(meshes, {self.vertex_group_name: self.default_weight})
 
         if initial_mode == 'EDIT':
             bpy.ops.object.mode_set(mode='EDIT')
@@ -57,22 +472,150 @@ class AddAllEdgeGroupsOperator(bpy.types.Operator):
     def execute(self, context):
         initial_mode = context.object.mode
 
+        meshes = []
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                if obj.mode == 'EDIT':
+                    bpy.ops.object.mode_set(mode='OBJECT')
+                meshes.append(obj)
+
+        fill_vertex_groups(meshes, EDGE_GROUPS, skip_existing=True)
+
+        if initial_mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        return {'FINISHED'}
+
+
+class ClassifyTracedEdgesOperator(bpy.types.Operator):
+    """Weight Traced_Edges_01-03 from sharp/creased edges, boundaries and seams"""
+    bl_idname = "object.classify_traced_edges"
+    bl_label = "Classify Traced Edges"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    angle: bpy.props.FloatProperty(
+        name="Sharp Angle",
+        description="Edges whose faces meet at a larger angle go to Traced_Edges_01",
+        subtype='ANGLE',
+        default=0.523599,
+        min=0.0,
+        max=3.141593
+    )
+    use_crease: bpy.props.BoolProperty(
+        name="Use Creases",
+        description="Add creased edges to Traced_Edges_01, weighted by crease",
+        default=True
+    )
+    use_seams: bpy.props.BoolProperty(
+        name="Use Seams",
+        description="Put UV seams in Traced_Edges_03",
+        default=True
+    )
+
+    def execute(self, context):
+        import os
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        start = time.perf_counter()
+        initial_mode = context.object.mode if context.object else 'OBJECT'
+
+        objects_by_mesh = {}
         for obj in context.selected_objects:
             if obj.type == 'MESH':
                 if obj.mode == 'EDIT':
                     bpy.ops.object.mode_set(mode='OBJECT')
+                objects_by_mesh.setdefault(obj.data, []).append(obj)
+        if not objects_by_mesh:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        meshes = list(objects_by_mesh)
+        buffers = [read_feature_buffers(mesh) for mesh in meshes]
+        # Operator properties are RNA: read them here, the workers only get plain values
+        angle = float(self.angle)
+        use_crease = bool(self.use_crease)
+        use_seams = bool(self.use_seams)
+        with ThreadPoolExecutor(max_workers=min(len(meshes), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(
+                lambda b: classify_features(b, angle, use_crease, use_seams), buffers))
+
+        for mesh, group_weights in zip(meshes, results):
+            fill_vertex_groups(objects_by_mesh[mesh], group_weights)
+
+        if initial_mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        vertex_count = sum(b["vertex_count"] for b in buffers)
+        self.report({'INFO'}, f"Classified {vertex_count} vertices on {len(meshes)} mesh(es) "
+                              f"in {time.perf_counter() - start:.2f} s.")
+        return {'FINISHED'}
 
-                existing_groups = {vg.name for vg in obj.vertex_groups}
 
-                for group_name, weight in EDGE_GROUPS.items():
-                    if group_name not in existing_groups:
-                        vg = obj.vertex_groups.new(name=group_name)
-                        all_verts = [v.index for v in obj.data.vertices]
-                        vg.add(all_verts, weight, 'REPLACE')
+class TransferEdgeGroupsOperator(bpy.types.Operator):
+    """Copy the edge vertex groups from the active object to the other selected meshes"""
+    bl_idname = "object.transfer_edge_groups"
+    bl_label = "Transfer Edge Groups from Active"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    method: bpy.props.EnumProperty(
+        name="Method",
+        items=[
+            ('NEAREST', "Nearest Vertex", "Weight of the closest reference vertex"),
+            ('BARYCENTRIC', "Interpolated", "Weights interpolated on the closest reference triangle"),
+        ],
+        default='NEAREST'
+    )
+    space: bpy.props.EnumProperty(
+        name="Space",
+        items=[
+            ('LOCAL', "Local", "Match vertices in object space, for variants placed side by side"),
+            ('WORLD', "World", "Match vertices where they are in the scene"),
+        ],
+        default='LOCAL'
+    )
+
+    def execute(self, context):
+        import time
+
+        start = time.perf_counter()
+        reference_obj = context.object
+        if reference_obj is None or reference_obj.type != 'MESH':
+            self.report({'ERROR'}, "The active object must be the reference mesh.")
+            return {'CANCELLED'}
+        targets = [obj for obj in context.selected_objects if obj.type == 'MESH' and obj != reference_obj]
+        if not targets:
+            self.report({'WARNING'}, "Select the target meshes, then the reference last.")
+            return {'CANCELLED'}
+
+        initial_mode = reference_obj.mode
+        if initial_mode == 'EDIT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        reference = TransferReference(reference_obj, EDGE_GROUPS)
+        if not reference.weights:
+            if initial_mode == 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+            self.report({'ERROR'}, f"{reference_obj.name} has none of the edge vertex groups.")
+            return {'CANCELLED'}
+
+        # In local space the result only depends on the mesh, so shared meshes are done once
+        by_key = {}
+        for obj in targets:
+            by_key.setdefault(obj.data if self.space == 'LOCAL' else obj, []).append(obj)
+        to_reference = reference_obj.matrix_world.inverted()
+        for objects in by_key.values():
+            positions = read_vertex_positions(objects[0])
+            if self.space == 'WORLD':
+                positions = transform_positions(positions, to_reference @ objects[0].matrix_world)
+            weights, assigned, levels = reference.transfer(positions, self.method)
+            fill_vertex_groups(objects, weights, assigned=assigned, levels=levels)
 
         if initial_mode == 'EDIT':
             bpy.ops.object.mode_set(mode='EDIT')
 
+        self.report({'INFO'}, f"Transferred {len(reference.weights)} group(s) to {len(targets)} object(s) "
+                              f"in {time.perf_counter() - start:.2f} s.")
         return {'FINISHED'}
 
 
@@ -109,11 +652,15 @@ class OctaneEdgeToolsPanel(bpy.types.Panel):
 
         layout.separator()
         layout.operator("object.add_all_edge_groups", text="Add All Edge Groups", icon='GROUP_VERTEX')
+        layout.operator("object.classify_traced_edges", icon='EDGESEL')
+        layout.operator("object.transfer_edge_groups", icon='MOD_DATA_TRANSFER')
 
 
 def register():
     bpy.utils.register_class(AddVertexGroupOperator)
     bpy.utils.register_class(AddAllEdgeGroupsOperator)
+    bpy.utils.register_class(ClassifyTracedEdgesOperator)
+    bpy.utils.register_class(TransferEdgeGroupsOperator)
     bpy.utils.register_class(OctaneEdgeToolsPanel)
 
     bpy.types.Scene.edge_thickness_value = bpy.props.FloatProperty(
@@ -128,6 +675,8 @@ def register():
 def unregister():
     bpy.utils.unregister_class(AddVertexGroupOperator)
     bpy.utils.unregister_class(AddAllEdgeGroupsOperator)
+    bpy.utils.unregister_class(ClassifyTracedEdgesOperator)
+    bpy.utils.unregister_class(TransferEdgeGroupsOperator)
     bpy.utils.unregister_class(OctaneEdgeToolsPanel)
 
     del bpy.types.Scene.edge_thickness_value
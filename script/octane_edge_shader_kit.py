@@ -1,37 +1,250 @@
+import bpy
+import functools
+import logging
+import time
+from contextlib import contextmanager
+
+
 def update_asset_path(self, context):
     save_asset_path(self.asset_blend_path)
+    start_asset_scan(self.asset_blend_path)
 
 
-def ensure_edge_assets_are_present():
-    import bpy
+# === LOGGING ===
+# Warnings and errors only by default; per-object messages are DEBUG so large
+# selections do not spend their time writing to the console.
+log = logging.getLogger("octane_edge_tools")
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_log_handler)
+    log.propagate = False
+log.setLevel(logging.WARNING)
+
+LOG_LEVEL_ITEMS = [
+    ('WARNING', "Off", "Only warnings and errors"),
+    ('INFO', "Info", "One line per operator step"),
+    ('DEBUG', "Debug", "One line per object, driver and datablock"),
+]
+
+
+def update_log_level(self, context):
+    log.setLevel(getattr(logging, self.log_level))
+
+
+# === PROFILING ===
+# Operators decorated with @profiled record their total time and the time
+# spent in each profile_stage() block. The last runs are kept for the panel
+# and the JSON export.
+PROFILE_HISTORY = 20
+_profile = {"runs": [], "current": None}
+
+
+def new_profile_run(name):
+    return {"operator": name, "started": time.time(), "seconds": 0.0, "objects": 0, "stages": {}}
+
+
+@contextmanager
+def profile_run(run):
+    """Make run the current run and add the block's time to it.
+
+    Modal operators enter the same run once per timer tick.
+    """
+    previous = _profile["current"]
+    _profile["current"] = run
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        run["seconds"] += time.perf_counter() - start
+        _profile["current"] = previous
+
+
+def record_profile_run(run):
+    _profile["runs"].append(run)
+    del _profile["runs"][:-PROFILE_HISTORY]
+    log.info("⏱️ %s: %.3f s", run["operator"], run["seconds"])
+
+
+@contextmanager
+def profile_operator(name):
+    run = new_profile_run(name)
+    try:
+        with profile_run(run):
+            yield run
+    finally:
+        record_profile_run(run)
+
+
+@contextmanager
+def profile_stage(name):
+    """Add the time spent in the block to the current operator run, if any."""
+    run = _profile["current"]
+    if run is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stages = run["stages"]
+        stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+
+def profiled(execute):
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        with profile_operator(self.bl_label):
+            return execute(self, context)
+    return wrapper
+
+
+def last_profile_run():
+    return _profile["runs"][-1] if _profile["runs"] else None
+
+
+# === ASSET MANIFEST ===
+# Everything the kit pulls from the asset library, keyed by bpy.data category.
+# Loaders diff a manifest against bpy.data and open the library at most once.
+ASSET_LIBRARY_FILENAME = "Octane_Edge_Tools_Assets.blend"
+
+# Setup only needs the template object and its collection; GeoEdgesTemplate
+# comes along with the object's modifier and Edge Material stays optional.
+EDGE_ASSET_MANIFEST = {
+    "collections": ["GeoEdges"],
+    "objects": ["GeoNodeTemplate"],
+}
+
+COMPOSITING_ASSET_MANIFEST = {
+    "node_groups": ["Octane_Toon_AOVs", "Octane Toon Compositor"],
+}
+
+FULL_ASSET_MANIFEST = {
+    "collections": ["GeoEdges"],
+    "objects": ["GeoNodeTemplate"],
+    "node_groups": ["GeoEdgesTemplate", "Octane_Toon_AOVs", "Octane Toon Compositor"],
+    "materials": ["Edge Material", "Inverted Hull Edges"],
+}
+
+# In link mode only these categories get a library override, because the kit
+# edits them per file (objects are added to GeoEdges, drivers go on the
+# template object and Edge Material). Node groups stay purely linked.
+LINK_OVERRIDE_CATEGORIES = ("collections", "objects", "materials")
+
+
+def resolve_asset_blend_path(path):
+    """Return the asset .blend for a file or directory path, or None if it does not exist."""
     import os
 
-    scene = bpy.context.scene
-    input_path = bpy.path.abspath(scene.asset_blend_path)
+    input_path = bpy.path.abspath(path)
 
     # Support both file or directory
     if input_path.lower().endswith(".blend") and os.path.isfile(input_path):
-        blend_path = input_path
-    else:
-        blend_path = os.path.join(input_path, "Octane_Edge_Tools_Assets.blend")
+        return input_path
 
-    if not os.path.isfile(blend_path):
-        print(f"❌ Asset file not found: {blend_path}")
-        return False
+    blend_path = os.path.join(input_path, ASSET_LIBRARY_FILENAME)
+    if os.path.isfile(blend_path):
+        return blend_path
+    return None
 
-    collection_name = 'GeoEdges'
-    object_name = 'GeoNodeTemplate'
 
-    # Append collection if not already present
-    if collection_name not in bpy.data.collections:
-        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-            if collection_name in data_from.collections:
-                data_to.collections.append(collection_name)
-                print(f'✅ Collection {collection_name} appended.')
-            else:
-                print(f'❌ Collection {collection_name} not found in .blend.')
+def missing_manifest_entries(manifest):
+    """Return the subset of a manifest that is not present in bpy.data."""
+    missing = {}
+    for category, names in manifest.items():
+        existing = getattr(bpy.data, category)
+        absent = [name for name in names if name not in existing]
+        if absent:
+            missing[category] = absent
+    return missing
+
+
+def use_asset_link_mode():
+    props = getattr(bpy.context.scene, "toon_edge_settings", None)
+    return props is not None and props.asset_link_mode == 'LINK'
+
+
+def override_linked_assets(data_to):
+    """Create library overrides for freshly linked IDs the kit edits per file."""
+    for category in LINK_OVERRIDE_CATEGORIES:
+        for id_block in getattr(data_to, category, ()):
+            if id_block is None or id_block.library is None:
+                continue
+            try:
+                override = id_block.override_create(remove_original_references=True)
+                log.debug("🪄 Overridden %s: %s", category, override.name)
+            except Exception as e:
+                log.error("❌ Failed to override %s '%s'. Error: %s", category, id_block.name, e)
+
+
+def load_asset_manifest(manifest, blend_path=None, link=None):
+    """Append (or link) every missing manifest entry in a single library pass.
+
+    Returns the entries that are still missing afterwards, so an empty dict
+    means the manifest is fully satisfied.
+    """
+    missing = missing_manifest_entries(manifest)
+    if not missing:
+        return {}
+    if link is None:
+        link = use_asset_link_mode()
+
+    if blend_path is None:
+        blend_path = resolve_asset_blend_path(bpy.context.scene.asset_blend_path)
+    if blend_path is None:
+        log.error("❌ Asset file not found: %s", bpy.context.scene.asset_blend_path)
+        return missing
+
+    # Skip opening the library when the index says it cannot help.
+    index = lookup_asset_index(blend_path)
+    if index is not None:
+        loadable = {}
+        for category, names in missing.items():
+            available = set(index.get(category, ()))
+            for name in names:
+                if name not in available:
+                    log.error("❌ %s '%s' not found in .blend.", category, name)
+            names = [name for name in names if name in available]
+            if names:
+                loadable[category] = names
+        if not loadable:
+            return missing
+        missing = loadable
+
+    try:
+        with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
+            if index is None:
+                store_asset_index(blend_path, {
+                    category: list(getattr(data_from, category))
+                    for category in ASSET_INDEX_CATEGORIES
+                })
+            for category, names in missing.items():
+                available = set(getattr(data_from, category))
+                to_load = [name for name in names if name in available]
+                if to_load:
+                    setattr(data_to, category, to_load)
+                    log.info("📦 %s %s: %s", 'Linked' if link else 'Imported', category, to_load)
+                if index is None:
+                    for name in names:
+                        if name not in available:
+                            log.error("❌ %s '%s' not found in .blend.", category, name)
+        if link:
+            override_linked_assets(data_to)
+    except Exception as e:
+        log.error("❌ Failed to load assets from %s. Error: %s", blend_path, e)
 
-    coll = bpy.data.collections.get(collection_name)
+    remove_stray_scenes()
+    # Freshly loaded datablocks may bring drivers bound to another scene
+    invalidate_driver_index()
+    return missing_manifest_entries(manifest)
+
+
+def link_edge_collection():
+    """Make sure the GeoEdges collection is in the scene and holds the template object."""
+    scene = bpy.context.scene
+    coll = bpy.data.collections.get("GeoEdges")
+    if coll is None:
+        return
 
     # Check if collection is already linked to scene
     def is_collection_linked_recursively(parent, target):
@@ -39,500 +252,255 @@ def ensure_edge_assets_are_present():
             return True
         return any(is_collection_linked_recursively(child, target) for child in parent.children)
 
-    if coll and not is_collection_linked_recursively(bpy.context.scene.collection, coll):
-        bpy.context.scene.collection.children.link(coll)
-        print(f"📦 Collection '{collection_name}' linked to scene.")
+    if not is_collection_linked_recursively(scene.collection, coll):
+        scene.collection.children.link(coll)
+        log.info("📦 Collection '%s' linked to scene.", coll.name)
 
-    # Append object if missing
-    if object_name not in bpy.data.objects:
-        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-            if object_name in data_from.objects:
-                data_to.objects = [object_name]
-                print(f'✅ Object {object_name} appended.')
-    else:
-        print(f'ℹ️ Object {object_name} already exists. Skipping import.')
-
-    # Link object to collection
-    obj = bpy.data.objects.get(object_name)
-    if obj and coll and obj.name not in coll.objects:
+    obj = bpy.data.objects.get("GeoNodeTemplate")
+    if obj and obj.name not in coll.objects:
         coll.objects.link(obj)
-        print(f'🔗 Linked object {obj.name} to collection {collection_name}')
+        log.debug("🔗 Linked object %s to collection %s", obj.name, coll.name)
 
-    # === Cleanup: remove unused duplicated scenes (e.g. Scene.001, Scene.002, etc.)
+
+def remove_stray_scenes():
+    """Remove unused scenes dragged in by appends (e.g. Scene.001, Scene.002, etc.)."""
     current_scene = bpy.context.scene
     to_remove = [
         scene for scene in bpy.data.scenes
         if scene != current_scene and scene.users == 0 and scene.name.startswith("Scene")
     ]
     for scene in to_remove:
+        name = scene.name
         bpy.data.scenes.remove(scene)
-        print(f"🧹 Removed unused scene: {scene.name}")
+        log.info("🧹 Removed unused scene: %s", name)
 
-    # === Reassign drivers to current scene (after cleanup)
-    all_blocks = (
-        list(bpy.data.node_groups) +
-        list(bpy.data.materials) +
-        list(bpy.data.objects)
-    )
-    for datablock in all_blocks:
-        if datablock.animation_data:
-            for driver in datablock.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE' and target.id != current_scene:
-                            target.id = current_scene
-                            print(f"🔁 Driver in '{datablock.name}' reassigned to scene: {current_scene.name}")
 
-    return True
+# === WRITE IF CHANGED ===
+# Every write to a modifier input, socket or pointer tags the depsgraph and makes
+# Octane re-upload the data, even when the value is the same. Kit operators write
+# through these helpers so re-running a setup on a configured scene is cheap.
+_write_stats = {"written": 0, "skipped": 0}
 
 
+def reset_write_stats():
+    _write_stats["written"] = 0
+    _write_stats["skipped"] = 0
 
-import bpy
 
-def ensure_octane_edge_assets():
-    import bpy
-    import os
-    
-    # === CONFIGURATION ===
+def _same_value(current, value):
+    if isinstance(value, float) and isinstance(current, (int, float)):
+        # Float sockets are single precision
+        return abs(current - value) <= 1e-6 * max(1.0, abs(value))
+    try:
+        return current == value
+    except Exception:
+        return False
 
-    LIBRARY_PATH = bpy.path.abspath(bpy.bpy.context.scene.asset_blend_path)
-    if not LIBRARY_PATH or not os.path.exists(LIBRARY_PATH):
-        print("❌ Invalid asset path. Please set it in the addon preferences.")
-        return
-    
-    assets = {
-        "materials": ["Edge Material", "Inverted Hull Edges"],
-        "objects": ["GeoNodeTemplate"],
-        "node_groups": ["GeoEdgesTemplate"],
-        "node_trees": ["Octane_Toon_AOVs", "Octane Toon Compositor"]
-    }
-    
-    def append_from_library(path, category, names):
-        try:
-            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
-                existing = getattr(bpy.data, category)
-                to_load = [name for name in names if name not in existing]
-                if to_load:
-                    setattr(data_to, category, to_load)
-                    print(f"📦 Imported {category}: {to_load}")
-                else:
-                    print(f"✅ Already present: {category}")
-        except Exception as e:
-            print(f"❌ Failed to load category '{category}' from {path}. Error: {e}")
-
-
-    
-    # === ESECUZIONE DELL'IMPORT ===
-    append_from_library(LIBRARY_PATH, "materials", assets["materials"])
-    append_from_library(LIBRARY_PATH, "objects", assets["objects"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_groups"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_trees"])
-    
-    # === REMOVAL OF STRAY SCENES (e.g. Scene.001) ===
-    for scene in bpy.data.scenes:
-        if scene != bpy.context.scene and scene.name.startswith("Scene."):
-            bpy.data.scenes.remove(scene)
-    scene = bpy.context.scene
-    
-    # === DRIVER SETUP ===
-    def apply_driver(target, path, prop_name):
-        try:
-            target.driver_remove(path)
-        except:
-            pass
-        fcurve = target.driver_add(path)
-        driver = fcurve.driver
-        driver.type = 'AVERAGE'
-        var = driver.variables.new()
-        var.name = "var"
-        var.targets[0].id_type = 'SCENE'
-        var.targets[0].id = scene
-        var.targets[0].data_path = f'["{prop_name}"]'
-        driver.expression = "var"
-    
-    # === DRIVER sul materiale "Edge Material"
-    mat = bpy.data.materials.get("Edge Material")
-    if mat and mat.node_tree:
-        node = mat.node_tree.nodes.get("Multiply texture")
-        if node and node.inputs[1]:
-            apply_driver(node.inputs[1], "default_value", "Outline Thickness")
-            print("🎯 Driver set on Edge Material")
-    
-    # === DRIVER on the GeoNodeTemplate
-    geo_obj = bpy.data.objects.get("GeoNodeTemplate")
-    if geo_obj:
-        for mod in geo_obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group and mod.node_group.name == "GeoEdgesTemplate":
-                inputs = mod.node_group.interface.items_tree
-                for i, input_socket in enumerate(inputs):
-                    if input_socket.name == "Thickness":
-                        input_id = f"Input_{i}"
-                        geo_obj.modifiers[mod.name][input_id] = 1.0  # default init
-                        apply_driver(geo_obj, f'modifiers["{mod.name}"]["{input_id}"]', "Edge Thickness")
-                        print("🎯 Driver set on GeoNodeTemplate")
-    
-    print("✅ All assets imported and drivers applied.")
-    
-    
-    # === FIX: forza la scena corretta come target dei driver ===
-    def force_driver_scene_binding(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva.")
-    
-    force_driver_scene_binding("GeoEdgesTemplate")
-    
-    
-    # === FIX: also force the correct scene for the material's node group ===
-    def force_driver_scene_binding_for_material(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva (material).")
-    
-    force_driver_scene_binding_for_material("Edge Thickness Multiplier")
 
+def _count_write(changed):
+    _write_stats["written" if changed else "skipped"] += 1
+    return changed
 
 
-    def execute(self, context):
-        ensure_octane_edge_assets()
-        self.report({'INFO'}, "Edge Tools assets imported.")
-        return {'FINISHED'}
-        ensure_edge_assets_are_present()  # Ensure asset availability
+def set_if_changed(owner, key, value):
+    """owner[key] = value unless it already holds value. Returns True if written."""
+    if key in owner and _same_value(owner[key], value):
+        return _count_write(False)
+    owner[key] = value
+    return _count_write(True)
 
 
+def set_attr_if_changed(owner, attr, value):
+    """setattr(owner, attr, value) unless it already holds value. Returns True if written."""
+    if _same_value(getattr(owner, attr), value):
+        return _count_write(False)
+    setattr(owner, attr, value)
+    return _count_write(True)
 
-    # === CONFIGURATION ===
-    blend_path = os.path.join(bpy.path.abspath(bpy.context.scene.asset_blend_path), "Octane_Edge_Tools_Assets.blend")
-    LIBRARY_PATH = os.path.join(bpy.path.abspath(context.scene.asset_blend_path), "Octane_Edge_Tools_Assets.blend")
-    
-    assets = {
-        "materials": ["Edge Material", "Inverted Hull Edges"],
-        "objects": ["GeoNodeTemplate"],
-        "node_groups": ["GeoEdgesTemplate"],
-        "node_trees": ["Octane_Toon_AOVs", "Octane Toon Compositor"]
-    }
-    
-    # === FUNCTION: import a category from a blend file ===
-    def append_from_library(path, category, names):
-        try:
-            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
-                existing = getattr(bpy.data, category)
-                to_load = [name for name in names if name not in existing]
-                if to_load:
-                    setattr(data_to, category, to_load)
-                    print(f"📦 Imported {category}: {to_load}")
-                else:
-                    print(f"✅ Already present: {category}")
-        except Exception as e:
-            print(f"❌ Failed to load category '{category}' from {path}. Error: {e}")
-
-    
-    # === ESECUZIONE DELL'IMPORT ===
-    append_from_library(LIBRARY_PATH, "materials", assets["materials"])
-    append_from_library(LIBRARY_PATH, "objects", assets["objects"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_groups"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_trees"])
-    
-    # === REMOVAL OF STRAY SCENES (e.g. Scene.001) ===
-    for scene in bpy.data.scenes:
-        if scene != bpy.context.scene and scene.name.startswith("Scene."):
-            bpy.data.scenes.remove(scene)
-    scene = bpy.context.scene
-    
-    # === DRIVER SETUP ===
-    def apply_driver(target, path, prop_name):
-        try:
-            target.driver_remove(path)
-        except:
-            pass
-        fcurve = target.driver_add(path)
-        driver = fcurve.driver
-        driver.type = 'AVERAGE'
-        var = driver.variables.new()
-        var.name = "var"
-        var.targets[0].id_type = 'SCENE'
-        var.targets[0].id = scene
-        var.targets[0].data_path = f'["{prop_name}"]'
-        driver.expression = "var"
-    
-    # === DRIVER sul materiale "Edge Material"
-    mat = bpy.data.materials.get("Edge Material")
-    if mat and mat.node_tree:
-        node = mat.node_tree.nodes.get("Multiply texture")
-        if node and node.inputs[1]:
-            apply_driver(node.inputs[1], "default_value", "Outline Thickness")
-            print("🎯 Driver set on Edge Material")
-    
-    # === DRIVER on the GeoNodeTemplate
-    geo_obj = bpy.data.objects.get("GeoNodeTemplate")
-    if geo_obj:
-        for mod in geo_obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group and mod.node_group.name == "GeoEdgesTemplate":
-                inputs = mod.node_group.interface.items_tree
-                for i, input_socket in enumerate(inputs):
-                    if input_socket.name == "Thickness":
-                        input_id = f"Input_{i}"
-                        geo_obj.modifiers[mod.name][input_id] = 1.0  # default init
-                        apply_driver(geo_obj, f'modifiers["{mod.name}"]["{input_id}"]', "Edge Thickness")
-                        print("🎯 Driver set on GeoNodeTemplate")
-    
-    print("✅ All assets imported and drivers applied.")
-    
-    
-    # === FIX: forza la scena corretta come target dei driver ===
-    def force_driver_scene_binding(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva.")
-    
-    force_driver_scene_binding("GeoEdgesTemplate")
-    
-    
-    # === FIX: also force the correct scene for the material's node group ===
-    def force_driver_scene_binding_for_material(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva (material).")
-    
-    force_driver_scene_binding_for_material("Edge Thickness Multiplier")
-
-    # === CONFIGURATION ===
-    addon = bpy.context.preferences.addons.get(__name__)
-    prefs = addon.preferences
-    LIBRARY_PATH = os.path.join(bpy.path.abspath(bpy.context.scene.asset_blend_path), "Octane_Edge_Tools_Assets.blend")
-    
-    assets = {
-        "materials": ["Edge Material", "Inverted Hull Edges"],
-        "objects": ["GeoNodeTemplate"],
-        "node_groups": ["GeoEdgesTemplate"],
-        "node_trees": ["Octane_Toon_AOVs", "Octane Toon Compositor"]
-    }
-    
-    # === FUNCTION: import a category from a blend file ===
-    def append_from_library(path, category, names):
-        try:
-            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
-                existing = getattr(bpy.data, category)
-                to_load = [name for name in names if name not in existing]
-                if to_load:
-                    setattr(data_to, category, to_load)
-                    print(f"📦 Imported {category}: {to_load}")
-                else:
-                    print(f"✅ Already present: {category}")
-        except Exception as e:
-            print(f"❌ Failed to load category '{category}' from {path}. Error: {e}")
-
-    
-    # === ESECUZIONE DELL'IMPORT ===
-    append_from_library(LIBRARY_PATH, "materials", assets["materials"])
-    append_from_library(LIBRARY_PATH, "objects", assets["objects"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_groups"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_trees"])
-    
-    # === REMOVAL OF STRAY SCENES (e.g. Scene.001) ===
-    for scene in bpy.data.scenes:
-        if scene != bpy.context.scene and scene.name.startswith("Scene."):
-            bpy.data.scenes.remove(scene)
-    scene = bpy.context.scene
-    
-    # === DRIVER SETUP ===
-    def apply_driver(target, path, prop_name):
+
+def has_scene_driver(target, path, prop_name):
+    """True if target.path is already driven by prop_name on the current scene.
+
+    For an ID target path is already the full data path (as passed to
+    driver_add); for a struct inside an ID it is a property of that struct.
+    """
+    anim = target.id_data.animation_data
+    if anim is None:
+        return False
+    if isinstance(target, bpy.types.ID):
+        full_path = path
+    else:
         try:
-            target.driver_remove(path)
-        except:
-            pass
-        fcurve = target.driver_add(path)
-        driver = fcurve.driver
-        driver.type = 'AVERAGE'
-        var = driver.variables.new()
-        var.name = "var"
-        var.targets[0].id_type = 'SCENE'
-        var.targets[0].id = scene
-        var.targets[0].data_path = f'["{prop_name}"]'
-        driver.expression = "var"
-    
-    # === DRIVER sul materiale "Edge Material"
-    mat = bpy.data.materials.get("Edge Material")
-    if mat and mat.node_tree:
-        node = mat.node_tree.nodes.get("Multiply texture")
-        if node and node.inputs[1]:
-            apply_driver(node.inputs[1], "default_value", "Outline Thickness")
-            print("🎯 Driver set on Edge Material")
-    
-    # === DRIVER on the GeoNodeTemplate
-    geo_obj = bpy.data.objects.get("GeoNodeTemplate")
-    if geo_obj:
-        for mod in geo_obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group and mod.node_group.name == "GeoEdgesTemplate":
-                inputs = mod.node_group.interface.items_tree
-                for i, input_socket in enumerate(inputs):
-                    if input_socket.name == "Thickness":
-                        input_id = f"Input_{i}"
-                        geo_obj.modifiers[mod.name][input_id] = 1.0  # default init
-                        apply_driver(geo_obj, f'modifiers["{mod.name}"]["{input_id}"]', "Edge Thickness")
-                        print("🎯 Driver set on GeoNodeTemplate")
-    
-    print("✅ All assets imported and drivers applied.")
-    
-    
-    # === FIX: forza la scena corretta come target dei driver ===
-    def force_driver_scene_binding(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva.")
-    
-    force_driver_scene_binding("GeoEdgesTemplate")
-    
-    
-    # === FIX: also force the correct scene for the material's node group ===
-    def force_driver_scene_binding_for_material(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
+            full_path = target.path_from_id(path)
+        except (TypeError, ValueError):
+            return False
+    fcurve = anim.drivers.find(full_path)
+    if fcurve is None:
+        return False
+    driver = fcurve.driver
+    if driver.type != 'AVERAGE' or len(driver.variables) != 1:
+        return False
+    var_target = driver.variables[0].targets[0]
+    return (var_target.id_type == 'SCENE'
+            and var_target.id == bpy.context.scene
+            and var_target.data_path == f'["{prop_name}"]')
+
+
+# === DRIVER INDEX ===
+# Datablocks holding the drivers the kit creates or relies on, as
+# (bpy.data collection, name). Rebinding only visits these, never all of bpy.data.
+DRIVER_OWNERS = (
+    ("node_groups", "GeoEdgesTemplate"),
+    ("node_groups", "Edge Thickness Multiplier"),
+    ("materials", "Edge Material"),
+    ("objects", "GeoNodeTemplate"),
+)
+_ID_TYPE_COLLECTIONS = {'OBJECT': "objects", 'MATERIAL': "materials", 'NODETREE': "node_groups"}
+
+# "owners" is rebuilt lazily after a file load; "pending" holds owners indexed
+# since the last rebind; "scene" is the scene the drivers were last bound to.
+_driver_index = {"owners": None, "pending": set(), "scene": None}
+
+
+def invalidate_driver_index():
+    _driver_index["owners"] = None
+    _driver_index["pending"] = set()
+    _driver_index["scene"] = None
+
+
+def index_driver_owner(id_block):
+    key = (_ID_TYPE_COLLECTIONS[id_block.id_type], id_block.name)
+    if _driver_index["owners"] is not None:
+        _driver_index["owners"].add(key)
+    _driver_index["pending"].add(key)
+
+
+def _build_driver_index():
+    owners = set(DRIVER_OWNERS)
+    # Per-object copies of GeoEdgesTemplate carry its drivers along
+    edge_collection = bpy.data.collections.get("GeoEdges")
+    if edge_collection:
+        for obj in edge_collection.objects:
+            for mod in obj.modifiers:
+                if mod.type == 'NODES' and mod.node_group:
+                    owners.add(("node_groups", mod.node_group.name))
+    return owners
+
+
+def _owner_animation_data(category, name):
+    datablock = getattr(bpy.data, category).get(name)
+    if datablock is None:
+        return []
+    anims = [datablock.animation_data]
+    # Material drivers live on the embedded node tree
+    if category == "materials" and datablock.node_tree:
+        anims.append(datablock.node_tree.animation_data)
+    return [anim for anim in anims if anim]
+
+
+def rebind_drivers_to_scene(force=False):
+    """Point the SCENE targets of indexed drivers at the current scene.
+
+    Does nothing unless the active scene changed since the last call, new
+    owners were indexed, or force is set.
+    """
+    current_scene = bpy.context.scene
+    if _driver_index["owners"] is None:
+        _driver_index["owners"] = _build_driver_index()
+        force = True
+
+    if force or _driver_index["scene"] != current_scene.name:
+        owners = _driver_index["owners"]
+    else:
+        owners = _driver_index["pending"]
+
+    for category, name in owners:
+        for anim in _owner_animation_data(category, name):
+            for driver in anim.drivers:
                 for var in driver.driver.variables:
                     for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva (material).")
-    
-    force_driver_scene_binding_for_material("Edge Thickness Multiplier")
-
-
-# === AUTO-ASSET LOADER FOR EDGE TOOLS ===
-    # === CONFIGURATION ===
-    addon = bpy.context.preferences.addons.get(__name__)
-    prefs = addon.preferences
-    LIBRARY_PATH = os.path.join(bpy.path.abspath(bpy.context.scene.asset_blend_path), "Octane_Edge_Tools_Assets.blend")
-    
-    assets = {
-        "materials": ["Edge Material", "Inverted Hull Edges"],
-        "objects": ["GeoNodeTemplate"],
-        "node_groups": ["GeoEdgesTemplate"],
-        "node_trees": ["Octane_Toon_AOVs", "Octane Toon Compositor"]
-    }
-    
-    # === FUNCTION: import a category from a blend file ===
-    def append_from_library(path, category, names):
-        try:
-            with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
-                existing = getattr(bpy.data, category)
-                to_load = [name for name in names if name not in existing]
-                if to_load:
-                    setattr(data_to, category, to_load)
-                    print(f"📦 Imported {category}: {to_load}")
-                else:
-                    print(f"✅ Already present: {category}")
-        except Exception as e:
-            print(f"❌ Failed to load category '{category}' from {path}. Error: {e}")
-
-    
-    # === ESECUZIONE DELL'IMPORT ===
-    append_from_library(LIBRARY_PATH, "materials", assets["materials"])
-    append_from_library(LIBRARY_PATH, "objects", assets["objects"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_groups"])
-    append_from_library(LIBRARY_PATH, "node_groups", assets["node_trees"])
-    
-    # === REMOVAL OF STRAY SCENES (e.g. Scene.001) ===
-    for scene in bpy.data.scenes:
-        if scene != bpy.context.scene and scene.name.startswith("Scene."):
-            bpy.data.scenes.remove(scene)
+                        if target.id_type == 'SCENE' and target.id != current_scene:
+                            target.id = current_scene
+                            log.debug("🔁 Driver in '%s' reassigned to scene: %s", name, current_scene.name)
+
+    _driver_index["pending"] = set()
+    _driver_index["scene"] = current_scene.name
+
+
+def ensure_edge_assets_are_present():
+    missing = load_asset_manifest(EDGE_ASSET_MANIFEST)
+    link_edge_collection()
+    rebind_drivers_to_scene()
+
+    if missing:
+        log.error("❌ Missing edge assets: %s", missing)
+        return False
+    return True
+
+
+def apply_driver(target, path, prop_name, owner=None):
+    """Drive target.path from a scene property and index the driver's owner.
+
+    An equivalent driver is left alone. Returns True if the driver was (re)created.
+    """
+    index_driver_owner(owner if owner is not None else target.id_data)
+    if has_scene_driver(target, path, prop_name):
+        return _count_write(False)
+
     scene = bpy.context.scene
-    
-    # === DRIVER SETUP ===
-    def apply_driver(target, path, prop_name):
-        try:
-            target.driver_remove(path)
-        except:
-            pass
-        fcurve = target.driver_add(path)
-        driver = fcurve.driver
-        driver.type = 'AVERAGE'
-        var = driver.variables.new()
-        var.name = "var"
-        var.targets[0].id_type = 'SCENE'
-        var.targets[0].id = scene
-        var.targets[0].data_path = f'["{prop_name}"]'
-        driver.expression = "var"
-    
+    try:
+        target.driver_remove(path)
+    except:
+        pass
+    fcurve = target.driver_add(path)
+    driver = fcurve.driver
+    driver.type = 'AVERAGE'
+    var = driver.variables.new()
+    var.name = "var"
+    var.targets[0].id_type = 'SCENE'
+    var.targets[0].id = scene
+    var.targets[0].data_path = f'["{prop_name}"]'
+    driver.expression = "var"
+    return _count_write(True)
+
+
+def ensure_octane_edge_assets():
+    missing = load_asset_manifest(FULL_ASSET_MANIFEST)
+    if missing:
+        log.error("❌ Missing assets: %s", missing)
+    link_edge_collection()
+
     # === DRIVER sul materiale "Edge Material"
     mat = bpy.data.materials.get("Edge Material")
-    if mat and mat.node_tree:
+    if mat and mat.library is None and mat.node_tree:
         node = mat.node_tree.nodes.get("Multiply texture")
         if node and node.inputs[1]:
-            apply_driver(node.inputs[1], "default_value", "Outline Thickness")
-            print("🎯 Driver set on Edge Material")
-    
+            if apply_driver(node.inputs[1], "default_value", "Outline Thickness", owner=mat):
+                log.info("🎯 Driver set on Edge Material")
+
     # === DRIVER on the GeoNodeTemplate
     geo_obj = bpy.data.objects.get("GeoNodeTemplate")
-    if geo_obj:
+    if geo_obj and geo_obj.library is None:
         for mod in geo_obj.modifiers:
             if mod.type == 'NODES' and mod.node_group and mod.node_group.name == "GeoEdgesTemplate":
                 inputs = mod.node_group.interface.items_tree
                 for i, input_socket in enumerate(inputs):
                     if input_socket.name == "Thickness":
                         input_id = f"Input_{i}"
+                        path = f'modifiers["{mod.name}"]["{input_id}"]'
+                        if has_scene_driver(geo_obj, path, "Edge Thickness"):
+                            index_driver_owner(geo_obj)
+                            _count_write(False)
+                            continue
                         geo_obj.modifiers[mod.name][input_id] = 1.0  # default init
-                        apply_driver(geo_obj, f'modifiers["{mod.name}"]["{input_id}"]', "Edge Thickness")
-                        print("🎯 Driver set on GeoNodeTemplate")
-    
-    print("✅ All assets imported and drivers applied.")
-    
-    
-    # === FIX: forza la scena corretta come target dei driver ===
-    def force_driver_scene_binding(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva.")
-    
-    force_driver_scene_binding("GeoEdgesTemplate")
-    
-    
-    # === FIX: also force the correct scene for the material's node group ===
-    def force_driver_scene_binding_for_material(node_group_name):
-        node_group = bpy.data.node_groups.get(node_group_name)
-        if node_group and node_group.animation_data:
-            for driver in node_group.animation_data.drivers:
-                for var in driver.driver.variables:
-                    for target in var.targets:
-                        if target.id_type == 'SCENE':
-                            target.id = bpy.context.scene
-                            print(f"🔗 Driver in '{node_group_name}' ricollegato a scena attiva (material).")
-    
-    force_driver_scene_binding_for_material("Edge Thickness Multiplier")
-    
-    
-# === FINE BLOCCO AUTO-ASSET ===
+                        apply_driver(geo_obj, path, "Edge Thickness")
+                        log.info("🎯 Driver set on GeoNodeTemplate")
 
+    # === FIX: force the correct scene as driver target (GeoEdgesTemplate, Edge Thickness Multiplier)
+    rebind_drivers_to_scene()
+
+    log.info("✅ All assets imported and drivers applied.")
+    return not missing
 
 
 bl_info = {
@@ -548,14 +516,197 @@ bl_info = {
 import bpy
 import os
 
+
+# === SHARED EDGE NODE GROUP ===
+# One copy of GeoEdgesTemplate for every edge object; the source mesh is passed
+# through a modifier Object input instead of a per-object Object Info node.
+SHARED_EDGE_GROUP_NAME = "GeoEdgesShared_NG"
+SOURCE_OBJECT_SOCKET_NAME = "Source Object"
+
+
+def find_source_object_socket(group):
+    for item in group.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.name == SOURCE_OBJECT_SOCKET_NAME:
+            return item
+    return None
+
+
+def ensure_shared_edge_group(template_group):
+    """Return the shared edge node group, creating it from the template if needed."""
+    group = bpy.data.node_groups.get(SHARED_EDGE_GROUP_NAME)
+    if group is None:
+        group = template_group.copy()
+        group.name = SHARED_EDGE_GROUP_NAME
+        index_driver_owner(group)
+        log.info("🧩 Created shared edge node group: %s", group.name)
+
+    if find_source_object_socket(group) is None:
+        socket = group.interface.new_socket(SOURCE_OBJECT_SOCKET_NAME, in_out='INPUT', socket_type='NodeSocketObject')
+        group_input = next((n for n in group.nodes if n.type == 'GROUP_INPUT'), None)
+        if group_input is None:
+            group_input = group.nodes.new('NodeGroupInput')
+        object_info = next((n for n in group.nodes if n.type == 'OBJECT_INFO'), None)
+        if object_info:
+            output = next(o for o in group_input.outputs if o.identifier == socket.identifier)
+            group.links.new(output, object_info.inputs['Object'])
+            set_attr_if_changed(object_info.inputs['Object'], "default_value", None)
+    return group
+
+
+def assign_shared_edge_group(modifier, shared_group, source_obj):
+    set_attr_if_changed(modifier, "node_group", shared_group)
+    set_if_changed(modifier, find_source_object_socket(shared_group).identifier, source_obj)
+
+
+# === SOURCE <-> EDGE OBJECT LINKS ===
+# Each source mesh and its GeoEdges object point at each other through the
+# toon_edge_object / toon_edge_source properties, so renames never break the
+# link. Files made before the links existed are resolved through a reverse
+# index built lazily from the GeoEdges collection.
+_edge_index = {"by_source": None}
+
+
+def invalidate_edge_index():
+    _edge_index["by_source"] = None
+
+
+def link_edge_object(source_obj, edge_obj):
+    source_obj.toon_edge_object = edge_obj
+    edge_obj.toon_edge_source = source_obj
+    if _edge_index["by_source"] is not None:
+        _edge_index["by_source"][source_obj.as_pointer()] = edge_obj
+
+
+def unlink_edge_object(source_obj):
+    source_obj.toon_edge_object = None
+    if _edge_index["by_source"] is not None:
+        _edge_index["by_source"].pop(source_obj.as_pointer(), None)
+
+
+def edge_source_of(edge_obj):
+    """Return the source mesh of an edge object, from its link or its node setup."""
+    if edge_obj.toon_edge_source is not None:
+        return edge_obj.toon_edge_source
+    mod = edge_obj.modifiers.get("GeometryNodes")
+    if not mod or mod.type != 'NODES' or not mod.node_group:
+        return None
+    socket = find_source_object_socket(mod.node_group)
+    if socket is not None:
+        return mod.get(socket.identifier)
+    for node in mod.node_group.nodes:
+        if node.type == 'OBJECT_INFO':
+            return node.inputs['Object'].default_value
+    return None
+
+
+def _build_edge_index():
+    index = {}
+    edge_collection = bpy.data.collections.get("GeoEdges")
+    if edge_collection:
+        for edge_obj in edge_collection.objects:
+            source_obj = edge_source_of(edge_obj)
+            if source_obj is not None:
+                index[source_obj.as_pointer()] = edge_obj
+    return index
+
+
+def find_edge_object(obj):
+    """Return the GeoEdges object of a source mesh, or None."""
+    edge_obj = obj.toon_edge_object
+    # A duplicated source inherits the pointer, so it must point back
+    if edge_obj is not None and edge_obj.toon_edge_source == obj:
+        return edge_obj
+
+    if _edge_index["by_source"] is None:
+        _edge_index["by_source"] = _build_edge_index()
+    edge_obj = _edge_index["by_source"].get(obj.as_pointer())
+    if edge_obj is None:
+        return None
+    try:
+        # The address of a deleted source can be reused by a new object, so
+        # the hit only counts if the edge object still traces obj
+        valid = edge_source_of(edge_obj) == obj
+    except ReferenceError:
+        # Removed since the index was built
+        valid = False
+    if not valid:
+        del _edge_index["by_source"][obj.as_pointer()]
+        return None
+
+    link_edge_object(obj, edge_obj)
+    return edge_obj
+
+
+def saved_copy_size():
+    """Size in bytes of the current file as it would be saved right now."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        probe_path = os.path.join(tmp_dir, "size_probe.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=probe_path, copy=True, compress=False)
+        return os.path.getsize(probe_path)
+
+
+def remove_toon_edges_for_object(obj):
+    """Remove the edge object, modifier and EdgeThickness group of one mesh.
+
+    Returns True if an edge object was removed.
+    """
+    geo_obj = find_edge_object(obj)
+    removed = geo_obj is not None
+
+    # 1. Remove associated GeoEdges duplicate object
+    if geo_obj:
+        geo_name = geo_obj.name
+        unlink_edge_object(obj)
+        for coll in geo_obj.users_collection:
+            coll.objects.unlink(geo_obj)
+
+        geo_mod = geo_obj.modifiers.get("GeometryNodes")
+        if geo_mod and geo_mod.node_group:
+            ng = geo_mod.node_group
+            if ng.users == 1:
+                ng_name = ng.name
+                bpy.data.node_groups.remove(ng)
+                log.debug("🧹 Removed node group: %s", ng_name)
+
+        geo_mesh = geo_obj.data
+        bpy.data.objects.remove(geo_obj)
+        log.debug("🧹 Removed edge object: %s", geo_name)
+
+        # Older setups gave every edge object its own GeoEdges_<mesh> copy
+        if geo_mesh and geo_mesh.users == 0:
+            mesh_name = geo_mesh.name
+            bpy.data.meshes.remove(geo_mesh)
+            log.debug("🧹 Removed edge mesh: %s", mesh_name)
+    else:
+        log.warning("⚠️ Edge object for '%s' not found.", obj.name)
+
+    # 2. Remove only the "GeometryNodes" modifier
+    mod = obj.modifiers.get("GeometryNodes")
+    if mod and mod.type == 'NODES':
+        obj.modifiers.remove(mod)
+        log.debug("🧽 Removed 'GeometryNodes' modifier from: %s", obj.name)
+
+    # 3. Remove EdgeThickness vertex group
+    if "EdgeThickness" in obj.vertex_groups:
+        obj.vertex_groups.remove(obj.vertex_groups["EdgeThickness"])
+        log.debug("🧽 Removed vertex group 'EdgeThickness' from: %s", obj.name)
+
+    return removed
+
+
 class OBJECT_OT_remove_toon_edges(bpy.types.Operator):
     bl_idname = "object.remove_toon_edges"
     bl_label = "Remove Toon Edges"
     bl_description = "Remove associated GeoEdges objects and clean modifiers"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled
     def execute(self, context):
-        if not ensure_edge_assets_are_present():
+        with profile_stage("asset load"):
+            assets_present = ensure_edge_assets_are_present()
+        if not assets_present:
             self.report({'ERROR'}, "Missing assets.")
             return {'CANCELLED'}
 
@@ -563,43 +714,99 @@ class OBJECT_OT_remove_toon_edges(bpy.types.Operator):
         if not selected_meshes:
             self.report({'WARNING'}, "No mesh selected.")
             return {'CANCELLED'}
+        _profile["current"]["objects"] = len(selected_meshes)
 
         removed = 0
         for obj in selected_meshes:
-            geo_name = f"GeoEdges_{obj.name}"
-            geo_obj = bpy.data.objects.get(geo_name)
-
-            # 1. Remove associated GeoEdges duplicate object
-            if geo_obj:
-                for coll in geo_obj.users_collection:
-                    coll.objects.unlink(geo_obj)
-
-                geo_mod = geo_obj.modifiers.get("GeometryNodes")
-                if geo_mod and geo_mod.node_group:
-                    ng = geo_mod.node_group
-                    if ng.users == 1:
-                        ng_name = ng.name
-                        bpy.data.node_groups.remove(ng)
-                        print(f"🧹 Removed node group: {ng_name}")
-
-                bpy.data.objects.remove(geo_obj)
+            if remove_toon_edges_for_object(obj):
                 removed += 1
-                print(f"🧹 Removed edge object: {geo_name}")
-            else:
-                print(f"⚠️ Edge object '{geo_name}' not found.")
 
-            # 2. Remove only the "GeometryNodes" modifier
-            mod = obj.modifiers.get("GeometryNodes")
-            if mod and mod.type == 'NODES':
-                obj.modifiers.remove(mod)
-                print(f"🧽 Removed 'GeometryNodes' modifier from: {obj.name}")
+        self.report({'INFO'}, f"Toon Edges removed from {removed} object(s).")
+        return {'FINISHED'}
 
-            # 3. Remove EdgeThickness vertex group
-            if "EdgeThickness" in obj.vertex_groups:
-                obj.vertex_groups.remove(obj.vertex_groups["EdgeThickness"])
-                print(f"🧽 Removed vertex group 'EdgeThickness' from: {obj.name}")
 
-        self.report({'INFO'}, f"Toon Edges removed from {removed} object(s).")
+# === VIEWPORT PROXY ===
+# With proxy mode on, the GeometryNodes modifier of every GeoEdges object is
+# turned off in the viewport, so playback only draws the small template mesh.
+# Only show_viewport is touched: final renders evaluate modifiers by
+# show_render in their own depsgraph, so they always get the full edges and
+# nothing has to be restored around a render.
+_proxy_state = {"fps": {}}
+
+
+def edge_modifiers():
+    edge_collection = bpy.data.collections.get("GeoEdges")
+    if edge_collection is None:
+        return []
+    modifiers = []
+    for edge_obj in edge_collection.all_objects:
+        mod = edge_obj.modifiers.get("GeometryNodes")
+        if mod is not None and mod.type == 'NODES':
+            modifiers.append(mod)
+    return modifiers
+
+
+def apply_edge_viewport_proxy(enabled):
+    """Switch viewport evaluation of all edge modifiers in one pass. Returns the number changed."""
+    changed = 0
+    for mod in edge_modifiers():
+        if set_attr_if_changed(mod, "show_viewport", not enabled):
+            changed += 1
+    log.info("🪶 Viewport proxy %s on %d edge modifier(s)", "enabled" if enabled else "disabled", changed)
+    return changed
+
+
+def update_edge_viewport_proxy(self, context):
+    apply_edge_viewport_proxy(self.edge_viewport_proxy)
+
+
+def playback_fps(scene, frames):
+    """Frames per second of stepping through frames with scene.frame_set.
+
+    This measures scene evaluation, which is what the edge modifiers cost
+    during playback; viewport drawing is not included.
+    """
+    start_frame = scene.frame_current
+    first = scene.frame_start
+    last = max(scene.frame_end, first + 1)
+    frame_list = [first + i % (last - first + 1) for i in range(frames)]
+
+    scene.frame_set(frame_list[0])
+    start = time.perf_counter()
+    for frame in frame_list:
+        scene.frame_set(frame)
+    seconds = time.perf_counter() - start
+    scene.frame_set(start_frame)
+    return len(frame_list) / seconds if seconds > 0 else 0.0
+
+
+class OBJECT_OT_measure_edge_viewport_fps(bpy.types.Operator):
+    bl_idname = "object.measure_edge_viewport_fps"
+    bl_label = "Measure Playback FPS"
+    bl_description = "Step through the frame range with the viewport proxy off and on and report the frame rate of each"
+
+    frames: bpy.props.IntProperty(name="Frames", default=48, min=2, max=1000)
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.toon_edge_settings
+        if not edge_modifiers():
+            self.report({'WARNING'}, "No GeoEdges objects in this file.")
+            return {'CANCELLED'}
+
+        proxy_enabled = props.edge_viewport_proxy
+        fps = {}
+        try:
+            for mode, enabled in (("full", False), ("proxy", True)):
+                apply_edge_viewport_proxy(enabled)
+                fps[mode] = playback_fps(scene, self.frames)
+        finally:
+            apply_edge_viewport_proxy(proxy_enabled)
+
+        _proxy_state["fps"] = fps
+        speedup = fps["proxy"] / fps["full"] if fps["full"] else 0.0
+        log.info("🎞️ Playback: %.1f fps full, %.1f fps proxy", fps["full"], fps["proxy"])
+        self.report({'INFO'}, f"Full edges: {fps['full']:.1f} fps, proxy: {fps['proxy']:.1f} fps ({speedup:.1f}x)")
         return {'FINISHED'}
 
 
@@ -639,6 +846,37 @@ class ToonEdgeSettings(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0
     )
+    edge_thickness_mode: bpy.props.EnumProperty(
+        name="EdgeThickness Mode",
+        description="How EdgeThickness weights are generated",
+        items=[
+            ('CONSTANT', "Constant", "Same weight on every vertex"),
+            ('CURVATURE', "Curvature", "Thicker where the surface bends, on ridges and creases alike"),
+            ('CAVITY', "Cavity", "Thicker in creases and cavities")
+        ],
+        default='CONSTANT'
+    )
+    thickness_min: bpy.props.FloatProperty(
+        name="Min Weight",
+        description="EdgeThickness weight on flat areas",
+        default=0.2,
+        min=0.0,
+        max=1.0
+    )
+    thickness_max: bpy.props.FloatProperty(
+        name="Max Weight",
+        description="EdgeThickness weight on the most curved areas",
+        default=1.0,
+        min=0.0,
+        max=1.0
+    )
+    thickness_smoothing: bpy.props.IntProperty(
+        name="Smoothing",
+        description="Smoothing passes over neighbouring vertices",
+        default=2,
+        min=0,
+        max=50
+    )
     outline_thickness_value: bpy.props.FloatProperty(
         name="Outline Thickness",
         description="Value to set on the Geometry Node modifier's Thickness input",
@@ -646,6 +884,45 @@ class ToonEdgeSettings(bpy.types.PropertyGroup):
         min=0.0,
         max=20.0
     )
+    bulk_mode: bpy.props.BoolProperty(
+        name="Bulk Mode",
+        description="Set up edges through the data API instead of per-object operators (faster on large selections)",
+        default=False
+    )
+    share_edge_node_group: bpy.props.BoolProperty(
+        name="Share Edge Node Group",
+        description="Use one GeoEdges node group for all edge objects and pass the source object through the modifier",
+        default=False
+    )
+    asset_link_mode: bpy.props.EnumProperty(
+        name="Asset Mode",
+        description="How edge assets are brought in from the asset library",
+        items=[
+            ('APPEND', "Append", "Append a local copy of every asset into this file"),
+            ('LINK', "Link", "Link assets from the shared library, overriding only what is edited per file")
+        ],
+        default='APPEND'
+    )
+    checkpoint_save_interval: bpy.props.IntProperty(
+        name="Checkpoint Save Every",
+        description="Save the file after this many objects during setup so an interrupted run can resume (0 = never)",
+        default=0,
+        min=0
+    )
+    edge_viewport_proxy: bpy.props.BoolProperty(
+        name="Viewport Proxy",
+        description="Skip the edge geometry nodes in the viewport for faster playback. Renders always use the full edges",
+        default=False,
+        update=update_edge_viewport_proxy
+    )
+    show_profiling: bpy.props.BoolProperty(name="Show Profiling", default=False)
+    log_level: bpy.props.EnumProperty(
+        name="Console Log",
+        description="How much the toon edge tools print to the system console",
+        items=LOG_LEVEL_ITEMS,
+        default='WARNING',
+        update=update_log_level
+    )
     shading_mode: bpy.props.EnumProperty(
         name="Shading Mode",
         description="Choose shading type for selected objects",
@@ -656,117 +933,644 @@ class ToonEdgeSettings(bpy.types.PropertyGroup):
         ],
         default='AUTO_SMOOTH'
     )
+    auto_smooth_angle: bpy.props.FloatProperty(
+        name="Auto Smooth Angle",
+        description="Edges whose faces meet at a larger angle are shaded sharp",
+        subtype='ANGLE',
+        default=0.523599,
+        min=0.0,
+        max=3.141593
+    )
 
-class OBJECT_OT_setup_toon_edges(bpy.types.Operator):
-    bl_idname = "object.setup_toon_edges"
-    bl_label = "Set Up Toon Edges"
-    bl_description = "Set up toon edge tracing with Geometry Nodes"
-    bl_options = {'REGISTER', 'UNDO'}
+# === PER-OBJECT EDGE SETUP ===
+EDGE_VERTEX_GROUP_NAME = "EdgeThickness"
 
-    def execute(self, context):
 
-        # ✅ Step 1: Controlla presenza asset file
-        if not ensure_edge_assets_are_present():
-            self.report({'ERROR'}, "Asset blend file not found or missing required data. Check Add-on Preferences.")
-            return {'CANCELLED'}
-        
-        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        if not selected_meshes:
-            self.report({'WARNING'}, 'No mesh objects selected.')
-            return {'CANCELLED'}
+def move_vertex_group_to_top(obj, vg, bulk=False):
+    """Make vg the first vertex group, keeping the others in order.
 
-        props = context.scene.toon_edge_settings
-        VERTEX_GROUP_NAME = "EdgeThickness"
-        EDGE_MAT_NAME = "Edge Material"
-        TEMPLATE_OBJ_NAME = "GeoNodeTemplate"
-        TEMPLATE_GROUP_NAME = "GeoEdgesTemplate"
-        TARGET_COLLECTION_NAME = "GeoEdges"
+    Only runs when vg is not already first; bulk reruns refill EdgeThickness
+    in place, so in practice this happens once, when the group is created.
+    The default path uses vertex_group_move. Bulk mode stays operator-free:
+    the other groups are snapshot in one pass over the vertices, removed and
+    re-created after vg with their name and lock_weight (every writable
+    VertexGroup property) and their weights written back with one add() call
+    per distinct value.
+    """
+    if vg.index == 0:
+        return
+    if not bulk:
+        obj.vertex_groups.active_index = vg.index
+        if hasattr(bpy.context, "temp_override"):
+            with bpy.context.temp_override(object=obj, active_object=obj):
+                while obj.vertex_groups.active_index > 0:
+                    bpy.ops.object.vertex_group_move(direction='UP')
+            return
+        # vertex_group_move acts on the active object
+        bpy.context.view_layer.objects.active = obj
+        while obj.vertex_groups.active_index > 0:
+            bpy.ops.object.vertex_group_move(direction='UP')
+        return
 
-        ensure_edge_assets_are_present()  # Ensure asset availability
+    others = [group for group in obj.vertex_groups if group != vg]
+    buckets = {group.index: {} for group in others}
+    for vert in obj.data.vertices:
+        for elem in vert.groups:
+            bucket = buckets.get(elem.group)
+            if bucket is not None:
+                bucket.setdefault(elem.weight, []).append(vert.index)
+    specs = [(group.name, group.lock_weight, buckets[group.index]) for group in others]
+
+    for group in others:
+        obj.vertex_groups.remove(group)
+    for name, lock_weight, weights in specs:
+        group = obj.vertex_groups.new(name=name)
+        for weight, indices in weights.items():
+            group.add(indices, weight, 'REPLACE')
+        group.lock_weight = lock_weight
+    obj.vertex_groups.active_index = 0
+
+
+# Same writer as octane_edge_groups.write_vertex_group_weights. Kept here so
+# this add-on can be enabled without the Octane Edge Tools add-on.
+WEIGHT_LEVELS = 256
+
+
+def write_vertex_group_weights(obj, group_name, weights, levels=None):
+    """Fill a vertex group from a constant or a per-vertex NumPy array.
+
+    Creates the group if needed and returns it. Arrays are written with one
+    add() call per distinct value; with levels they are first clipped to
+    [0, 1] and rounded to that many steps (lossy, for continuous data).
+    """
+    import numpy as np
+
+    vg = obj.vertex_groups.get(group_name)
+    if vg is None:
+        vg = obj.vertex_groups.new(name=group_name)
+
+    count = len(obj.data.vertices)
+    if np.ndim(weights) == 0:
+        vg.add(range(count), float(weights), 'REPLACE')
+        return vg
+
+    weights = np.ascontiguousarray(weights, dtype=np.float32)
+    if weights.shape != (count,):
+        raise ValueError(f"Expected {count} weights for '{obj.name}', got {weights.shape}")
+    if levels:
+        weights = np.round(np.clip(weights, 0.0, 1.0) * (levels - 1)) / (levels - 1)
+    values, inverse = np.unique(weights, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    splits = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+    for value, indices in zip(values, np.split(order, splits)):
+        vg.add(indices.tolist(), float(value), 'REPLACE')
+    return vg
+
+
+# === PROCEDURAL EDGE THICKNESS ===
+# CURVATURE and CAVITY modes derive EdgeThickness per vertex. For each edge the
+# neighbour's elevation above the vertex tangent plane (dot(normal, d) / |d|)
+# is averaged per vertex with bincount: positive in creases, negative on
+# ridges. The signal is smoothed over the edge adjacency, normalised between
+# its 2nd and 98th percentile and remapped to [min, max].
+THICKNESS_KEY_PROP = "toon_edge_thickness_key"
+THICKNESS_CACHE_SIZE = 16
+
+# geometry key -> normalised signal, so changing min/max skips the math
+_thickness_cache = {}
+
+
+def read_thickness_geometry(mesh):
+    import numpy as np
+
+    vertex_count = len(mesh.vertices)
+    positions = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    normals = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("normal", normals)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    # Face winding drives the vertex normals, so it is part of the geometry
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    return positions.reshape(-1, 3), normals.reshape(-1, 3), edges.reshape(-1, 2), loop_totals, loop_vertices
+
+
+def thickness_geometry_key(positions, edges, loop_totals, loop_vertices, mode, iterations):
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (positions, edges, loop_totals, loop_vertices):
+        digest.update(array.tobytes())
+    digest.update(f"{mode}:{iterations}".encode("ascii"))
+    return digest.hexdigest()
+
+
+def surface_signal(positions, normals, edges, mode, iterations):
+    """Per-vertex curvature or cavity in [0, 1], from contiguous arrays."""
+    import numpy as np
+
+    vertex_count = len(positions)
+    v0 = edges[:, 0]
+    v1 = edges[:, 1]
+    delta = positions[v1] - positions[v0]
+    length = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+    length[length == 0.0] = 1.0
+    rise0 = np.einsum('ij,ij->i', normals[v0], delta) / length
+    rise1 = -np.einsum('ij,ij->i', normals[v1], delta) / length
+
+    degree = np.bincount(v0, minlength=vertex_count) + np.bincount(v1, minlength=vertex_count)
+    degree = np.maximum(degree, 1).astype(np.float32)
+    signal = (np.bincount(v0, rise0, vertex_count) + np.bincount(v1, rise1, vertex_count)) / degree
+    signal = np.abs(signal) if mode == 'CURVATURE' else np.maximum(signal, 0.0)
+
+    for _ in range(iterations):
+        neighbours = np.bincount(v0, signal[v1], vertex_count) + np.bincount(v1, signal[v0], vertex_count)
+        signal = 0.5 * signal + 0.5 * neighbours / degree
+
+    if not vertex_count:
+        return signal.astype(np.float32)
+    low, high = np.percentile(signal, [2.0, 98.0])
+    if high - low < 1e-8:
+        return np.zeros(vertex_count, dtype=np.float32)
+    return np.clip((signal - low) / (high - low), 0.0, 1.0).astype(np.float32)
+
+
+def edge_thickness_request(obj, props):
+    """Return (key, geometry) for obj, both None in CONSTANT mode.
+
+    The key changes whenever the procedural weights would, and is known
+    before the surface signal is computed.
+    """
+    if props.edge_thickness_mode == 'CONSTANT':
+        return None, None
+    positions, normals, edges, loop_totals, loop_vertices = read_thickness_geometry(obj.data)
+    geometry_key = thickness_geometry_key(positions, edges, loop_totals, loop_vertices,
+                                          props.edge_thickness_mode, props.thickness_smoothing)
+    key = f"{geometry_key}:{props.thickness_min:.4f}:{props.thickness_max:.4f}"
+    return key, (geometry_key, positions, normals, edges)
+
+
+def procedural_edge_thickness(geometry, props):
+    geometry_key, positions, normals, edges = geometry
+    signal = _thickness_cache.get(geometry_key)
+    if signal is None:
+        signal = surface_signal(positions, normals, edges, props.edge_thickness_mode, props.thickness_smoothing)
+        if len(_thickness_cache) >= THICKNESS_CACHE_SIZE:
+            del _thickness_cache[next(iter(_thickness_cache))]
+        _thickness_cache[geometry_key] = signal
+    return props.thickness_min + signal * (props.thickness_max - props.thickness_min)
+
+
+def edge_thickness_weights(props, geometry):
+    """EdgeThickness as a constant or per-vertex weights, from edge_thickness_request."""
+    if geometry is None:
+        return props.edge_thickness_value
+    return procedural_edge_thickness(geometry, props)
+
+
+def write_edge_thickness(obj, weights, key):
+    # Procedural weights are continuous, so they are quantised to keep the
+    # number of add() calls bounded; a constant is written as it is.
+    vg = write_vertex_group_weights(obj, EDGE_VERTEX_GROUP_NAME, weights,
+                                    levels=WEIGHT_LEVELS if key is not None else None)
+    mesh = obj.data
+    if key is not None:
+        mesh[THICKNESS_KEY_PROP] = key
+    elif THICKNESS_KEY_PROP in mesh:
+        del mesh[THICKNESS_KEY_PROP]
+    return vg
+
+
+def setup_edge_vertex_group(obj, props, bulk=False, filled_meshes=None):
+    vg = obj.vertex_groups.get(EDGE_VERTEX_GROUP_NAME)
+    if bulk and filled_meshes is not None and vg is not None and filled_meshes.get(obj.data) == vg.index:
+        # Linked duplicate: the shared mesh already holds the weights
+        return
 
-        source_object = bpy.data.objects.get(TEMPLATE_OBJ_NAME)
-        node_group = bpy.data.node_groups.get(TEMPLATE_GROUP_NAME)
-        target_collection = bpy.data.collections.get(TARGET_COLLECTION_NAME)
+    if not (props.preserve_edge_thickness and vg is not None):
+        key, geometry = edge_thickness_request(obj, props)
+        if vg is not None and key is not None and obj.data.get(THICKNESS_KEY_PROP) == key:
+            # Procedural weights already written for this geometry and range
+            _count_write(False)
+        elif bulk and vg is not None:
+            # Replacing every weight gives the same result as recreating the group,
+            # and keeps its position so no reordering is needed on reruns.
+            write_edge_thickness(obj, edge_thickness_weights(props, geometry), key)
+        else:
+            if vg is not None:
+                obj.vertex_groups.remove(vg)
+            vg = write_edge_thickness(obj, edge_thickness_weights(props, geometry), key)
+
+    move_vertex_group_to_top(obj, vg, bulk)
+    if bulk and filled_meshes is not None:
+        filled_meshes[obj.data] = 0
+
+
+def has_attribute_shading(mesh):
+    """True on Blender 4.1+, where shading lives in sharp_face/sharp_edge attributes."""
+    return hasattr(mesh, "set_sharp_from_angle")
+
+
+def sharp_edges_from_angle(mesh, angle):
+    """Bool per edge, like Mesh.set_sharp_from_angle but from foreach_get buffers.
+
+    Manifold edges are sharp when their two faces meet at more than angle or
+    disagree on winding; boundary and non-manifold edges are left smooth.
+    """
+    import numpy as np
+
+    edge_count = len(mesh.edges)
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    sharp = np.zeros(edge_count, dtype=bool)
+    if not edge_count or not face_count:
+        return sharp
+
+    normals = np.empty(face_count * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(face_count, 3)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_edges = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    # Face loops are stored contiguously in face order
+    loop_faces = np.repeat(np.arange(face_count, dtype=np.int32), loop_totals)
+
+    # Group the loops by edge; a manifold edge has exactly two
+    order = np.argsort(loop_edges, kind='stable')
+    counts = np.bincount(loop_edges, minlength=edge_count)
+    manifold = np.flatnonzero(counts == 2)
+    first = (np.cumsum(counts) - counts)[manifold]
+    loop_a = order[first]
+    loop_b = order[first + 1]
+
+    dots = np.einsum('ij,ij->i', normals[loop_faces[loop_a]], normals[loop_faces[loop_b]])
+    # Consistent winding walks a shared edge in opposite directions
+    flipped = loop_verts[loop_a] == loop_verts[loop_b]
+    sharp[manifold] = (dots < np.cos(angle)) | flipped
+    return sharp
+
+
+def write_bool_attribute(mesh, name, domain, values):
+    """Write a boolean attribute, removing it when every value is False.
+
+    Returns True if the mesh changed.
+    """
+    import numpy as np
+
+    attribute = mesh.attributes.get(name)
+    if not values.any():
+        if attribute is None:
+            return _count_write(False)
+        mesh.attributes.remove(attribute)
+        return _count_write(True)
+
+    if attribute is None:
+        attribute = mesh.attributes.new(name, 'BOOLEAN', domain)
+    else:
+        current = np.empty(len(values), dtype=bool)
+        attribute.data.foreach_get("value", current)
+        if np.array_equal(current, values):
+            return _count_write(False)
+    attribute.data.foreach_set("value", values)
+    return _count_write(True)
+
+
+def shade_mesh_attributes(mesh, shading_mode, angle):
+    """Flat, smooth or smooth-by-angle shading as static attributes, with no modifier."""
+    import numpy as np
+
+    face_count = len(mesh.polygons)
+    changed = write_bool_attribute(mesh, "sharp_face", 'FACE', np.full(face_count, shading_mode == 'FLAT'))
+    # Flat and Smooth keep existing sharp edges, like the shade operators do
+    if shading_mode == 'AUTO_SMOOTH':
+        changed |= write_bool_attribute(mesh, "sharp_edge", 'EDGE', sharp_edges_from_angle(mesh, angle))
+    if changed:
+        mesh.update()
+
+
+def shade_mesh(mesh, shading_mode, angle):
+    """Data API equivalent of the shade_flat/shade_smooth/shade_auto_smooth operators."""
+    if has_attribute_shading(mesh):
+        shade_mesh_attributes(mesh, shading_mode, angle)
+        return
 
-        if source_object is None or node_group is None or target_collection is None:
-            self.report({'ERROR'}, "GeoNodeTemplate, GeoEdgesTemplate, or GeoEdges collection not found.")
-            return {'CANCELLED'}
+    smooth = shading_mode != 'FLAT'
+    mesh.polygons.foreach_set("use_smooth", [smooth] * len(mesh.polygons))
+    if shading_mode == 'AUTO_SMOOTH':
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = angle
+    mesh.update()
 
-        edge_mat = bpy.data.materials.get(EDGE_MAT_NAME)
 
-        for obj in selected_meshes:
-            mesh = obj.data
+def remove_smooth_by_angle_modifiers(obj):
+    """Drop Smooth by Angle modifiers left by earlier shade_auto_smooth runs."""
+    for mod in list(obj.modifiers):
+        if mod.type == 'NODES' and mod.node_group and mod.node_group.name.startswith("Smooth by Angle"):
+            obj.modifiers.remove(mod)
 
-            if props.preserve_edge_thickness and VERTEX_GROUP_NAME in obj.vertex_groups:
-                pass
-            else:
-                if VERTEX_GROUP_NAME in obj.vertex_groups:
-                    obj.vertex_groups.remove(obj.vertex_groups[VERTEX_GROUP_NAME])
-                vg = obj.vertex_groups.new(name=VERTEX_GROUP_NAME)
-                vg.add(range(len(mesh.vertices)), props.edge_thickness_value, 'REPLACE')
-                obj.vertex_groups.active_index = vg.index
-                while obj.vertex_groups.active_index > 0:
-                    bpy.ops.object.vertex_group_move(direction='UP')
 
-            while obj.vertex_groups.active_index > 0:
-                bpy.ops.object.vertex_group_move(direction='UP')
+def clear_custom_normals(mesh):
+    """Data API equivalent of mesh.customdata_custom_splitnormals_clear."""
+    if not getattr(mesh, "has_custom_normals", False):
+        return
+    attribute = mesh.attributes.get("custom_normal")
+    if attribute is not None:
+        mesh.attributes.remove(attribute)
+    else:
+        # Zero vectors fall back to the automatic normals
+        mesh.normals_split_custom_set([(0.0, 0.0, 0.0)] * len(mesh.loops))
+
+
+def shade_edge_source(context, obj, props, bulk=False, batch=None):
+    mesh = obj.data
+    # Attribute shading needs no active object, so it also replaces the
+    # operators outside bulk mode. Meshes shared by several objects are shaded once.
+    if bulk or has_attribute_shading(mesh):
+        remove_smooth_by_angle_modifiers(obj)
+        if batch is not None:
+            if mesh in batch["shaded_meshes"]:
+                return
+            batch["shaded_meshes"].add(mesh)
+        shade_mesh(mesh, props.shading_mode, props.auto_smooth_angle)
+        if not props.preserve_custom_normals:
+            clear_custom_normals(mesh)
+        return
 
-            context.view_layer.objects.active = obj
-            if props.shading_mode == 'FLAT':
-                bpy.ops.object.shade_flat()
-            elif props.shading_mode == 'SMOOTH':
-                bpy.ops.object.shade_smooth()
-            elif props.shading_mode == 'AUTO_SMOOTH':
-                bpy.ops.object.shade_auto_smooth()
+    context.view_layer.objects.active = obj
+    if props.shading_mode == 'FLAT':
+        bpy.ops.object.shade_flat()
+    elif props.shading_mode == 'SMOOTH':
+        bpy.ops.object.shade_smooth()
+    elif props.shading_mode == 'AUTO_SMOOTH':
+        bpy.ops.object.shade_auto_smooth()
+        obj.data.auto_smooth_angle = props.auto_smooth_angle
 
-            if not props.preserve_custom_normals:
-                try:
-                    bpy.ops.mesh.customdata_custom_splitnormals_clear()
-                except:
-                    pass
+    if not props.preserve_custom_normals:
+        try:
+            bpy.ops.mesh.customdata_custom_splitnormals_clear()
+        except:
+            pass
 
-            if edge_mat and edge_mat.name not in [m.name for m in mesh.materials]:
-                mesh.materials.append(edge_mat)
 
-            geo_name = f"GeoEdges_{obj.name}"
-            if geo_name in bpy.data.objects:
-                self.report({'INFO'}, f"{geo_name} already exists, skipping.")
-                continue
+def get_edge_setup_assets(props):
+    """Return the template datablocks setup needs, or None if any is missing."""
+    source_object = bpy.data.objects.get("GeoNodeTemplate")
+    node_group = bpy.data.node_groups.get("GeoEdgesTemplate")
+    target_collection = bpy.data.collections.get("GeoEdges")
+    if source_object is None or node_group is None or target_collection is None:
+        return None
+    return {
+        "source_object": source_object,
+        "node_group": node_group,
+        "target_collection": target_collection,
+        "edge_mat": bpy.data.materials.get("Edge Material"),
+        "shared_group": ensure_shared_edge_group(node_group) if props.share_edge_node_group else None,
+    }
 
-            new_obj = source_object.copy()
-            new_obj.hide_select = True
-            new_obj.data = source_object.data.copy()
-            target_collection.objects.link(new_obj)
 
-            for coll in new_obj.users_collection:
-                if coll != target_collection:
-                    coll.objects.unlink(new_obj)
+def create_edge_object(obj, assets, props):
+    """Create the GeoEdges_<name> object for obj. Returns None if it already exists."""
+    if find_edge_object(obj) is not None:
+        return None
+    geo_name = f"GeoEdges_{obj.name}"
 
-            new_obj.name = geo_name
-            new_obj.data.name = f"GeoEdges_{obj.data.name}"
+    source_object = assets["source_object"]
+    target_collection = assets["target_collection"]
 
-            unique_group = node_group.copy()
-            unique_group.name = f"{geo_name}_NG"
+    # Object.copy() keeps the template mesh: the modifier replaces the geometry,
+    # so every edge object can share that one datablock.
+    new_obj = source_object.copy()
+    new_obj.hide_select = True
+    target_collection.objects.link(new_obj)
 
-            modifier = new_obj.modifiers.get("GeometryNodes")
-            if not modifier:
-                modifier = new_obj.modifiers.new("GeometryNodes", 'NODES')
-            modifier.node_group = unique_group
+    for coll in new_obj.users_collection:
+        if coll != target_collection:
+            coll.objects.unlink(new_obj)
 
-            for node in unique_group.nodes:
-                if node.type == 'OBJECT_INFO':
-                    node.inputs['Object'].default_value = obj
-                    break
+    new_obj.name = geo_name
+    link_edge_object(obj, new_obj)
 
-            try:
-                modifier["Socket_2"] = props.outline_thickness_value
-                print(f"✔️ {new_obj.name}: Socket_2 set to {props.outline_thickness_value}")
-            except:
-                print(f"⚠️ {new_obj.name}: Could not set Socket_2")
+    modifier = new_obj.modifiers.get("GeometryNodes")
+    if not modifier:
+        modifier = new_obj.modifiers.new("GeometryNodes", 'NODES')
+    if props.edge_viewport_proxy:
+        modifier.show_viewport = False
 
-        # Assegna Edge Material alla selezione finale
-        if selected_meshes:
-            last_obj = selected_meshes[-1]
+    shared_group = assets["shared_group"]
+    if shared_group:
+        assign_shared_edge_group(modifier, shared_group, obj)
+    else:
+        unique_group = assets["node_group"].copy()
+        unique_group.name = f"{geo_name}_NG"
+        index_driver_owner(unique_group)
+        set_attr_if_changed(modifier, "node_group", unique_group)
+
+        for node in unique_group.nodes:
+            if node.type == 'OBJECT_INFO':
+                set_attr_if_changed(node.inputs['Object'], "default_value", obj)
+                break
+
+    try:
+        if set_if_changed(modifier, "Socket_2", props.outline_thickness_value):
+            log.debug("✔️ %s: Socket_2 set to %s", new_obj.name, props.outline_thickness_value)
+    except:
+        log.warning("⚠️ %s: Could not set Socket_2", new_obj.name)
+    return new_obj
+
+
+def new_setup_batch():
+    """Per-run state so shared mesh datablocks are only processed once."""
+    return {"shaded_meshes": set(), "filled_meshes": {}}
+
+
+# === SETUP CHECKPOINTS ===
+# A setup run stores its batch on the scene and the stages each object has
+# completed as an ID property on the object, so the state is saved with the
+# file. Rerunning with the same settings after a crash skips finished objects
+# and completes half-configured ones; the flags are cleared when a run ends.
+# Nothing is tracked unless checkpoint saves are enabled: without a save
+# during the run no state could survive a crash. Linked objects are skipped.
+CHECKPOINT_SCENE_KEY = "toon_edge_setup_batch"
+CHECKPOINT_OBJECT_KEY = "toon_edge_setup_stages"
+
+STAGE_VERTEX_GROUP = 1
+STAGE_SHADING = 2
+STAGE_MATERIAL = 4
+STAGE_EDGE_OBJECT = 8
+STAGES_ALL = STAGE_VERTEX_GROUP | STAGE_SHADING | STAGE_MATERIAL | STAGE_EDGE_OBJECT
+
+# Settings that change what a setup produces; a checkpoint only resumes a
+# run made with the same values.
+CHECKPOINT_SETTINGS = (
+    "shading_mode", "auto_smooth_angle", "preserve_custom_normals",
+    "preserve_edge_thickness", "edge_thickness_value", "edge_thickness_mode",
+    "thickness_min", "thickness_max", "thickness_smoothing",
+    "outline_thickness_value", "share_edge_node_group", "bulk_mode",
+)
+
+
+def setup_settings_hash(props):
+    import hashlib
+
+    values = repr([(name, getattr(props, name)) for name in CHECKPOINT_SETTINGS])
+    return hashlib.sha1(values.encode("utf-8")).hexdigest()[:16]
+
+
+def begin_setup_checkpoint(scene, props):
+    """Resume the scene's interrupted batch if the settings match, else start a new one.
+
+    Returns None when checkpoint saves are off.
+    """
+    import uuid
+
+    if not props.checkpoint_save_interval:
+        return None
+    settings = setup_settings_hash(props)
+    record = scene.get(CHECKPOINT_SCENE_KEY)
+    resumed = record is not None and record.get("settings") == settings
+    if resumed:
+        batch_id = record["id"]
+        log.info("♻️ Resuming interrupted toon edge setup %s", batch_id)
+    else:
+        batch_id = uuid.uuid4().hex[:12]
+        scene[CHECKPOINT_SCENE_KEY] = {"id": batch_id, "settings": settings}
+
+    return {
+        "id": batch_id,
+        "resumed": resumed,
+        "complete": 0,
+        "processed": 0,
+        "save_every": props.checkpoint_save_interval,
+    }
+
+
+def checkpoint_stages(obj, checkpoint):
+    """Stages obj completed in this batch, or None if it was not reached yet."""
+    if checkpoint is None:
+        return None
+    record = obj.get(CHECKPOINT_OBJECT_KEY)
+    if record is None or record.get("batch") != checkpoint["id"]:
+        return None
+    return record.get("stages", 0)
+
+
+def start_object_checkpoint(obj, checkpoint):
+    if obj.library is not None:
+        return
+    # Remember whether the edge object predates this batch, so resuming never
+    # replaces an edge object the batch did not create
+    obj[CHECKPOINT_OBJECT_KEY] = {
+        "batch": checkpoint["id"],
+        "stages": 0,
+        "had_edge_object": find_edge_object(obj) is not None,
+    }
+
+
+def mark_stage(obj, checkpoint, stage):
+    if checkpoint is None or CHECKPOINT_OBJECT_KEY not in obj:
+        return
+    record = obj[CHECKPOINT_OBJECT_KEY]
+    record["stages"] = record["stages"] | stage
+
+
+def save_checkpoint(checkpoint):
+    """Save the file every save_every processed objects."""
+    checkpoint["processed"] += 1
+    save_every = checkpoint["save_every"]
+    if not save_every or checkpoint["processed"] % save_every:
+        return
+    if not bpy.data.filepath:
+        log.warning("⚠️ Checkpoint save skipped: the file has never been saved.")
+        return
+    with profile_stage("checkpoint save"):
+        bpy.ops.wm.save_mainfile()
+    log.info("💾 Checkpoint saved after %d objects", checkpoint["processed"])
+
+
+def clear_setup_checkpoint(scene):
+    # Object records only exist while a batch record does
+    if CHECKPOINT_SCENE_KEY not in scene:
+        return
+    for obj in bpy.data.objects:
+        if CHECKPOINT_OBJECT_KEY in obj:
+            del obj[CHECKPOINT_OBJECT_KEY]
+    del scene[CHECKPOINT_SCENE_KEY]
+
+
+def discard_edge_object(obj):
+    """Delete an edge object left half-built by an interrupted run."""
+    geo_obj = find_edge_object(obj)
+    if geo_obj is None:
+        # Interrupted between the copy and the source link
+        candidate = bpy.data.objects.get(f"GeoEdges_{obj.name}")
+        if candidate is not None and candidate.toon_edge_source is None:
+            geo_obj = candidate
+    if geo_obj is None:
+        return
+
+    unlink_edge_object(obj)
+    mod = geo_obj.modifiers.get("GeometryNodes")
+    group = mod.node_group if mod else None
+    bpy.data.objects.remove(geo_obj)
+    if group is not None and group.users == 0 and group.name != SHARED_EDGE_GROUP_NAME:
+        bpy.data.node_groups.remove(group)
+
+
+def setup_toon_edges_for_object(context, obj, assets, props, bulk=False, batch=None, checkpoint=None):
+    """Run every setup step on one mesh. Returns the new edge object or None.
+
+    With a checkpoint, stages the object already completed in that batch are
+    skipped.
+    """
+    stages = checkpoint_stages(obj, checkpoint)
+    if stages == STAGES_ALL:
+        checkpoint["complete"] += 1
+        return None
+    # Reached by the interrupted run: its edge object may be half-built
+    rebuild_edge = stages is not None and not obj[CHECKPOINT_OBJECT_KEY].get("had_edge_object")
+    if checkpoint is not None and stages is None:
+        start_object_checkpoint(obj, checkpoint)
+    stages = stages or 0
+
+    mesh = obj.data
+    if not stages & STAGE_VERTEX_GROUP:
+        with profile_stage("vertex groups"):
+            setup_edge_vertex_group(obj, props, bulk, batch["filled_meshes"] if batch else None)
+        mark_stage(obj, checkpoint, STAGE_VERTEX_GROUP)
+    if not stages & STAGE_SHADING:
+        with profile_stage("shading"):
+            shade_edge_source(context, obj, props, bulk, batch)
+        mark_stage(obj, checkpoint, STAGE_SHADING)
+
+    if not stages & STAGE_MATERIAL:
+        with profile_stage("material copy"):
+            edge_mat = assets["edge_mat"]
+            if edge_mat and edge_mat.name not in [m.name for m in mesh.materials if m]:
+                mesh.materials.append(edge_mat)
+        mark_stage(obj, checkpoint, STAGE_MATERIAL)
+
+    with profile_stage("object copy"):
+        if rebuild_edge:
+            discard_edge_object(obj)
+        new_obj = create_edge_object(obj, assets, props)
+    mark_stage(obj, checkpoint, STAGE_EDGE_OBJECT)
+    if checkpoint is not None:
+        save_checkpoint(checkpoint)
+    return new_obj
+
+
+def finish_toon_edge_setup(objects):
+    """Select the Edge Material on the last object, copy it to all slots and drop stray scenes."""
+    # Assegna Edge Material alla selezione finale
+    with profile_stage("material copy"):
+        if objects:
+            last_obj = objects[-1]
             bpy.context.view_layer.objects.active = last_obj
 
             edge_material = None
@@ -793,13 +1597,14 @@ class OBJECT_OT_setup_toon_edges(bpy.types.Operator):
                 if last_obj.type == 'MESH' and last_obj.material_slots:
                     try:
                         bpy.ops.material.copy_active_to_all_slots_toon()
-                        print("🎨 Copied active material to all slots.")
+                        log.info("🎨 Copied active material to all slots.")
                     except Exception as e:
-                        print(f"❌ Failed to copy material: {e}")
+                        log.error("❌ Failed to copy material: %s", e)
             else:
-                print("❌ No 'Edge Material' found in the scene.")
+                log.error("❌ No 'Edge Material' found in the scene.")
 
-        # ✅ Cleanup scene duplicata (Scene.001, Scene.002, ecc.)
+    # ✅ Cleanup scene duplicata (Scene.001, Scene.002, ecc.)
+    with profile_stage("cleanup"):
         stray_scenes = [
             scene.name for scene in bpy.data.scenes
             if scene != bpy.context.scene and scene.name.startswith("Scene.")
@@ -808,13 +1613,246 @@ class OBJECT_OT_setup_toon_edges(bpy.types.Operator):
             scene_to_remove = bpy.data.scenes.get(name)
             if scene_to_remove:
                 bpy.data.scenes.remove(scene_to_remove)
-                print(f"🧹 Removed stray scene: {name}")
+                log.info("🧹 Removed stray scene: %s", name)
+
+
+class OBJECT_OT_setup_toon_edges(bpy.types.Operator):
+    bl_idname = "object.setup_toon_edges"
+    bl_label = "Set Up Toon Edges"
+    bl_description = "Set up toon edge tracing with Geometry Nodes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @profiled
+    def execute(self, context):
+        reset_write_stats()
+
+        # ✅ Step 1: Controlla presenza asset file
+        with profile_stage("asset load"):
+            assets_present = ensure_edge_assets_are_present()
+        if not assets_present:
+            self.report({'ERROR'}, "Asset blend file not found or missing required data. Check Add-on Preferences.")
+            return {'CANCELLED'}
+        
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, 'No mesh objects selected.')
+            return {'CANCELLED'}
+
+        props = context.scene.toon_edge_settings
+        with profile_stage("asset load"):
+            assets = get_edge_setup_assets(props)
+        if assets is None:
+            self.report({'ERROR'}, "GeoNodeTemplate, GeoEdgesTemplate, or GeoEdges collection not found.")
+            return {'CANCELLED'}
+        _profile["current"]["objects"] = len(selected_meshes)
+
+        # Bulk mode: data API only, shared meshes shaded once, one undo step for the batch
+        batch = new_setup_batch()
+        checkpoint = begin_setup_checkpoint(context.scene, props)
+        resumed = 0
+        for obj in selected_meshes:
+            new_obj = setup_toon_edges_for_object(context, obj, assets, props, props.bulk_mode, batch, checkpoint)
+            if checkpoint is not None and checkpoint["complete"] > resumed:
+                resumed = checkpoint["complete"]
+            elif new_obj is None:
+                self.report({'INFO'}, f"Edge object for {obj.name} already exists, skipping.")
+
+        finish_toon_edge_setup(selected_meshes)
+        clear_setup_checkpoint(context.scene)
+        if checkpoint is not None and checkpoint["resumed"]:
+            self.report({'INFO'}, f"Resumed interrupted setup: {checkpoint['complete']} object(s) were already complete.")
+
+        log.info("✍️ Setup writes: %s written, %s unchanged", _write_stats['written'], _write_stats['skipped'])
+        self.report({'INFO'}, f"Toon edge setup complete ({_write_stats['skipped']} unchanged value(s) skipped).")
+        return {'FINISHED'}
+
+
+
+
+
+# === CHUNKED (MODAL) EXECUTION ===
+# Interactive variants of the per-object operators. Each timer tick processes
+# a slice of the objects, resized after every tick to take about
+# CHUNK_TIME_BUDGET seconds, so Blender keeps redrawing and ESC can stop the
+# run between objects. Every object is processed completely or not at all.
+CHUNK_TIME_BUDGET = 0.1
+CHUNK_TIMER_INTERVAL = 0.01
+
+# Events still handled while a run is in progress; anything else (edits, undo)
+# is held back so it cannot change the data between two chunks.
+CHUNK_PASS_THROUGH_EVENTS = {
+    'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE',
+    'TRACKPADPAN', 'TRACKPADZOOM', 'WINDOW_DEACTIVATE',
+}
+
+
+def set_progress(context, done, total, label):
+    wm = context.window_manager
+    wm.toon_edge_progress = done / total if total else 1.0
+    wm.toon_edge_progress_text = f"{label}: {done}/{total}" if label else ""
+    for area in context.screen.areas if context.screen else ():
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+
+def _is_alive(id_block):
+    try:
+        id_block.name
+        return True
+    except ReferenceError:
+        return False
+
 
-        self.report({'INFO'}, "Toon edge setup complete.")
+class ChunkedObjectOperator:
+    """Mixin running process_object() over many objects in time-sliced chunks.
+
+    Subclasses must define process_object(context, obj), which does the work
+    for one object; this is checked when the subclass is created. They prepare
+    in invoke() and hand the objects to start_chunks(); finish_objects()
+    receives the objects that were processed. A cancelled run still returns
+    FINISHED so one undo step covers the work already done.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not callable(getattr(cls, "process_object", None)):
+            raise TypeError(f"{cls.__name__} must define process_object(context, obj)")
+
+    def finish_objects(self, context, objects, cancelled):
+        pass
+
+    def start_chunks(self, context, objects, run):
+        self._objects = objects
+        self._index = 0
+        self._chunk_size = 1
+        self._run = run
+        run["objects"] = len(objects)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(CHUNK_TIMER_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, len(objects))
+        set_progress(context, 0, len(objects), self.bl_label)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.end_chunks(context, cancelled=True)
+        if event.type != 'TIMER':
+            if event.type in CHUNK_PASS_THROUGH_EVENTS:
+                return {'PASS_THROUGH'}
+            return {'RUNNING_MODAL'}
+
+        end = min(self._index + self._chunk_size, len(self._objects))
+        with profile_run(self._run):
+            start = time.perf_counter()
+            for obj in self._objects[self._index:end]:
+                if _is_alive(obj):
+                    self.process_object(context, obj)
+            elapsed = time.perf_counter() - start
+        processed = end - self._index
+        self._index = end
+
+        # Aim the next slice at the time budget, growing at most 2x per tick
+        target = int(CHUNK_TIME_BUDGET * processed / elapsed) if elapsed > 0 else self._chunk_size * 2
+        self._chunk_size = max(1, min(self._chunk_size * 2, target))
+
+        context.window_manager.progress_update(self._index)
+        set_progress(context, self._index, len(self._objects), self.bl_label)
+        if self._index >= len(self._objects):
+            return self.end_chunks(context, cancelled=False)
+        return {'RUNNING_MODAL'}
+
+    def end_chunks(self, context, cancelled):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+
+        done = [obj for obj in self._objects[:self._index] if _is_alive(obj)]
+        with profile_run(self._run):
+            self.finish_objects(context, done, cancelled)
+        record_profile_run(self._run)
+        set_progress(context, 0, 0, "")
         return {'FINISHED'}
 
 
+class OBJECT_OT_setup_toon_edges_modal(ChunkedObjectOperator, bpy.types.Operator):
+    bl_idname = "object.setup_toon_edges_modal"
+    bl_label = "Set Up Toon Edges (Interactive)"
+    bl_description = "Set up toon edges in chunks with a progress bar; press Esc to stop"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        reset_write_stats()
+        run = new_profile_run(self.bl_label)
+        with profile_run(run), profile_stage("asset load"):
+            assets_present = ensure_edge_assets_are_present()
+            self._props = context.scene.toon_edge_settings
+            self._assets = get_edge_setup_assets(self._props) if assets_present else None
+        if self._assets is None:
+            self.report({'ERROR'}, "Asset blend file not found or missing required data. Check Add-on Preferences.")
+            return {'CANCELLED'}
+
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, 'No mesh objects selected.')
+            return {'CANCELLED'}
+
+        self._batch = new_setup_batch()
+        self._checkpoint = begin_setup_checkpoint(context.scene, self._props)
+        self._created = 0
+        return self.start_chunks(context, selected_meshes, run)
+
+    def execute(self, context):
+        # Scripts and redo run the whole selection at once
+        return bpy.ops.object.setup_toon_edges()
+
+    def process_object(self, context, obj):
+        if setup_toon_edges_for_object(context, obj, self._assets, self._props, self._props.bulk_mode,
+                                       self._batch, self._checkpoint):
+            self._created += 1
+
+    def finish_objects(self, context, objects, cancelled):
+        finish_toon_edge_setup(objects)
+        # A cancelled run keeps its checkpoint so the next run picks up from here
+        if not cancelled:
+            clear_setup_checkpoint(context.scene)
+        message = f"Toon edges set up on {self._created} new object(s), {len(objects)}/{len(self._objects)} processed"
+        self.report({'WARNING'} if cancelled else {'INFO'}, message + (" (cancelled)." if cancelled else "."))
+
+
+class OBJECT_OT_remove_toon_edges_modal(ChunkedObjectOperator, bpy.types.Operator):
+    bl_idname = "object.remove_toon_edges_modal"
+    bl_label = "Remove Toon Edges (Interactive)"
+    bl_description = "Remove toon edges in chunks with a progress bar; press Esc to stop"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        run = new_profile_run(self.bl_label)
+        with profile_run(run), profile_stage("asset load"):
+            assets_present = ensure_edge_assets_are_present()
+        if not assets_present:
+            self.report({'ERROR'}, "Missing assets.")
+            return {'CANCELLED'}
+
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, "No mesh selected.")
+            return {'CANCELLED'}
+
+        self._removed = 0
+        return self.start_chunks(context, selected_meshes, run)
+
+    def execute(self, context):
+        return bpy.ops.object.remove_toon_edges()
+
+    def process_object(self, context, obj):
+        if remove_toon_edges_for_object(obj):
+            self._removed += 1
 
+    def finish_objects(self, context, objects, cancelled):
+        message = f"Toon Edges removed from {self._removed} object(s), {len(objects)}/{len(self._objects)} processed"
+        self.report({'WARNING'} if cancelled else {'INFO'}, message + (" (cancelled)." if cancelled else "."))
 
 
 class OBJECT_OT_set_thickness_on_selected(bpy.types.Operator):
@@ -823,40 +1861,52 @@ class OBJECT_OT_set_thickness_on_selected(bpy.types.Operator):
     bl_description = "Set Outline Thickness value on all selected objects."
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled
     def execute(self, context):
+        start_time = time.perf_counter()
+        reset_write_stats()
         selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        _profile["current"]["objects"] = len(selected_meshes)
         props = context.scene.toon_edge_settings
         value = props.outline_thickness_value
-        count = 0
-        view_layer = context.view_layer
-        ensure_edge_assets_are_present()  # Ensure asset availability
+        with profile_stage("asset load"):
+            ensure_edge_assets_are_present()  # Ensure asset availability
 
-        selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
-        for obj in selected:
-            if obj.name.startswith("GeoEdges_"):
+        # Write every socket first, then evaluate the depsgraph once at the end
+        tagged = []
+        unchanged = 0
+        for obj in selected_meshes:
+            if obj.toon_edge_source is not None or obj.name.startswith("GeoEdges_"):
                 continue
 
-            geo_name = f"GeoEdges_{obj.name}"
-            geo_obj = bpy.data.objects.get(geo_name)
+            geo_obj = find_edge_object(obj)
             if not geo_obj:
                 self.report({'WARNING'}, f"No GeoEdges object found for {obj.name}")
                 continue
 
-            geo_obj.hide_select = True
-            view_layer.objects.active = geo_obj
-            bpy.context.view_layer.update()
-
+            set_attr_if_changed(geo_obj, "hide_select", True)
             mod = geo_obj.modifiers.get("GeometryNodes")
             if mod and "Socket_2" in mod:
-                mod["Socket_2"] = value
-                mod.node_group = mod.node_group
-                obj.update_tag()
-                bpy.context.view_layer.update()
-                count += 1
+                if set_if_changed(mod, "Socket_2", value):
+                    tagged.append(geo_obj)
+                else:
+                    unchanged += 1
             else:
                 self.report({'WARNING'}, f"{obj.name}: GeometryNodes modifier or Socket_2 not found.")
 
-        self.report({'INFO'}, f"Set Outline Thickness = {value} on {count} objects.")
+        for geo_obj in tagged:
+            geo_obj.update_tag()
+        if tagged:
+            context.view_layer.update()
+            for window in context.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == "PROPERTIES":
+                        area.tag_redraw()
+        count = len(tagged)
+
+        elapsed = time.perf_counter() - start_time
+        log.info("⏱️ Outline Thickness set on %s objects (%s unchanged) in %.3f s", count, unchanged, elapsed)
+        self.report({'INFO'}, f"Set Outline Thickness = {value} on {count} objects ({unchanged} already set) in {elapsed:.2f} s.")
         # ✅ Selects the slot containing "Edge Material" in the last selected object
         if selected_meshes:
             last_obj = selected_meshes[-1]
@@ -864,11 +1914,73 @@ class OBJECT_OT_set_thickness_on_selected(bpy.types.Operator):
             for index, mat in enumerate(last_obj.data.materials):
                 if mat and mat.name == "Edge Material":
                     last_obj.active_material_index = index
-                    print(f"🎯 Selected 'Edge Material' in slot {index} on: {last_obj.name}")
+                    log.debug("🎯 Selected 'Edge Material' in slot %d on: %s", index, last_obj.name)
                 return {'FINISHED'}  # replaced break to exit operator
         return {'FINISHED'}
 
 
+class OBJECT_OT_collapse_edge_node_groups(bpy.types.Operator):
+    bl_idname = "object.collapse_edge_node_groups"
+    bl_label = "Collapse Edge Node Groups"
+    bl_description = "Replace per-object GeoEdges node group copies with the shared edge node group"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    measure_file_size: bpy.props.BoolProperty(
+        name="Measure File Size",
+        description="Save a temporary copy before and after to compare file size",
+        default=True
+    )
+
+    @profiled
+    def execute(self, context):
+        template_group = bpy.data.node_groups.get("GeoEdgesTemplate")
+        if template_group is None:
+            self.report({'ERROR'}, "GeoEdgesTemplate node group not found.")
+            return {'CANCELLED'}
+
+        groups_before = len(bpy.data.node_groups)
+        size_before = saved_copy_size() if self.measure_file_size else 0
+
+        shared_group = ensure_shared_edge_group(template_group)
+        collapsed = 0
+        for geo_obj in bpy.data.objects:
+            mod = geo_obj.modifiers.get("GeometryNodes")
+            if not mod or mod.type != 'NODES' or not mod.node_group:
+                continue
+            ng = mod.node_group
+            # Per-object copies are named GeoEdges_<obj>_NG (plus any suffix added later)
+            if ng == shared_group or not ng.name.startswith("GeoEdges_"):
+                continue
+
+            source_obj = None
+            for node in ng.nodes:
+                if node.type == 'OBJECT_INFO':
+                    source_obj = node.inputs['Object'].default_value
+                    break
+            if source_obj is None:
+                log.warning("⚠️ %s: no source object in '%s', skipping.", geo_obj.name, ng.name)
+                continue
+
+            thickness = mod.get("Socket_2")
+            assign_shared_edge_group(mod, shared_group, source_obj)
+            link_edge_object(source_obj, geo_obj)
+            if thickness is not None:
+                set_if_changed(mod, "Socket_2", thickness)
+            collapsed += 1
+
+            if ng.users == 0:
+                bpy.data.node_groups.remove(ng)
+
+        groups_after = len(bpy.data.node_groups)
+        message = f"Collapsed {collapsed} edge node group(s): node groups {groups_before} → {groups_after}"
+        if self.measure_file_size:
+            size_after = saved_copy_size()
+            message += f", file size {size_before / 1048576:.1f} MB → {size_after / 1048576:.1f} MB"
+        log.info("🧹 %s", message)
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
 class OBJECT_OT_setup_aov_compositing(bpy.types.Operator):
     bl_idname = "object.setup_aov_compositing"
     bl_label = "Set Up AOV/Compositing"
@@ -887,9 +1999,9 @@ class OBJECT_OT_setup_aov_compositing(bpy.types.Operator):
                 aov_prop = octane_view_layer.render_aov_node_graph_property
                 aov_prop.render_pass_style = "RENDER_AOV_GRAPH"
                 aov_prop.node_tree = aov_tree
-                print(f"🟢 Assigned AOV node tree: {aov_name}")
+                log.info("🟢 Assigned AOV node tree: %s", aov_name)
             else:
-                print(f"⚠️ AOV node tree '{aov_name}' not found.")
+                log.warning("⚠️ AOV node tree '%s' not found.", aov_name)
 
             # Assign Compositing Node Tree
             comp_name = "Octane Toon Compositor"
@@ -897,9 +2009,9 @@ class OBJECT_OT_setup_aov_compositing(bpy.types.Operator):
             if comp_tree:
                 comp_prop = octane_view_layer.composite_node_graph_property
                 comp_prop.node_tree = comp_tree
-                print(f"🟢 Assigned Compositing node tree: {comp_name}")
+                log.info("🟢 Assigned Compositing node tree: %s", comp_name)
             else:
-                print(f"⚠️ Compositing node tree '{comp_name}' not found.")
+                log.warning("⚠️ Compositing node tree '%s' not found.", comp_name)
                 
             # Enable Alpha Channel
             enable_alpha_channel_from_socket()
@@ -945,11 +2057,31 @@ class VIEW3D_PT_octane_toon_edges(bpy.types.Panel):
         layout = self.layout
         props = context.scene.toon_edge_settings
 
-        layout.operator("object.setup_toon_edges", icon='MOD_WIREFRAME')
-        layout.operator("object.remove_toon_edges", icon='TRASH')
+        wm = context.window_manager
+        if wm.toon_edge_progress_text:
+            if hasattr(layout, "progress"):
+                layout.progress(factor=wm.toon_edge_progress, text=wm.toon_edge_progress_text)
+            else:
+                layout.label(text=f"{wm.toon_edge_progress_text} ({wm.toon_edge_progress:.0%})", icon='TIME')
+            layout.label(text="Press Esc to stop", icon='CANCEL')
+
+        row = layout.row(align=True)
+        row.operator("object.setup_toon_edges", icon='MOD_WIREFRAME')
+        row.operator("object.setup_toon_edges_modal", text="", icon='TIME')
+        row = layout.row(align=True)
+        row.operator("object.remove_toon_edges", icon='TRASH')
+        row.operator("object.remove_toon_edges_modal", text="", icon='TIME')
         layout.operator("object.assign_octane_nodes", icon='NODETREE')
         layout.operator("object.add_toon_light", icon='LIGHT_SUN')
+        row = layout.row(align=True)
+        row.prop(props, "edge_viewport_proxy", icon='MOD_WIREFRAME' if props.edge_viewport_proxy else 'MOD_LINEART',
+                 toggle=True)
+        row.operator("object.measure_edge_viewport_fps", text="", icon='PLAY')
+        fps = _proxy_state["fps"]
+        if fps:
+            layout.label(text=f"Playback: {fps['full']:.1f} fps full, {fps['proxy']:.1f} fps proxy", icon='TIME')
         layout.prop(context.scene, "asset_blend_path")
+        layout.prop(props, "asset_link_mode")
         layout.separator()
 
         box = layout.box()
@@ -957,10 +2089,25 @@ class VIEW3D_PT_octane_toon_edges(bpy.types.Panel):
         row.prop(props, "show_edge_creation_options", text="", icon="TRIA_DOWN" if props.show_edge_creation_options else "TRIA_RIGHT", emboss=False)
         row.label(text="Edge Creation Options", icon='MODIFIER')
         if props.show_edge_creation_options:
+            box.prop(props, "bulk_mode")
+            box.prop(props, "checkpoint_save_interval")
+            if CHECKPOINT_SCENE_KEY in context.scene:
+                box.label(text="Interrupted setup found: run Set Up Toon Edges to resume", icon='RECOVER_LAST')
             box.prop(props, "shading_mode")
+            if props.shading_mode == 'AUTO_SMOOTH':
+                box.prop(props, "auto_smooth_angle")
             box.prop(props, "preserve_custom_normals")
             box.prop(props, "preserve_edge_thickness")
-            box.prop(props, "edge_thickness_value")
+            box.prop(props, "edge_thickness_mode")
+            if props.edge_thickness_mode == 'CONSTANT':
+                box.prop(props, "edge_thickness_value")
+            else:
+                row = box.row(align=True)
+                row.prop(props, "thickness_min")
+                row.prop(props, "thickness_max")
+                box.prop(props, "thickness_smoothing")
+            box.prop(props, "share_edge_node_group")
+            box.operator("object.collapse_edge_node_groups", icon='NODETREE')
             box.operator("object.set_thickness_on_selected", icon='MOD_SOLIDIFY')
             box.prop(props, "outline_thickness_value")
         layout.separator()
@@ -972,6 +2119,55 @@ class VIEW3D_PT_octane_toon_edges(bpy.types.Panel):
         if props.show_global_thickness:
             box.prop(props, "global_outline_thickness")
             box.prop(props, "global_edge_thickness")
+        layout.separator()
+
+        box = layout.box()
+        row = box.row()
+        row.prop(props, "show_profiling", text="", icon="TRIA_DOWN" if props.show_profiling else "TRIA_RIGHT", emboss=False)
+        row.label(text="Profiling", icon='TIME')
+        if props.show_profiling:
+            box.prop(props, "log_level")
+            run = last_profile_run()
+            if run:
+                box.label(text=f"{run['operator']}: {run['seconds']:.3f} s ({run['objects']} objects)")
+                col = box.column(align=True)
+                for stage, seconds in sorted(run["stages"].items(), key=lambda item: -item[1]):
+                    col.label(text=f"{stage}: {seconds:.3f} s")
+            else:
+                box.label(text="No operator runs recorded yet.")
+            box.operator("object.export_toon_edge_profile", icon='EXPORT')
+
+
+class OBJECT_OT_export_toon_edge_profile(bpy.types.Operator):
+    bl_idname = "object.export_toon_edge_profile"
+    bl_label = "Export Profile"
+    bl_description = "Write the recorded operator timings to a JSON file"
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "octane_edge_profile.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        import json
+
+        data = {
+            "blend_file": bpy.data.filepath,
+            "runs": _profile["runs"],
+            "writes": dict(_write_stats),
+        }
+        try:
+            with open(bpy.path.abspath(self.filepath), "w") as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            self.report({'ERROR'}, f"Could not write profile: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Profile of {len(_profile['runs'])} run(s) written to {self.filepath}")
+        return {'FINISHED'}
 
 
 class OBJECT_OT_assign_octane_nodes(bpy.types.Operator):
@@ -980,6 +2176,7 @@ class OBJECT_OT_assign_octane_nodes(bpy.types.Operator):
     bl_description = "Assign Octane AOV/Compositing trees and enable alpha in kernel"
     bl_options = {'REGISTER', 'UNDO'}
 
+    @profiled
     def execute(self, context):
         AOV_NODE_NAME = "Octane_Toon_AOVs"
         COMP_NODE_NAME = "Octane Toon Compositor"
@@ -993,37 +2190,25 @@ class OBJECT_OT_assign_octane_nodes(bpy.types.Operator):
         try:
             view_layer = bpy.context.view_layer
             octane_view_layer = view_layer.octane
-            octane_view_layer.render_pass_style = "RENDER_AOV_GRAPH"
+            set_attr_if_changed(octane_view_layer, "render_pass_style", "RENDER_AOV_GRAPH")
 
             # === Auto-import se mancano ===
-            if not bpy.data.node_groups.get(AOV_NODE_NAME) or not bpy.data.node_groups.get(COMP_NODE_NAME):
-                addon = bpy.context.preferences.addons.get(__name__)
-                prefs = addon.preferences
-                blend_path = os.path.join(bpy.path.abspath(context.scene.asset_blend_path), "Octane_Edge_Tools_Assets.blend")
-                if os.path.exists(blend_path):
-                    try:
-                        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-                            if AOV_NODE_NAME in data_from.node_groups:
-                                data_to.node_groups.append(AOV_NODE_NAME)
-                                print(f"📥 Imported AOV node group: {AOV_NODE_NAME}")
-                            if COMP_NODE_NAME in data_from.node_groups:
-                                data_to.node_groups.append(COMP_NODE_NAME)
-                                print(f"📥 Imported Compositor node group: {COMP_NODE_NAME}")
-                    except Exception as e:
-                        self.report({'ERROR'}, f"Error loading node trees from asset file: {e}")
-                        return {'CANCELLED'}
+            with profile_stage("asset load"):
+                missing = load_asset_manifest(COMPOSITING_ASSET_MANIFEST)
+            if missing:
+                self.report({'WARNING'}, f"Node trees missing from asset file: {missing}")
 
             # === Prosegui con assegnazione
             aov_tree = bpy.data.node_groups.get(AOV_NODE_NAME)
             if aov_tree:
-                octane_view_layer.render_aov_node_graph_property.node_tree = aov_tree
+                set_attr_if_changed(octane_view_layer.render_aov_node_graph_property, "node_tree", aov_tree)
                 self.report({'INFO'}, f"Assigned AOV: {AOV_NODE_NAME}")
             else:
                 self.report({'WARNING'}, f"AOV node tree '{AOV_NODE_NAME}' not found.")
 
             comp_tree = bpy.data.node_groups.get(COMP_NODE_NAME)
             if comp_tree:
-                octane_view_layer.composite_node_graph_property.node_tree = comp_tree
+                set_attr_if_changed(octane_view_layer.composite_node_graph_property, "node_tree", comp_tree)
                 self.report({'INFO'}, f"Assigned Compositor: {COMP_NODE_NAME}")
             else:
                 self.report({'WARNING'}, f"Compositing node tree '{COMP_NODE_NAME}' not found.")
@@ -1035,7 +2220,7 @@ class OBJECT_OT_assign_octane_nodes(bpy.types.Operator):
                     alpha_index = KERNEL_ALPHA_INPUT_INDEX.get(node.name)
                     if alpha_index is not None and len(node.inputs) > alpha_index:
                         try:
-                            node.inputs[alpha_index].default_value = True
+                            set_attr_if_changed(node.inputs[alpha_index], "default_value", True)
                             self.report({'INFO'}, f"Enabled alpha: {kernel_tree.name} → {node.name} (input[{alpha_index}]: '{node.inputs[alpha_index].name}')")
                             break
                         except Exception as e:
@@ -1058,9 +2243,14 @@ classes = (
     OBJECT_OT_add_toon_light,
     ToonEdgeSettings,
     OBJECT_OT_setup_toon_edges,
+    OBJECT_OT_setup_toon_edges_modal,
+    OBJECT_OT_remove_toon_edges_modal,
     OBJECT_OT_set_thickness_on_selected,
+    OBJECT_OT_collapse_edge_node_groups,
     OBJECT_OT_remove_toon_edges,
     OBJECT_OT_assign_octane_nodes,
+    OBJECT_OT_export_toon_edge_profile,
+    OBJECT_OT_measure_edge_viewport_fps,
     VIEW3D_PT_octane_toon_edges,
 )
 
@@ -1068,29 +2258,48 @@ classes = (
 
 def register():
     bpy.app.handlers.load_post.append(restore_cached_asset_path)
+    bpy.app.handlers.load_post.append(reset_session_indexes)
+    bpy.app.handlers.undo_post.append(reset_session_indexes)
+    bpy.app.handlers.redo_post.append(reset_session_indexes)
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.toon_edge_settings = bpy.props.PointerProperty(type=ToonEdgeSettings)
+    bpy.types.WindowManager.toon_edge_progress = bpy.props.FloatProperty(
+        name="Progress", subtype='FACTOR', min=0.0, max=1.0
+    )
+    bpy.types.WindowManager.toon_edge_progress_text = bpy.props.StringProperty(name="Progress")
+    bpy.types.Object.toon_edge_object = bpy.props.PointerProperty(
+        name="Toon Edge Object",
+        description="GeoEdges object generated for this mesh",
+        type=bpy.types.Object
+    )
+    bpy.types.Object.toon_edge_source = bpy.props.PointerProperty(
+        name="Toon Edge Source",
+        description="Mesh this GeoEdges object traces",
+        type=bpy.types.Object
+    )
     bpy.types.Scene.asset_blend_path = bpy.props.StringProperty(
     name="Asset File Path",
     subtype='FILE_PATH',
     description="Path to Octane Edge Tools asset .blend file",
     update=update_asset_path
 )
+    bpy.app.timers.register(_scan_asset_library_on_enable, first_interval=0.1)
 
 
 
 import os
 import json
+import threading
 
 def save_asset_path(path):
     cache_file = os.path.join(os.path.expanduser("~"), ".octane_edge_tools_path.json")
     try:
         with open(cache_file, "w") as f:
             json.dump({"asset_path": path}, f)
-        print(f"✅ Saved asset path: {path}")
+        log.info("✅ Saved asset path: %s", path)
     except Exception as e:
-        print(f"❌ Failed to save asset path: {e}")
+        log.error("❌ Failed to save asset path: %s", e)
         
 def load_asset_path():
     cache_file = os.path.join(os.path.expanduser("~"), ".octane_edge_tools_path.json")
@@ -1100,15 +2309,174 @@ def load_asset_path():
                 data = json.load(f)
             return data.get("asset_path", "")
     except Exception as e:
-        print(f"❌ Failed to load cached asset path: {e}")
+        log.error("❌ Failed to load cached asset path: %s", e)
     return ""
 
 
+# === ASSET LIBRARY INDEX ===
+# Datablock names per category of each asset library, cached next to the
+# asset path cache and keyed by path, mtime, size and content hash.
+ASSET_INDEX_CATEGORIES = ("collections", "objects", "node_groups", "materials")
+_asset_index_cache = {}
+_asset_index_lock = threading.RLock()
+
+
+def _asset_index_file():
+    return os.path.join(os.path.expanduser("~"), ".octane_edge_tools_index.json")
+
+
+def _asset_index_key(blend_path):
+    return os.path.normcase(os.path.abspath(blend_path))
+
+
+def _file_content_hash(path):
+    import hashlib
+
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_asset_index_file():
+    try:
+        with open(_asset_index_file(), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_asset_index_file(entries):
+    """Replace the index file atomically.
+
+    Scanner threads and parallel batch workers share the file, so it is written
+    to a temporary file next to it and swapped in with os.replace; readers see
+    either the old or the new index, never a partial one.
+    """
+    import tempfile
+
+    path = _asset_index_file()
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                        dir=os.path.dirname(path))
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except Exception as e:
+        log.error("❌ Failed to save asset index: %s", e)
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def lookup_asset_index(blend_path):
+    """Return the cached {category: names} for a library, or None if the file changed."""
+    key = _asset_index_key(blend_path)
+    try:
+        stat = os.stat(blend_path)
+    except OSError:
+        return None
+
+    with _asset_index_lock:
+        entry = _asset_index_cache.get(key)
+        if entry is None:
+            entry = _read_asset_index_file().get(key)
+            if entry is None:
+                return None
+            _asset_index_cache[key] = entry
+
+    if entry["size"] != stat.st_size:
+        return None
+    if entry["mtime"] != stat.st_mtime:
+        # Touched but possibly unchanged: the content hash decides. The cached
+        # entry is shared, so the new mtime goes in through a fresh entry
+        # stored under the lock.
+        if entry["hash"] != _file_content_hash(blend_path):
+            return None
+        store_asset_index(blend_path, entry["names"], digest=entry["hash"])
+    return entry["names"]
+
+
+def store_asset_index(blend_path, names, digest=None):
+    key = _asset_index_key(blend_path)
+    try:
+        stat = os.stat(blend_path)
+        if digest is None:
+            digest = _file_content_hash(blend_path)
+    except OSError as e:
+        log.error("❌ Failed to index asset file: %s", e)
+        return
+    entry = {
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "hash": digest,
+        "names": {category: sorted(names.get(category, ())) for category in ASSET_INDEX_CATEGORIES},
+    }
+    with _asset_index_lock:
+        _asset_index_cache[key] = entry
+        entries = _read_asset_index_file()
+        entries[key] = entry
+        _write_asset_index_file(entries)
+
+
+def scan_asset_library(blend_path):
+    """Index a library with the standalone .blend reader. Safe off the main thread."""
+    if lookup_asset_index(blend_path) is not None:
+        return
+    try:
+        from octane_blend_scanner import read_blend_id_names
+    except ImportError:
+        # Reader not installed next to the add-on: the index is built on first load instead.
+        return
+    try:
+        names = read_blend_id_names(blend_path)
+    except Exception as e:
+        log.error("❌ Could not scan asset file %s: %s", blend_path, e)
+        return
+    store_asset_index(blend_path, names)
+    log.info("🔎 Indexed asset file: %s", blend_path)
+
+
+def start_asset_scan(path):
+    """Validate and index the asset library in a background thread.
+
+    Skipped in background mode: headless runs exit as soon as their script
+    ends, and the index is built on the first library load anyway.
+    """
+    if not path or bpy.app.background:
+        return
+    blend_path = resolve_asset_blend_path(path)
+    if blend_path is None:
+        log.error("❌ Asset file not found: %s", path)
+        return
+    threading.Thread(target=scan_asset_library, args=(blend_path,), daemon=True).start()
+
+
+def _scan_asset_library_on_enable():
+    start_asset_scan(bpy.context.scene.asset_blend_path)
+    return None
+
+
 
 def unregister():
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if reset_session_indexes in handlers:
+            handlers.remove(reset_session_indexes)
+    if restore_cached_asset_path in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(restore_cached_asset_path)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.toon_edge_settings
+    del bpy.types.WindowManager.toon_edge_progress
+    del bpy.types.WindowManager.toon_edge_progress_text
+    del bpy.types.Object.toon_edge_object
+    del bpy.types.Object.toon_edge_source
     del bpy.types.Scene.asset_blend_path
 
 # Funzione utile, ma non chiamata automaticamente
@@ -1116,22 +2484,22 @@ def enable_alpha_channel_from_socket():
     try:
         kernel_group = bpy.data.node_groups.get("Octane Kernel")
         if not kernel_group:
-            print("❌ Node group 'Octane Kernel' not found.")
+            log.error("❌ Node group 'Octane Kernel' not found.")
             return
 
         for node in kernel_group.nodes:
             if "kernel" in node.name.lower():
                 try:
-                    node.inputs[17].default_value = True
-                    print(f"✅ Alpha Channel attivato in '{node.name}' (input[17])")
+                    set_attr_if_changed(node.inputs[17], "default_value", True)
+                    log.info("✅ Alpha Channel attivato in '%s' (input[17])", node.name)
                     return
                 except Exception as e:
-                    print(f"⚠️ Errore su nodo '{node.name}': {e}")
+                    log.warning("⚠️ Errore su nodo '%s': %s", node.name, e)
                     continue
 
-        print("❌ Nessun nodo kernel compatibile trovato nel gruppo.")
+        log.error("❌ Nessun nodo kernel compatibile trovato nel gruppo.")
     except Exception as e:
-        print(f"❌ Errore durante la modifica: {e}")
+        log.error("❌ Errore durante la modifica: %s", e)
 
 
 import bpy
@@ -1139,7 +2507,21 @@ from bpy.app.handlers import persistent
 
 @persistent
 def restore_cached_asset_path(dummy):
+    log.setLevel(getattr(logging, bpy.context.scene.toon_edge_settings.log_level))
     cached_path = load_asset_path()
-    if cached_path:
+    if cached_path and bpy.app.background:
+        # Headless workers only need the value, not the cache rewrite in update_asset_path
+        bpy.context.scene["asset_blend_path"] = cached_path
+    elif cached_path:
+        # Assigning the path also kicks off the background asset scan.
         bpy.context.scene.asset_blend_path = cached_path
-        print(f"📂 Cached path restored after load: {cached_path}")
+        log.info("📂 Cached path restored after load: %s", cached_path)
+    elif bpy.context.scene.asset_blend_path:
+        start_asset_scan(bpy.context.scene.asset_blend_path)
+
+
+@persistent
+def reset_session_indexes(dummy):
+    # Both indexes are rebuilt lazily on next use
+    invalidate_driver_index()
+    invalidate_edge_index()
@@ -0,0 +1,353 @@
+"""Apply the toon pipeline to many .blend files from the command line.
+
+    blender -b --python script/octane_toon_batch.py -- \
+        --recipe recipe.json --jobs 4 --report batch_report.json shots/ extra_shot.blend
+
+The command above is the parent: it does no scene work itself and starts one
+background Blender per file (at most --jobs at a time). Each child opens its
+file, runs the recipe steps with the add-ons in this directory and saves.
+
+Recipe example:
+
+    {
+        "asset_blend_path": "/library/Octane_Edge_Tools_Assets.blend",
+        "settings": {"outline_thickness_value": 0.02, "bulk_mode": true},
+        "steps": ["import_assets", "setup_toon_edges", "assign_octane_nodes",
+                  "set_octane_options", "connect_tolerance"],
+        "output_suffix": "_toon"
+    }
+
+"settings" are written to scene.toon_edge_settings before the first step, so
+they also apply to the import (e.g. "asset_link_mode"). An empty "output_suffix"
+saves over the original file. Steps that need OctaneRender are skipped when
+the running Blender has no Octane add-on, so the batch also runs on a plain
+Blender build without a GPU.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_STEPS = [
+    "import_assets",
+    "setup_toon_edges",
+    "assign_octane_nodes",
+    "set_octane_options",
+    "connect_tolerance",
+]
+OCTANE_STEPS = {"assign_octane_nodes", "set_octane_options"}
+
+# Add-ons the steps call into, registered in the child in this order
+ADDON_MODULES = (
+    "copy_material_to_all_slots",
+    "octane_toon_tolerance",
+    "Octane_Settings",
+    "octane_edge_shader_kit",
+)
+
+# Lines of child output kept in the report when a file fails
+LOG_TAIL_LINES = 30
+
+
+def script_args():
+    """Arguments after the ``--`` separator of the Blender command line."""
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return sys.argv[1:]
+
+
+def load_recipe(path):
+    with open(path, "r", encoding="utf-8") as f:
+        recipe = json.load(f)
+    steps = recipe.setdefault("steps", list(DEFAULT_STEPS))
+    unknown = [step for step in steps if step not in STEP_FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Unknown recipe step(s): {', '.join(unknown)}")
+    recipe.setdefault("settings", {})
+    recipe.setdefault("output_suffix", "")
+    return recipe
+
+
+def output_path(blend_path, suffix):
+    if not suffix:
+        return blend_path
+    root, ext = os.path.splitext(blend_path)
+    return f"{root}{suffix}{ext}"
+
+
+def collect_blend_files(paths, suffix=""):
+    """Expand directories to their .blend files, skipping our own outputs."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(".blend"):
+                    files.append(os.path.join(path, name))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"⚠️ Not found, skipping: {path}")
+
+    files = [os.path.abspath(f) for f in files]
+    if suffix:
+        files = [f for f in files if not os.path.splitext(f)[0].endswith(suffix)]
+    # Keep order, drop duplicates
+    return list(dict.fromkeys(files))
+
+
+# === CHILD: RECIPE STEPS ===
+# Each step returns a short detail string or raises. Run inside Blender only.
+
+def _edge_source_meshes(bpy):
+    edge_collection = bpy.data.collections.get("GeoEdges")
+    edge_objects = set(edge_collection.all_objects) if edge_collection else set()
+    return [
+        obj for obj in bpy.context.view_layer.objects
+        if obj.type == 'MESH' and obj not in edge_objects and obj.toon_edge_source is None
+    ]
+
+
+def _check_operator(result, name):
+    if 'FINISHED' not in result:
+        raise RuntimeError(f"{name} returned {sorted(result)}")
+
+
+def step_import_assets(bpy, recipe):
+    import octane_edge_shader_kit
+
+    asset_path = recipe.get("asset_blend_path")
+    if asset_path:
+        if octane_edge_shader_kit.resolve_asset_blend_path(asset_path) is None:
+            raise RuntimeError(f"Asset library not found: {asset_path}")
+        # Item assignment skips update_asset_path, which would rewrite the
+        # user's path cache and start a scan thread in every worker
+        bpy.context.scene["asset_blend_path"] = asset_path
+    if not octane_edge_shader_kit.ensure_octane_edge_assets():
+        raise RuntimeError("Asset library is missing required data")
+    return bpy.context.scene.asset_blend_path
+
+
+def apply_recipe_settings(bpy, recipe):
+    """Write the recipe settings before any step; some (e.g. asset_link_mode) affect the import."""
+    props = bpy.context.scene.toon_edge_settings
+    for key, value in recipe["settings"].items():
+        setattr(props, key, value)
+
+
+def step_setup_toon_edges(bpy, recipe):
+    meshes = _edge_source_meshes(bpy)
+    if not meshes:
+        return "no meshes"
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(obj in meshes)
+    view_layer.objects.active = meshes[-1]
+
+    _check_operator(bpy.ops.object.setup_toon_edges(), "setup_toon_edges")
+    return f"{len(meshes)} mesh(es)"
+
+
+def step_assign_octane_nodes(bpy, recipe):
+    _check_operator(bpy.ops.object.assign_octane_nodes(), "assign_octane_nodes")
+    return ""
+
+
+def step_set_octane_options(bpy, recipe):
+    _check_operator(bpy.ops.wm.set_octane_options(), "set_octane_options")
+    return ""
+
+
+def step_connect_tolerance(bpy, recipe):
+    _check_operator(bpy.ops.material.connect_edge_nodes(scope='FILE'), "connect_edge_nodes")
+    return ""
+
+
+STEP_FUNCTIONS = {
+    "import_assets": step_import_assets,
+    "setup_toon_edges": step_setup_toon_edges,
+    "assign_octane_nodes": step_assign_octane_nodes,
+    "set_octane_options": step_set_octane_options,
+    "connect_tolerance": step_connect_tolerance,
+}
+
+
+def octane_available(bpy):
+    return hasattr(bpy.context.scene, "octane")
+
+
+def register_addons(bpy):
+    import importlib
+
+    if SCRIPT_DIR not in sys.path:
+        sys.path.insert(0, SCRIPT_DIR)
+    enabled = bpy.context.preferences.addons.keys()
+    for name in ADDON_MODULES:
+        # Already registered when installed and enabled in the user preferences
+        if name not in enabled:
+            importlib.import_module(name).register()
+
+
+def run_child(recipe_path, result_path):
+    """Run the recipe on the file Blender opened and write a JSON result."""
+    import bpy
+
+    start = time.perf_counter()
+    blend_path = bpy.data.filepath
+    result = {"file": blend_path, "status": "ok", "steps": [], "octane": octane_available(bpy)}
+
+    try:
+        recipe = load_recipe(recipe_path)
+        register_addons(bpy)
+        apply_recipe_settings(bpy, recipe)
+        for name in recipe["steps"]:
+            if name in OCTANE_STEPS and not result["octane"]:
+                result["steps"].append({"step": name, "status": "skipped", "detail": "Octane not available"})
+                continue
+            step_start = time.perf_counter()
+            detail = STEP_FUNCTIONS[name](bpy, recipe)
+            result["steps"].append({
+                "step": name,
+                "status": "ok",
+                "seconds": round(time.perf_counter() - step_start, 3),
+                "detail": detail,
+            })
+
+        save_start = time.perf_counter()
+        target = output_path(blend_path, recipe["output_suffix"])
+        if target == blend_path:
+            bpy.ops.wm.save_mainfile()
+        else:
+            bpy.ops.wm.save_as_mainfile(filepath=target, copy=True)
+        result["output"] = target
+        result["save_seconds"] = round(time.perf_counter() - save_start, 3)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        print(f"❌ {blend_path}: {result['error']}")
+
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+
+# === PARENT: PROCESS POOL ===
+
+def default_blender_binary():
+    try:
+        import bpy
+        return bpy.app.binary_path
+    except ImportError:
+        return "blender"
+
+
+def run_file(blender, blend_path, recipe_path, result_dir, index, timeout, factory_startup):
+    result_path = os.path.join(result_dir, f"{index:05d}.json")
+    command = [blender, "-b"]
+    if factory_startup:
+        command.append("--factory-startup")
+    command += [
+        blend_path,
+        "--python-exit-code", "1",
+        "--python", os.path.abspath(__file__),
+        "--", "--child", "--recipe", recipe_path, "--result", result_path,
+    ]
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, errors="replace", timeout=timeout)
+        output, returncode = proc.stdout, proc.returncode
+    except subprocess.TimeoutExpired as e:
+        output, returncode = e.stdout or "", None
+        if isinstance(output, bytes):
+            output = output.decode("utf-8", "replace")
+
+    result = {"file": blend_path, "status": "error"}
+    if os.path.isfile(result_path):
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    elif returncode is None:
+        result["error"] = f"Timed out after {timeout} s"
+    else:
+        result["error"] = f"Blender exited with code {returncode} before writing a result"
+
+    result["returncode"] = returncode
+    result["wall_seconds"] = round(time.perf_counter() - start, 3)
+    if result["status"] != "ok":
+        result["log_tail"] = output.splitlines()[-LOG_TAIL_LINES:]
+    return result
+
+
+def run_parent(args):
+    recipe = load_recipe(args.recipe)
+    files = collect_blend_files(args.paths, recipe["output_suffix"])
+    if not files:
+        print("❌ No .blend files to process.")
+        return 1
+
+    recipe_path = os.path.abspath(args.recipe)
+    blender = args.blender or default_blender_binary()
+    jobs = max(1, min(args.jobs, len(files)))
+    print(f"🚀 Processing {len(files)} file(s) with {jobs} worker(s)")
+
+    start = time.perf_counter()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="octane_toon_batch_") as result_dir:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(run_file, blender, path, recipe_path, result_dir, index,
+                            args.timeout, args.factory_startup)
+                for index, path in enumerate(files)
+            ]
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                icon = "✅" if result["status"] == "ok" else "❌"
+                print(f"{icon} {result['file']} ({result['wall_seconds']:.1f} s)")
+
+    failed = sum(1 for r in results if r["status"] != "ok")
+    report = {
+        "recipe": recipe,
+        "jobs": jobs,
+        "seconds": round(time.perf_counter() - start, 3),
+        "summary": {"files": len(results), "ok": len(results) - failed, "failed": failed},
+        "files": results,
+    }
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.report}")
+    print(f"🏁 {len(results) - failed} ok, {failed} failed in {report['seconds']:.1f} s")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the Octane toon pipeline to .blend files")
+    parser.add_argument("paths", nargs="*", help=".blend files or directories containing them")
+    parser.add_argument("--recipe", required=True, help="JSON recipe with the steps to run")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Blender processes to run at once")
+    parser.add_argument("--report", default="", help="Write the per-file JSON report here")
+    parser.add_argument("--blender", default="", help="Blender binary for the workers (default: this one)")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before a file is abandoned")
+    parser.add_argument("--factory-startup", action="store_true",
+                        help="Start workers without user preferences (disables the Octane add-on)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args(script_args())
+
+    if args.child:
+        run_child(args.recipe, args.result)
+        return 0
+    return run_parent(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
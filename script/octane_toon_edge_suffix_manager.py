@@ -1,5 +1,10 @@
 
 import bpy
+import json
+import logging
+
+# Child of the edge shader kit's logger, so its Console Log level applies here too
+log = logging.getLogger("octane_edge_tools.suffix")
 
 bl_info = {
     "name": "Octane Toon & Edge Suffix Manager",
@@ -32,83 +37,252 @@ class SuffixManagerProperties(bpy.types.PropertyGroup):
     )
 
 
+# Never renamed: shared by every character, not owned by one collection
+EXCLUDED_OBJECT_NAMES = {"GeoNodeTemplate"}
+EXCLUDED_NODE_GROUP_NAMES = {"GeoEdgesShared_NG"}
+
+# Lines shown in the preview popup; the full plan goes to the console
+PREVIEW_LINES = 40
+
+
+def renamed(name, suffix, remove_suffix, skip_if_exists):
+    """Return the new name for a datablock, or None if it keeps its name."""
+    if remove_suffix:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+        return None
+    if skip_if_exists and name.endswith(suffix):
+        return None
+    return name + suffix
+
+
+def build_rename_plan(collection, suffix, remove_suffix, skip_if_exists):
+    """Walk the collection once and work out every rename before touching anything.
+
+    Each object, material and node group is visited once, however many objects
+    share it; node groups are followed recursively through group nodes.
+    Returns {"renames": [(data attribute, datablock, old name, new name)],
+    "collisions": [(data attribute, old name, new name)]}.
+    """
+    visited = {"objects": set(), "materials": set(), "node_groups": set()}
+    targets = []
+
+    def visit(attr, id_block):
+        if id_block in visited[attr]:
+            return False
+        visited[attr].add(id_block)
+        targets.append((attr, id_block))
+        return True
+
+    def visit_tree(tree):
+        for node in tree.nodes:
+            if node.type == 'GROUP' and node.node_tree and node.node_tree.name not in EXCLUDED_NODE_GROUP_NAMES:
+                if visit("node_groups", node.node_tree):
+                    visit_tree(node.node_tree)
+
+    for obj in collection.all_objects:
+        if obj.name in EXCLUDED_OBJECT_NAMES:
+            continue
+        visit("objects", obj)
+
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat and visit("materials", mat) and mat.use_nodes and mat.node_tree:
+                visit_tree(mat.node_tree)
+
+        for mod in obj.modifiers:
+            if mod.type != 'NODES' or not mod.node_group:
+                continue
+            ng = mod.node_group
+            if ng.name in EXCLUDED_NODE_GROUP_NAMES or not visit("node_groups", ng):
+                continue
+            for node in ng.nodes:
+                if node.type == 'OBJECT_INFO':
+                    input_obj = node.inputs[0].default_value
+                    if input_obj and input_obj.name not in EXCLUDED_OBJECT_NAMES:
+                        visit("objects", input_obj)
+            visit_tree(ng)
+
+    # Names taken now or by earlier entries of the plan
+    taken = {attr: {id_block.name for id_block in getattr(bpy.data, attr)} for attr in visited}
+    plan = {"renames": [], "collisions": []}
+    for attr, id_block in targets:
+        old_name = id_block.name
+        new_name = renamed(old_name, suffix, remove_suffix, skip_if_exists)
+        if new_name is None or new_name == old_name:
+            continue
+        if new_name in taken[attr]:
+            plan["collisions"].append((attr, old_name, new_name))
+            continue
+        taken[attr].add(new_name)
+        plan["renames"].append((attr, id_block, old_name, new_name))
+    return plan
+
+
+def apply_rename_plan(plan):
+    for _attr, id_block, _old_name, new_name in plan["renames"]:
+        id_block.name = new_name
+
+
+# === RENAME JOURNAL ===
+# Every applied plan is stored in a text datablock inside the .blend as a list
+# of {"collection", "suffix", "remove_suffix", "renames": {attr: [[old, new]]}}
+# so it can be reverted in a later session by touching only those datablocks.
+JOURNAL_TEXT_NAME = "Octane_Suffix_Journal.json"
+
+
+def read_rename_journal():
+    text = bpy.data.texts.get(JOURNAL_TEXT_NAME)
+    if text is None:
+        return []
+    try:
+        return json.loads(text.as_string() or "[]")
+    except ValueError:
+        log.error("❌ %s is not valid JSON, ignoring it.", JOURNAL_TEXT_NAME)
+        return []
+
+
+def write_rename_journal(entries):
+    text = bpy.data.texts.get(JOURNAL_TEXT_NAME)
+    if text is None:
+        text = bpy.data.texts.new(JOURNAL_TEXT_NAME)
+        text.use_fake_user = True
+    text.from_string(json.dumps(entries, separators=(",", ":")))
+
+
+def record_rename_plan(collection, suffix, remove_suffix, plan):
+    """Journal an applied plan. Call after apply_rename_plan.
+
+    The name each datablock actually ended up with is stored, since Blender
+    may truncate or de-duplicate the planned one.
+    """
+    renames = {}
+    for attr, id_block, old_name, _planned_name in plan["renames"]:
+        renames.setdefault(attr, []).append([old_name, id_block.name])
+    if not renames:
+        return
+    entries = read_rename_journal()
+    entries.append({
+        "collection": collection.name,
+        "suffix": suffix,
+        "remove_suffix": remove_suffix,
+        "renames": renames,
+    })
+    write_rename_journal(entries)
+
+
+def revert_rename_entry(entry):
+    """Undo one journal entry in reverse order.
+
+    Returns (reverted count, {attr: pairs that could not be reverted}), the
+    pairs kept in their journal order.
+    """
+    reverted = 0
+    remaining = {}
+    for attr, pairs in entry["renames"].items():
+        data = getattr(bpy.data, attr)
+        for old_name, new_name in reversed(pairs):
+            id_block = data.get(new_name)
+            if id_block is None or old_name in data:
+                log.warning("⚠️ Cannot revert %s '%s' → '%s'", attr, new_name, old_name)
+                remaining.setdefault(attr, []).insert(0, [old_name, new_name])
+                continue
+            id_block.name = old_name
+            reverted += 1
+    return reverted, remaining
+
+
+def format_rename_plan(plan):
+    lines = [f"{attr}: {old} → {new}" for attr, _id, old, new in plan["renames"]]
+    lines += [f"{attr}: {old} → {new} (skipped, name taken)" for attr, old, new in plan["collisions"]]
+    return lines
+
+
 class OBJECT_OT_apply_suffix_to_collection(bpy.types.Operator):
     bl_idname = "object.apply_suffix_to_collection"
     bl_label = "Apply or Remove Suffix"
     bl_description = "Apply or remove a suffix to all objects and assets in a collection"
     bl_options = {'REGISTER', 'UNDO'}
 
+    dry_run: bpy.props.BoolProperty(
+        name="Preview Only",
+        description="List the renames without applying them",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
     def execute(self, context):
         props = context.scene.suffix_manager_props
         collection = props.target_collection
-        suffix = props.suffix
-        remove_suffix = props.remove_suffix
-        skip_if_exists = props.skip_if_exists
-
-        excluded_object_names = {"GeoNodeTemplate"}
 
         if not collection:
             self.report({'ERROR'}, "No collection selected.")
             return {'CANCELLED'}
+        if not props.suffix:
+            self.report({'ERROR'}, "Suffix is empty.")
+            return {'CANCELLED'}
 
-        for obj in collection.all_objects:
-            if obj.name in excluded_object_names:
-                continue
+        plan = build_rename_plan(collection, props.suffix, props.remove_suffix, props.skip_if_exists)
+        counts = {}
+        for attr, _id, _old, _new in plan["renames"]:
+            counts[attr] = counts.get(attr, 0) + 1
+        summary = ", ".join(f"{count} {attr.replace('_', ' ')}" for attr, count in counts.items()) or "nothing"
+
+        if self.dry_run:
+            lines = format_rename_plan(plan)
+            for line in lines:
+                log.info(line)
+            if context.window:
+                self.show_preview(context, lines)
+            self.report({'INFO'}, f"Would rename {summary}; {len(plan['collisions'])} collision(s).")
+            return {'FINISHED'}
+
+        apply_rename_plan(plan)
+        record_rename_plan(collection, props.suffix, props.remove_suffix, plan)
+        for attr, old, new in plan["collisions"]:
+            log.info("Skipped %s '%s': '%s' already exists", attr, old, new)
+        self.report({'INFO'}, f"Renamed {summary}; skipped {len(plan['collisions'])} collision(s).")
+        return {'FINISHED'}
+
+    def show_preview(self, context, lines):
+        def draw(menu, _context):
+            for line in lines[:PREVIEW_LINES]:
+                menu.layout.label(text=line)
+            if len(lines) > PREVIEW_LINES:
+                menu.layout.label(text=f"… and {len(lines) - PREVIEW_LINES} more (see console)")
+            if not lines:
+                menu.layout.label(text="Nothing to rename.")
+
+        context.window_manager.popup_menu(draw, title="Rename Plan", icon='SORTALPHA')
+
+
+class OBJECT_OT_revert_last_suffix(bpy.types.Operator):
+    bl_idname = "object.revert_last_suffix"
+    bl_label = "Revert Last Suffix Operation"
+    bl_description = "Restore the names changed by the last journaled suffix operation"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        entries = read_rename_journal()
+        if not entries:
+            self.report({'WARNING'}, "No suffix operation to revert.")
+            return {'CANCELLED'}
 
-            if remove_suffix:
-                if obj.name.endswith(suffix):
-                    obj.name = obj.name[:-len(suffix)]
-            elif not skip_if_exists or not obj.name.endswith(suffix):
-                obj.name += suffix
-
-            for slot in obj.material_slots:
-                mat = slot.material
-                if not mat:
-                    continue
-
-                if remove_suffix:
-                    if mat.name.endswith(suffix):
-                        mat.name = mat.name[:-len(suffix)]
-                elif not skip_if_exists or not mat.name.endswith(suffix):
-                    if mat.name + suffix not in bpy.data.materials:
-                        mat.name += suffix
-
-                if mat.use_nodes:
-                    for node in mat.node_tree.nodes:
-                        if node.type == 'GROUP' and node.node_tree:
-                            ng = node.node_tree
-                            if remove_suffix:
-                                if ng.name.endswith(suffix):
-                                    ng.name = ng.name[:-len(suffix)]
-                            elif not skip_if_exists or not ng.name.endswith(suffix):
-                                if ng.name + suffix not in bpy.data.node_groups:
-                                    ng.name += suffix
-
-            for mod in obj.modifiers:
-                if mod.type == 'NODES' and mod.node_group:
-                    ng = mod.node_group
-                    if remove_suffix:
-                        if ng.name.endswith(suffix):
-                            ng.name = ng.name[:-len(suffix)]
-                    elif not skip_if_exists or not ng.name.endswith(suffix):
-                        if ng.name + suffix not in bpy.data.node_groups:
-                            ng.name += suffix
-
-            for mod in obj.modifiers:
-                if mod.type == 'NODES' and mod.node_group:
-                    for node in mod.node_group.nodes:
-                        if node.type == 'OBJECT_INFO':
-                            input_obj = node.inputs[0].default_value
-                            if not input_obj or input_obj.name in excluded_object_names:
-                                continue
-
-                            if remove_suffix:
-                                if input_obj.name.endswith(suffix):
-                                    input_obj.name = input_obj.name[:-len(suffix)]
-                            elif not skip_if_exists or not input_obj.name.endswith(suffix):
-                                if input_obj.name + suffix not in bpy.data.objects:
-                                    input_obj.name += suffix
+        entry = entries.pop()
+        reverted, remaining = revert_rename_entry(entry)
+        if remaining:
+            # Keep what could not be undone so a later revert can retry it
+            entry["renames"] = remaining
+            entries.append(entry)
+        write_rename_journal(entries)
 
+        action = "removal" if entry["remove_suffix"] else "addition"
+        skipped = sum(len(pairs) for pairs in remaining.values())
+        message = f"Reverted '{entry['suffix']}' {action} on {entry['collection']}: {reverted} renamed back"
+        if skipped:
+            self.report({'WARNING'}, f"{message}, {skipped} skipped and kept in the journal.")
+        else:
+            self.report({'INFO'}, f"{message}.")
         return {'FINISHED'}
 
 
@@ -126,12 +300,15 @@ class VIEW3D_PT_octane_toon_edge_suffix_manager(bpy.types.Panel):
         layout.prop(props, "suffix")
         layout.prop(props, "remove_suffix")
         layout.prop(props, "skip_if_exists")
+        layout.operator("object.apply_suffix_to_collection", text="Preview Renames", icon='VIEWZOOM').dry_run = True
         layout.operator("object.apply_suffix_to_collection")
+        layout.operator("object.revert_last_suffix", icon='LOOP_BACK')
 
 
 classes = (
     SuffixManagerProperties,
     OBJECT_OT_apply_suffix_to_collection,
+    OBJECT_OT_revert_last_suffix,
     VIEW3D_PT_octane_toon_edge_suffix_manager,
 )
 
@@ -15,9 +15,16 @@ SOURCE_SOCKET_NAME = "Tolerance Out (0-1)"
 TARGET_NODE_NAME = "Edge Tracer LG"
 TARGET_SOCKET_NAME = "Tolerance Angle"
 
+SCOPE_ITEMS = [
+    ('SELECTED', "Selected Objects", "Materials used by the selected meshes"),
+    ('COLLECTION', "Active Collection", "Materials used by meshes in the active collection"),
+    ('FILE', "Whole File", "Every local material in the file"),
+]
+
 def connect_nodes(mat):
+    """Link the tolerance output into the edge tracer. Returns True if a link was added."""
     if not mat.use_nodes or not mat.node_tree:
-        return
+        return False
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
     source = nodes.get(SOURCE_NODE_NAME)
@@ -27,44 +34,70 @@ def connect_nodes(mat):
         in_socket = target.inputs.get(TARGET_SOCKET_NAME)
         if out_socket and in_socket and not in_socket.is_linked:
             links.new(out_socket, in_socket)
+            return True
+    return False
 
 def disconnect_nodes(mat):
+    """Remove the links into the edge tracer's tolerance input. Returns True if any were removed."""
     if not mat.use_nodes or not mat.node_tree:
-        return
-    nodes = mat.node_tree.nodes
+        return False
     links = mat.node_tree.links
-    target = nodes.get(TARGET_NODE_NAME)
+    target = mat.node_tree.nodes.get(TARGET_NODE_NAME)
     if target:
         in_socket = target.inputs.get(TARGET_SOCKET_NAME)
         if in_socket and in_socket.is_linked:
-            for link in list(links):
-                if link.to_socket == in_socket:
-                    links.remove(link)
+            for link in list(in_socket.links):
+                links.remove(link)
+            return True
+    return False
+
+def collect_materials(context, scope):
+    """Unique editable materials for a scope, so shared materials are processed once."""
+    if scope == 'FILE':
+        return [mat for mat in bpy.data.materials if mat.library is None]
+
+    if scope == 'COLLECTION':
+        objects = context.view_layer.active_layer_collection.collection.all_objects
+    else:
+        objects = context.selected_objects
+
+    materials = []
+    seen = set()
+    for obj in objects:
+        if obj.type == 'MESH':
+            for slot in obj.material_slots:
+                mat = slot.material
+                if mat and mat not in seen and mat.library is None:
+                    seen.add(mat)
+                    materials.append(mat)
+    return materials
 
 class OT_ConnectEdgeNodes(bpy.types.Operator):
     bl_idname = "material.connect_edge_nodes"
     bl_label = "Set Global Tolerance (_Toon)"
     bl_description = "Connect Tolerance Group Node to Edge Tracer LG"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: bpy.props.EnumProperty(name="Scope", items=SCOPE_ITEMS, default='SELECTED')
 
     def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                for slot in obj.material_slots:
-                    if slot.material:
-                        connect_nodes(slot.material)
+        materials = collect_materials(context, self.scope)
+        changed = sum(1 for mat in materials if connect_nodes(mat))
+        self.report({'INFO'}, f"Global tolerance set on {changed} of {len(materials)} material(s).")
         return {'FINISHED'}
 
 class OT_DisconnectEdgeNodes(bpy.types.Operator):
     bl_idname = "material.disconnect_edge_nodes"
     bl_label = "Set Local Tolerance (_Toon)"
     bl_description = "Disconnect Tolerance Group Node from Edge Tracer LG"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: bpy.props.EnumProperty(name="Scope", items=SCOPE_ITEMS, default='SELECTED')
 
     def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                for slot in obj.material_slots:
-                    if slot.material:
-                        disconnect_nodes(slot.material)
+        materials = collect_materials(context, self.scope)
+        changed = sum(1 for mat in materials if disconnect_nodes(mat))
+        self.report({'INFO'}, f"Local tolerance set on {changed} of {len(materials)} material(s).")
         return {'FINISHED'}
 
 def draw_func(self, context):
@@ -73,6 +106,10 @@ def draw_func(self, context):
     layout.label(text="Edge Shader Tools:")
     layout.operator("material.connect_edge_nodes", icon='NODE')
     layout.operator("material.disconnect_edge_nodes", icon='CANCEL')
+    layout.operator("material.connect_edge_nodes", text="Set Global Tolerance (Active Collection)", icon='NODE').scope = 'COLLECTION'
+    layout.operator("material.disconnect_edge_nodes", text="Set Local Tolerance (Active Collection)", icon='CANCEL').scope = 'COLLECTION'
+    layout.operator("material.connect_edge_nodes", text="Set Global Tolerance (Whole File)", icon='NODE').scope = 'FILE'
+    layout.operator("material.disconnect_edge_nodes", text="Set Local Tolerance (Whole File)", icon='CANCEL').scope = 'FILE'
 
 def register():
     bpy.utils.register_class(OT_ConnectEdgeNodes)
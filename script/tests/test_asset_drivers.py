@@ -0,0 +1,80 @@
+"""Driver setup of the edge shader kit on an already configured file.
+
+    blender -b --factory-startup --python script/tests/test_asset_drivers.py
+
+Skipped outside Blender.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+def build_driven_template():
+    """GeoEdges collection with a GeoNodeTemplate using a GeoEdgesTemplate with a Thickness input."""
+    group = bpy.data.node_groups.new("GeoEdgesTemplate", 'GeometryNodeTree')
+    group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    group.interface.new_socket("Thickness", in_out='INPUT', socket_type='NodeSocketFloat')
+
+    collection = bpy.data.collections.new("GeoEdges")
+    bpy.context.scene.collection.children.link(collection)
+    obj = bpy.data.objects.new("GeoNodeTemplate", bpy.data.meshes.new("GeoNodeTemplate"))
+    collection.objects.link(obj)
+    mod = obj.modifiers.new("GeometryNodes", 'NODES')
+    mod.node_group = group
+    bpy.context.scene["Edge Thickness"] = 1.0
+    return obj
+
+
+@unittest.skipIf(bpy is None, "needs Blender")
+class EnsureOctaneEdgeAssetsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import octane_edge_shader_kit
+        cls.kit = octane_edge_shader_kit
+        cls.kit.register()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.kit.unregister()
+
+    def setUp(self):
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        self.kit.invalidate_driver_index()
+        self.geo_obj = build_driven_template()
+
+    def thickness_drivers(self):
+        return [fc for fc in self.geo_obj.animation_data.drivers if fc.data_path.endswith('["Input_1"]')]
+
+    def test_rerun_keeps_existing_driver(self):
+        self.kit.ensure_octane_edge_assets()
+        first = self.thickness_drivers()
+        self.assertEqual(len(first), 1)
+
+        # The template now has animation_data, which used to break the lookup
+        self.kit.ensure_octane_edge_assets()
+        second = self.thickness_drivers()
+        self.assertEqual(len(second), 1)
+        self.assertEqual(first[0].as_pointer(), second[0].as_pointer())
+
+    def test_has_scene_driver_on_id_path(self):
+        path = 'modifiers["GeometryNodes"]["Input_1"]'
+        self.assertFalse(self.kit.has_scene_driver(self.geo_obj, path, "Edge Thickness"))
+        self.geo_obj.modifiers["GeometryNodes"]["Input_1"] = 1.0
+        self.kit.apply_driver(self.geo_obj, path, "Edge Thickness")
+        self.assertTrue(self.kit.has_scene_driver(self.geo_obj, path, "Edge Thickness"))
+        self.assertFalse(self.kit.has_scene_driver(self.geo_obj, path, "Outline Thickness"))
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    if bpy is not None and bpy.app.background:
+        sys.exit(0 if result.wasSuccessful() else 1)
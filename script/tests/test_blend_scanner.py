@@ -0,0 +1,173 @@
+"""Name scan of .blend files without Blender.
+
+    python -m pytest script/tests/test_blend_scanner.py
+
+The fixtures are minimal .blend files written here: a header, a DNA1 block
+describing just enough of struct ID, a few ID blocks and ENDB.
+"""
+
+import gzip
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from octane_blend_scanner import LIB_EMBEDDED_DATA, BlendScanError, read_blend_id_names
+
+ID_NAME_SIZE = 66
+
+IDS = [
+    (b"GR", "GeoEdges", 0),
+    (b"OB", "GeoNodeTemplate", 0),
+    (b"OB", "Cube", 0),
+    (b"MA", "Edge Material", 0),
+    (b"NT", "GeoEdgesTemplate", 0),
+    # A material's node tree; owned by the material, not listed
+    (b"NT", "Shader Nodetree", LIB_EMBEDDED_DATA),
+]
+
+EXPECTED = {
+    "collections": ["GeoEdges"],
+    "objects": ["Cube", "GeoNodeTemplate"],
+    "materials": ["Edge Material"],
+    "node_groups": ["GeoEdgesTemplate"],
+}
+
+
+def sdna_block(endian):
+    """SDNA with struct ID { void *next, *prev; char name[66]; short flag; }."""
+    def strings(items):
+        data = b"".join(item.encode() + b"\x00" for item in items)
+        return data + b"\x00" * (-len(data) % 4)
+
+    names = ["*next", "*prev", f"name[{ID_NAME_SIZE}]", "flag"]
+    types = ["void", "char", "short", "ID"]
+    data = b"SDNA"
+    data += b"NAME" + struct.pack(endian + "i", len(names)) + strings(names)
+    data += b"TYPE" + struct.pack(endian + "i", len(types)) + strings(types)
+    lengths = struct.pack(endian + "4h", 0, 1, 2, 0)
+    data += b"TLEN" + lengths + b"\x00" * (-len(lengths) % 4)
+    data += b"STRC" + struct.pack(endian + "i", 1)
+    data += struct.pack(endian + "hh", 3, 4) + struct.pack(endian + "8h", 0, 0, 0, 1, 1, 2, 2, 3)
+    return data
+
+
+def id_block(code, name, flag, endian, pointer_size):
+    data = b"\x00" * (2 * pointer_size)
+    data += (code + name.encode()).ljust(ID_NAME_SIZE, b"\x00")
+    data += struct.pack(endian + "h", flag)
+    # Room for the rest of the datablock, past the prefix the scanner reads
+    return data + b"\x00" * 2000
+
+
+def write_blend(path, endian="<", pointer_size=8, large_bhead=False, ids=IDS, with_sdna=True, opener=open):
+    if large_bhead:
+        header = b"BLENDER17-01" + (b"v" if endian == "<" else b"V") + b"0500"
+        bhead = struct.Struct(endian + "4siQqq")
+
+        def block(code, data):
+            return bhead.pack(code, 0, 1, len(data), 1) + data
+    else:
+        header = b"BLENDER" + (b"-" if pointer_size == 8 else b"_") + (b"v" if endian == "<" else b"V") + b"300"
+        bhead = struct.Struct(endian + ("4siQii" if pointer_size == 8 else "4siIii"))
+
+        def block(code, data):
+            return bhead.pack(code, len(data), 1, 0, 1) + data
+
+    content = header
+    for code, name, flag in ids:
+        content += block(code + b"\x00\x00", id_block(code, name, flag, endian, pointer_size))
+    if with_sdna:
+        content += block(b"DNA1", sdna_block(endian))
+    content += block(b"ENDB", b"")
+    with opener(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def zstd_opener():
+    try:
+        from compression import zstd
+        return zstd.open
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+
+    def open_zstd(path, mode):
+        return zstandard.ZstdCompressor().stream_writer(open(path, mode), closefd=True)
+    return open_zstd
+
+
+@pytest.mark.parametrize("endian", ["<", ">"])
+@pytest.mark.parametrize("pointer_size", [4, 8])
+def test_plain(tmp_path, endian, pointer_size):
+    path = write_blend(tmp_path / "plain.blend", endian=endian, pointer_size=pointer_size)
+    assert read_blend_id_names(path) == EXPECTED
+
+
+def test_gzip(tmp_path):
+    path = write_blend(tmp_path / "gzip.blend", opener=gzip.open)
+    assert read_blend_id_names(path) == EXPECTED
+
+
+def test_zstd(tmp_path):
+    opener = zstd_opener()
+    if opener is None:
+        pytest.skip("needs compression.zstd or zstandard")
+    path = write_blend(tmp_path / "zstd.blend", opener=opener)
+    assert read_blend_id_names(path) == EXPECTED
+
+
+@pytest.mark.parametrize("endian", ["<", ">"])
+def test_large_bhead(tmp_path, endian):
+    path = write_blend(tmp_path / "v50.blend", endian=endian, large_bhead=True)
+    assert read_blend_id_names(path) == EXPECTED
+
+
+def test_embedded_node_trees_excluded(tmp_path):
+    path = write_blend(tmp_path / "embedded.blend", ids=[(b"NT", "Shader Nodetree", LIB_EMBEDDED_DATA)])
+    assert read_blend_id_names(path)["node_groups"] == []
+
+
+@pytest.mark.parametrize("cut", [8, 40, 200, -10])
+def test_truncated(tmp_path, cut):
+    path = write_blend(tmp_path / "full.blend")
+    data = path.read_bytes()
+    truncated = tmp_path / "truncated.blend"
+    truncated.write_bytes(data[:cut])
+    with pytest.raises(BlendScanError):
+        read_blend_id_names(truncated)
+
+
+def test_truncated_gzip(tmp_path):
+    data = gzip.compress(write_blend(tmp_path / "full.blend").read_bytes())
+    path = tmp_path / "truncated.blend"
+    path.write_bytes(data[:len(data) // 2])
+    with pytest.raises(BlendScanError):
+        read_blend_id_names(path)
+
+
+def test_not_a_blend(tmp_path):
+    path = tmp_path / "text.blend"
+    path.write_bytes(b"This is not a blend file at all")
+    with pytest.raises(BlendScanError):
+        read_blend_id_names(path)
+
+
+def test_unsupported_header(tmp_path):
+    path = tmp_path / "header.blend"
+    path.write_bytes(b"BLENDER*x300" + b"\x00" * 64)
+    with pytest.raises(BlendScanError):
+        read_blend_id_names(path)
+
+
+def test_missing_sdna(tmp_path):
+    path = write_blend(tmp_path / "nosdna.blend", with_sdna=False)
+    with pytest.raises(BlendScanError):
+        read_blend_id_names(path)